@@ -115,6 +115,10 @@ let
     set -euo pipefail
     exec ${supervisorPython}/bin/python "$HOME/.hermes/scripts/axis_supervisor/cycle.py" "$@"
   '';
+  supervisorDaemon = pkgs.writeShellScriptBin "axis-development-supervisor-daemon" ''
+    set -euo pipefail
+    exec ${supervisorPython}/bin/python "$HOME/.hermes/scripts/axis_supervisor/daemon.py" "$@"
+  '';
   supervisorCommand = pkgs.writeShellScriptBin "axis-development-supervisor-command" ''
     set -euo pipefail
     exec ${supervisorPython}/bin/python "$HOME/.hermes/scripts/axis-development-supervisor-command.py" "$@"
@@ -205,6 +209,7 @@ in
         supervisorHealth
         supervisorCronCtl
         supervisorCycle
+        supervisorDaemon
         supervisorCommand
         supervisorReview
       ];
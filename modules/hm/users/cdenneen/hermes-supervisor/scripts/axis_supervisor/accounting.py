@@ -1,12 +1,14 @@
 import fcntl
 import json
 import os
+import shutil
 import time
 import uuid
+from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from .schema_registry import read_record, validate_record
 
@@ -27,14 +29,33 @@ class Attempt:
 
 
 class AccountingLedger:
+    """Append-only model-attempt ledger rotated into UTC daily segments.
+
+    A sidecar index keeps per-day and per-(assignment, role) started counts so
+    budget checks never rescan history. The index is only a cache: it is
+    rebuilt from the segments (and the pre-rotation ledger) whenever it is
+    missing, unreadable or behind the newest segment.
+    """
+
+    INDEX_VERSION = 1
+
     def __init__(self, root: Path):
         self.root = root
-        self.path = root / "accounting" / "model-attempts.jsonl"
+        accounting = root / "accounting"
+        self.path = accounting / "model-attempts.jsonl"
+        self.segments = accounting / "model-attempts"
+        self.index_path = accounting / "model-attempts.index.json"
+        self.lock_path = accounting / "model-attempts.lock"
+        self.worker_cycles = accounting / "worker-cycles"
+        self.worker_cycles_lock_path = accounting / "worker-cycles.lock"
 
     @staticmethod
-    def _day(epoch: int) -> object:
+    def _day(epoch: int) -> date:
         return datetime.fromtimestamp(epoch, timezone.utc).date()
 
+    def segment_path(self, epoch: int) -> Path:
+        return self.segments / f"{self._day(epoch).isoformat()}.jsonl"
+
     def _records(self, handle) -> list[dict[str, Any]]:
         handle.seek(0)
         records = []
@@ -59,29 +80,108 @@ class AccountingLedger:
     def _started(records: list[dict[str, Any]]) -> list[dict[str, Any]]:
         return [record for record in records if record["result"] == "started"]
 
+    def _has_history(self) -> bool:
+        return self.path.exists() or self.segments.is_dir()
+
+    @contextmanager
+    def _locked(self, lock_path: Path | None = None) -> Iterator[None]:
+        lock_path = lock_path or self.lock_path
+        lock_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with lock_path.open("a", encoding="utf-8") as handle:
+            os.chmod(lock_path, 0o600)
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def _newest_segment(self) -> Path | None:
+        if not self.segments.is_dir():
+            return None
+        names = sorted(path.name for path in self.segments.glob("*.jsonl"))
+        return self.segments / names[-1] if names else None
+
+    def _index_is_current(self, index: dict[str, Any]) -> bool:
+        # A malformed index is treated exactly like a missing one.
+        if index.get("version") != self.INDEX_VERSION or not all(
+            isinstance(index.get(field), dict)
+            for field in ("started_by_day", "started_by_assignment")
+        ):
+            return False
+        newest = self._newest_segment()
+        tail = index.get("tail")
+        if newest is None:
+            return tail is None
+        return bool(
+            isinstance(tail, dict)
+            and tail.get("segment") == newest.name
+            and tail.get("size") == newest.stat().st_size
+        )
+
+    def rebuild_index(self) -> dict[str, Any]:
+        """Recount every segment; callers must hold the ledger lock."""
+        index: dict[str, Any] = {
+            "version": self.INDEX_VERSION,
+            "started_by_day": {},
+            "started_by_assignment": {},
+            "tail": None,
+        }
+        sources = [self.path] if self.path.exists() else []
+        if self.segments.is_dir():
+            sources.extend(sorted(self.segments.glob("*.jsonl")))
+        for path in sources:
+            with path.open("r", encoding="utf-8") as handle:
+                records = self._records(handle)
+            for record in self._started(records):
+                self._count_started(index, record)
+            if path != self.path:
+                index["tail"] = {"segment": path.name, "size": path.stat().st_size}
+        self._write_index(index)
+        return index
+
+    def _index(self) -> dict[str, Any]:
+        try:
+            index = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            index = None
+        if isinstance(index, dict) and self._index_is_current(index):
+            return index
+        return self.rebuild_index()
+
+    def _count_started(self, index: dict[str, Any], record: dict[str, Any]) -> None:
+        day = self._day(int(record["recorded_at_epoch"])).isoformat()
+        index["started_by_day"][day] = index["started_by_day"].get(day, 0) + 1
+        roles = index["started_by_assignment"].setdefault(record["assignment"], {})
+        roles[record["role"]] = roles.get(record["role"], 0) + 1
+
+    def _write_index(self, index: dict[str, Any]) -> None:
+        self.index_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp = self.index_path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(index, sort_keys=True) + "\n", encoding="utf-8")
+        tmp.chmod(0o600)
+        tmp.replace(self.index_path)
+
     def model_attempts_today(self, now: int | None = None) -> int:
-        if not self.path.exists():
+        if not self._has_history():
             return 0
         current = int(now or time.time())
-        with self.path.open("r", encoding="utf-8") as handle:
-            records = self._records(handle)
-        return sum(
-            self._day(int(record["recorded_at_epoch"])) == self._day(current)
-            for record in self._started(records)
-        )
+        with self._locked():
+            index = self._index()
+        return int(index["started_by_day"].get(self._day(current).isoformat(), 0))
 
     def model_attempts_for_assignment(self, assignment: str) -> int:
-        if not self.path.exists():
+        if not self._has_history():
             return 0
-        with self.path.open("r", encoding="utf-8") as handle:
-            records = self._records(handle)
-        return sum(
-            record["assignment"] == assignment for record in self._started(records)
-        )
+        with self._locked():
+            index = self._index()
+        return sum((index["started_by_assignment"].get(assignment) or {}).values())
 
-    def worker_cycles_today(self, now: int | None = None) -> int:
-        current = int(now or time.time())
-        count = 0
+    def _worker_cycles_path(self, epoch: int) -> Path:
+        return self.worker_cycles / f"{self._day(epoch).isoformat()}.json"
+
+    def rebuild_worker_cycles(self) -> None:
+        """Derive the per-day run manifests from run records; hold the lock."""
+        days: dict[str, set[str]] = {}
         for path in (self.root / "runs").glob("*.json"):
             try:
                 record = read_record(
@@ -94,9 +194,61 @@ class AccountingLedger:
                     continue
             if record.get("status") == "preflight-test":
                 continue
-            if self._day(int(record.get("started_at_epoch") or 0)) == self._day(current):
-                count += 1
-        return count
+            day = self._day(int(record.get("started_at_epoch") or 0)).isoformat()
+            days.setdefault(day, set()).add(path.stem)
+        staging = self.worker_cycles.with_name(
+            f"{self.worker_cycles.name}.{uuid.uuid4().hex}.tmp"
+        )
+        staging.mkdir(mode=0o700, parents=True)
+        for day, runs in days.items():
+            self._write_worker_cycles(staging / f"{day}.json", runs)
+        if self.worker_cycles.exists():
+            shutil.rmtree(self.worker_cycles)
+        staging.replace(self.worker_cycles)
+
+    @staticmethod
+    def _write_worker_cycles(path: Path, runs: set[str]) -> None:
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps({"runs": sorted(runs)}) + "\n", encoding="utf-8")
+        tmp.chmod(0o600)
+        tmp.replace(path)
+
+    def _worker_cycle_runs(self, epoch: int) -> set[str] | None:
+        try:
+            value = json.loads(
+                self._worker_cycles_path(epoch).read_text(encoding="utf-8")
+            )
+        except FileNotFoundError:
+            return set() if self.worker_cycles.is_dir() else None
+        except (OSError, json.JSONDecodeError):
+            return None
+        runs = value.get("runs") if isinstance(value, dict) else None
+        if not isinstance(runs, list) or not all(isinstance(run, str) for run in runs):
+            return None
+        return set(runs)
+
+    def worker_cycles_today(self, now: int | None = None) -> int:
+        current = int(now or time.time())
+        runs = self._worker_cycle_runs(current)
+        if runs is None:
+            with self._locked(self.worker_cycles_lock_path):
+                runs = self._worker_cycle_runs(current)
+                if runs is None:
+                    self.rebuild_worker_cycles()
+                    runs = self._worker_cycle_runs(current) or set()
+        return len(runs)
+
+    def record_worker_cycle(self, run_id: str, started_at_epoch: int) -> None:
+        """Add a run to its start day's manifest; repeated calls are no-ops."""
+        with self._locked(self.worker_cycles_lock_path):
+            runs = self._worker_cycle_runs(started_at_epoch)
+            if runs is None:
+                self.rebuild_worker_cycles()
+                runs = self._worker_cycle_runs(started_at_epoch) or set()
+            if run_id not in runs:
+                self._write_worker_cycles(
+                    self._worker_cycles_path(started_at_epoch), runs | {run_id}
+                )
 
     def start(
         self,
@@ -109,22 +261,15 @@ class AccountingLedger:
         limit: int,
         prompt_digest: str | None = None,
     ) -> Attempt:
-        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
         now = int(time.time())
-        with self.path.open("a+", encoding="utf-8") as handle:
-            os.chmod(self.path, 0o600)
-            fcntl.flock(handle, fcntl.LOCK_EX)
-            records = self._records(handle)
-            used = sum(
-                self._day(int(record["recorded_at_epoch"])) == self._day(now)
-                for record in self._started(records)
-            )
+        with self._locked():
+            index = self._index()
+            used = index["started_by_day"].get(self._day(now).isoformat(), 0)
             if used >= limit:
                 raise RuntimeError(f"daily model call limit reached: {used}/{limit}")
-            attempt_number = 1 + sum(
-                record["assignment"] == assignment and record["role"] == role
-                for record in self._started(records)
-            )
+            attempt_number = 1 + (
+                index["started_by_assignment"].get(assignment) or {}
+            ).get(role, 0)
             attempt = Attempt(
                 attempt_id=uuid.uuid4().hex,
                 role=role,
@@ -135,8 +280,7 @@ class AccountingLedger:
                 attempt=attempt_number,
                 prompt_digest=prompt_digest,
             )
-            self._append(handle, attempt, "started", now)
-            fcntl.flock(handle, fcntl.LOCK_UN)
+            self._append(index, attempt, "started", now)
         return attempt
 
     def finish(
@@ -149,14 +293,13 @@ class AccountingLedger:
     ) -> None:
         if result not in {"succeeded", "failed"}:
             raise ValueError(f"invalid attempt result: {result}")
-        with self.path.open("a", encoding="utf-8") as handle:
-            fcntl.flock(handle, fcntl.LOCK_EX)
-            self._append(handle, attempt, result, int(time.time()), usage, error)
-            fcntl.flock(handle, fcntl.LOCK_UN)
+        with self._locked():
+            index = self._index()
+            self._append(index, attempt, result, int(time.time()), usage, error)
 
-    @staticmethod
     def _append(
-        handle,
+        self,
+        index: dict[str, Any],
         attempt: Attempt,
         result: str,
         now: int,
@@ -186,7 +329,15 @@ class AccountingLedger:
             record,
             ATTEMPT_SCHEMA_ID,
         )
-        handle.seek(0, os.SEEK_END)
-        handle.write(json.dumps(record, sort_keys=True) + "\n")
-        handle.flush()
-        os.fsync(handle.fileno())
+        segment = self.segment_path(now)
+        segment.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with segment.open("a", encoding="utf-8") as handle:
+            os.chmod(segment, 0o600)
+            handle.write(json.dumps(record, sort_keys=True) + "\n")
+            handle.flush()
+            os.fsync(handle.fileno())
+            size = handle.tell()
+        if result == "started":
+            self._count_started(index, record)
+        index["tail"] = {"segment": segment.name, "size": size}
+        self._write_index(index)
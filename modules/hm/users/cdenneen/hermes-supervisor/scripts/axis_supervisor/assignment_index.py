@@ -0,0 +1,213 @@
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from .lifecycle import TERMINAL_STATES, is_terminal, lifecycle_state
+from .models import validate_assignment
+from .schema_registry import schema_digest
+from .state_store import write_cache_atomic
+
+ASSIGNMENT_SCHEMA = "axis.external-development-supervisor.assignment"
+INDEX_VERSION = 1
+ARCHIVE_AFTER_SECONDS = (
+    int(os.environ.get("AXIS_SUPERVISOR_ASSIGNMENT_ARCHIVE_DAYS", "14")) * 86_400
+)
+# Waiting, blocked and recovery-required records are terminal for scheduling but
+# are still revisited by operators and recovery, so they stay in the hot set.
+ARCHIVABLE_STATES = TERMINAL_STATES - {"waiting", "blocked", "recovery-required"}
+
+
+def _signature(stat: os.stat_result) -> list[int]:
+    return [stat.st_mtime_ns, stat.st_size, stat.st_ino]
+
+
+def assignment_paths(root: Path, *, archived: bool = True) -> list[Path]:
+    """Every assignment record path, including archived history by default."""
+    assignments = root / "assignments"
+    paths = sorted(assignments.glob("*.json"))
+    if archived:
+        paths += sorted((assignments / "archive").glob("*.json"))
+    return paths
+
+
+class AssignmentIndex:
+    """Stat-validated manifest of assignment lifecycle state and lease expiry.
+
+    ``assignment-index.json`` maps each ``assignments/*.json`` file to its
+    lifecycle state keyed by mtime, size and inode, so a listing only re-reads
+    records that changed since the last refresh plus the non-terminal records
+    callers actually need.  Writers keep using ``write_record``; the next
+    refresh notices their stat change.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.assignments = root / "assignments"
+        self.archive = self.assignments / "archive"
+        self.leases = root / "leases"
+        self.path = root / "assignment-index.json"
+
+    def _load(self, digest: str) -> dict[str, Any]:
+        try:
+            value = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            value = None
+        if (
+            not isinstance(value, dict)
+            or value.get("version") != INDEX_VERSION
+            or value.get("schema_digest") != digest
+            or not isinstance(value.get("assignments"), dict)
+        ):
+            return {"assignments": {}}
+        return value
+
+    def _save(self, value: dict[str, Any]) -> None:
+        # The manifest is a derived cache: a failed write only costs a re-read.
+        write_cache_atomic(self.path, json.dumps(value, sort_keys=True) + "\n")
+
+    def _entry(self, path: Path, stat: os.stat_result) -> dict[str, Any]:
+        entry: dict[str, Any] = {"signature": _signature(stat)}
+        try:
+            value = validate_assignment(
+                json.loads(path.read_text(encoding="utf-8")), self.root
+            )
+            state = lifecycle_state(value)
+        except Exception as exc:  # noqa: BLE001 - invalid records stay visible
+            entry.update(
+                assignment_id=None,
+                lifecycle_state=None,
+                terminal=False,
+                error=f"{type(exc).__name__}: {exc}",
+            )
+            return entry
+        entry.update(
+            assignment_id=value.get("assignment_id"),
+            lifecycle_state=state,
+            terminal=state in TERMINAL_STATES,
+        )
+        return entry
+
+    def _lease_expiries(self) -> dict[str, dict[str, Any]]:
+        leases = {}
+        try:
+            entries = list(os.scandir(self.leases))
+        except FileNotFoundError:
+            return leases
+        for entry in entries:
+            if entry.name.startswith(("stale-", ".")) or not entry.is_dir():
+                continue
+            path = Path(entry.path) / "lease.json"
+            try:
+                expires = int(
+                    json.loads(path.read_text(encoding="utf-8")).get(
+                        "expires_at_epoch", 0
+                    )
+                )
+            except (OSError, ValueError, AttributeError):
+                expires = None
+            leases[entry.name] = {"expires_at_epoch": expires, "path": str(path)}
+        return leases
+
+    def refresh(self) -> dict[str, Any]:
+        digest = schema_digest(ASSIGNMENT_SCHEMA, self.assignments)
+        previous = self._load(digest)["assignments"]
+        entries = {}
+        try:
+            listing = list(os.scandir(self.assignments))
+        except FileNotFoundError:
+            listing = []
+        for item in listing:
+            if not item.name.endswith(".json") or not item.is_file():
+                continue
+            try:
+                stat = item.stat()
+            except FileNotFoundError:
+                continue
+            known = previous.get(item.name)
+            if known and known.get("signature") == _signature(stat):
+                entries[item.name] = known
+            else:
+                entries[item.name] = self._entry(Path(item.path), stat)
+        index = {
+            "version": INDEX_VERSION,
+            "schema_digest": digest,
+            "assignments": entries,
+            "leases": self._lease_expiries(),
+        }
+        if entries != previous or not self.path.exists():
+            self._save(index)
+        return index
+
+    def active_records(
+        self, errors: list[str] | None = None
+    ) -> list[tuple[Path, dict]]:
+        """Re-read and validate every record the index does not know is terminal.
+
+        Invalid records raise unless ``errors`` is given, matching the directory
+        scans this replaces.
+        """
+        values = []
+        for name, entry in sorted(self.refresh()["assignments"].items()):
+            if entry.get("terminal"):
+                continue
+            path = self.assignments / name
+            try:
+                value = validate_assignment(
+                    json.loads(path.read_text(encoding="utf-8")), self.root
+                )
+            except FileNotFoundError:
+                continue
+            except Exception as exc:  # noqa: BLE001 - reported or re-raised
+                if errors is None:
+                    raise
+                errors.append(f"invalid assignment record {name}: {exc}")
+                continue
+            if not is_terminal(value):
+                values.append((path, value))
+        return values
+
+    def active(self, errors: list[str] | None = None) -> list[dict]:
+        return [value for _path, value in self.active_records(errors)]
+
+    def restore(self, assignment_id: str) -> bool:
+        """Move an archived record back so by-id lookups see it again."""
+        hot = self.assignments / f"{assignment_id}.json"
+        archived = self.archive / f"{assignment_id}.json"
+        if hot.exists() or not archived.exists():
+            return False
+        archived.replace(hot)
+        return True
+
+    def archive_terminal(self, now: int | None = None) -> list[str]:
+        """Archive settled terminal records; the caller must pass the mutation gate.
+
+        A record is archived once its lifecycle state is final, it has not been
+        written for ``ARCHIVE_AFTER_SECONDS`` and no live lease names it.
+        """
+        now = int(time.time()) if now is None else now
+        cutoff_ns = (now - ARCHIVE_AFTER_SECONDS) * 1_000_000_000
+        index = self.refresh()
+        archived = []
+        for name, entry in sorted(index["assignments"].items()):
+            if (
+                entry.get("lifecycle_state") not in ARCHIVABLE_STATES
+                or entry["signature"][0] > cutoff_ns
+                or name.removesuffix(".json") in index["leases"]
+            ):
+                continue
+            path = self.assignments / name
+            try:
+                if _signature(path.stat()) != entry["signature"]:
+                    continue
+                self.archive.mkdir(mode=0o700, parents=True, exist_ok=True)
+                path.replace(self.archive / name)
+            except FileNotFoundError:
+                continue
+            archived.append(name.removesuffix(".json"))
+        if archived:
+            for assignment_id in archived:
+                index["assignments"].pop(f"{assignment_id}.json", None)
+            self._save(index)
+        return archived
@@ -1,6 +1,10 @@
 import hashlib
 import json
+import os
+import shlex
 import subprocess
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -9,6 +13,27 @@ from .observability import record_event
 from .schema_registry import RecordError, read_record, write_record
 
 SCHEMA = "axis.external-development-supervisor.capability-convergence"
+# One multiplexed connection per runtime host, kept open across rebuilds.
+SSH_CONTROL_PATH = os.environ.get(
+    "AXIS_SUPERVISOR_SSH_CONTROL_PATH",
+    str(Path.home() / ".ssh" / "axis-supervisor-%C"),
+)
+SSH_CONTROL_PERSIST = os.environ.get("AXIS_SUPERVISOR_SSH_CONTROL_PERSIST", "300")
+
+
+def _ssh_options() -> list[str]:
+    return [
+        "-o",
+        "BatchMode=yes",
+        "-o",
+        "ConnectTimeout=10",
+        "-o",
+        "ControlMaster=auto",
+        "-o",
+        f"ControlPath={SSH_CONTROL_PATH}",
+        "-o",
+        f"ControlPersist={SSH_CONTROL_PERSIST}",
+    ]
 
 
 class CapabilityConvergenceProjector:
@@ -28,36 +53,19 @@ class CapabilityConvergenceProjector:
     def _identity(runtime: dict) -> tuple[dict | None, str | None]:
         path = str(runtime["identity_path"])
         try:
-            if runtime["host"] == "local":
-                try:
-                    return json.loads(Path(path).read_text(encoding="utf-8")), None
-                except (OSError, PermissionError):
-                    pass
-                completed = subprocess.run(
-                    ["sudo", "-n", "cat", path],
-                    text=True,
-                    capture_output=True,
-                    timeout=10,
-                )
-                if completed.returncode != 0:
-                    return None, "identity-missing"
-                return json.loads(completed.stdout), None
-            output = subprocess.check_output(
-                [
-                    "ssh",
-                    "-o",
-                    "BatchMode=yes",
-                    "-o",
-                    "ConnectTimeout=10",
-                    runtime["host"],
-                    f"if test -r {path}; then cat {path}; else echo __IDENTITY_MISSING__; fi",
-                ],
+            try:
+                return json.loads(Path(path).read_text(encoding="utf-8")), None
+            except (OSError, PermissionError):
+                pass
+            completed = subprocess.run(
+                ["sudo", "-n", "cat", path],
                 text=True,
-                timeout=20,
+                capture_output=True,
+                timeout=10,
             )
-            if output.strip() == "__IDENTITY_MISSING__":
+            if completed.returncode != 0:
                 return None, "identity-missing"
-            return json.loads(output), None
+            return json.loads(completed.stdout), None
         except Exception as exc:
             return None, f"{type(exc).__name__}: {exc}"
 
@@ -67,39 +75,205 @@ class CapabilityConvergenceProjector:
         command = str(runtime.get("required_command") or "")
         if not command and not required_path:
             return True
-        if runtime["host"] == "local":
-            if required_path:
-                return Path(required_path).exists()
-            return (
-                subprocess.run(
-                    ["sh", "-c", f"command -v {command}"],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    check=False,
-                ).returncode
-                == 0
-            )
+        if required_path:
+            return Path(required_path).exists()
         return (
             subprocess.run(
-                [
-                    "ssh",
-                    "-o",
-                    "BatchMode=yes",
-                    "-o",
-                    "ConnectTimeout=10",
-                    runtime["host"],
-                    f"test -e {json.dumps(required_path)}"
-                    if required_path
-                    else f"command -v {command}",
-                ],
+                ["sh", "-c", f"command -v {command}"],
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
                 check=False,
-                timeout=20,
             ).returncode
             == 0
         )
 
+    @staticmethod
+    def _remote_check(runtime: dict) -> str | None:
+        required_path = str(runtime.get("required_path") or "")
+        command = str(runtime.get("required_command") or "")
+        if required_path:
+            return f"test -e {shlex.quote(required_path)}"
+        if command:
+            return f"command -v {shlex.quote(command)}"
+        return None
+
+    def _probe_remote(self, host: str, runtimes: list[tuple[str, dict]]) -> dict:
+        """Read every identity and run every check for ``host`` in one session."""
+        marker = f"__AXIS_PROBE_{uuid.uuid4().hex}__"
+        script = []
+        for index, (_name, runtime) in enumerate(runtimes):
+            path = shlex.quote(str(runtime["identity_path"]))
+            check = self._remote_check(runtime) or "true"
+            script += [
+                f"echo {marker} {index} identity",
+                f"if test -r {path}; then cat {path}; "
+                "else echo __IDENTITY_MISSING__; fi",
+                "echo",
+                f"{check} >/dev/null 2>&1; echo {marker} {index} available $?",
+            ]
+        Path(SSH_CONTROL_PATH).parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        try:
+            output = subprocess.check_output(
+                ["ssh", *_ssh_options(), host, "; ".join(script)],
+                text=True,
+                timeout=20 + 5 * len(runtimes),
+            )
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+            return {
+                name: (None, error, self._remote_check(runtime) is None)
+                for name, runtime in runtimes
+            }
+        identities: dict[int, list[str]] = {}
+        available: dict[int, bool] = {}
+        current: list[str] | None = None
+        for line in output.splitlines():
+            if line.startswith(f"{marker} "):
+                _marker, index, kind, *status = line.split(" ")
+                if kind == "identity":
+                    current = identities.setdefault(int(index), [])
+                else:
+                    available[int(index)] = status == ["0"]
+                    current = None
+            elif current is not None:
+                current.append(line)
+        probes = {}
+        for index, (name, _runtime) in enumerate(runtimes):
+            text = "\n".join(identities.get(index, [])).strip()
+            identity, error = None, None
+            if index not in identities:
+                error = "probe-output-incomplete"
+            elif text == "__IDENTITY_MISSING__":
+                error = "identity-missing"
+            else:
+                try:
+                    identity = json.loads(text)
+                except Exception as exc:
+                    error = f"{type(exc).__name__}: {exc}"
+            probes[name] = (identity, error, available.get(index, False))
+        return probes
+
+    def _probe_local(self, runtimes: list[tuple[str, dict]]) -> dict:
+        return {
+            name: (*self._identity(runtime), self._required_command_available(runtime))
+            for name, runtime in runtimes
+        }
+
+    def _probe(self, runtimes: dict) -> dict[str, tuple[dict | None, str | None, bool]]:
+        """Probe runtimes grouped by host, with the hosts probed in parallel."""
+        by_host: dict[str, list[tuple[str, dict]]] = {}
+        for name, runtime in runtimes.items():
+            by_host.setdefault(str(runtime["host"]), []).append((name, runtime))
+        if not by_host:
+            return {}
+        probes = {}
+        with ThreadPoolExecutor(
+            max_workers=len(by_host), thread_name_prefix="axis-probe"
+        ) as pool:
+            futures = [
+                pool.submit(self._probe_local, values)
+                if host == "local"
+                else pool.submit(self._probe_remote, host, values)
+                for host, values in by_host.items()
+            ]
+            for future in futures:
+                probes.update(future.result())
+        return probes
+
+    def _capability_revisions(
+        self, repository: Path, capabilities: dict, default: str
+    ) -> dict[str, str]:
+        """Latest commit touching each capability's paths, from one history walk.
+
+        The walk lists every commit from ``HEAD`` with its changed files and
+        no pathspec, so up to the first merge it is the linear first-parent
+        chain and its answers equal ``git log -1 -- <paths>``.  Past a merge,
+        path-limited history simplification can pick a different parent, so
+        capabilities still unresolved there, and those whose paths carry
+        pathspec magic, run that query instead, in parallel.
+        """
+        revisions = {}
+        pending = {}
+        fallback = []
+        for name, definition in capabilities.items():
+            paths = definition.get("paths") or []
+            if not paths:
+                revisions[name] = default
+            elif any(
+                set(path) & set("*?[")
+                or path.startswith((":", "./"))
+                or path.rstrip("/") in {"", "."}
+                for path in paths
+            ):
+                fallback.append(name)
+            else:
+                pending[name] = [path.rstrip("/") for path in paths]
+        if pending:
+            process = subprocess.Popen(
+                [
+                    "git",
+                    "-c",
+                    "core.quotePath=false",
+                    "log",
+                    "--no-renames",
+                    "--name-only",
+                    "--format=%x00%H %P",
+                ],
+                cwd=repository,
+                stdout=subprocess.PIPE,
+                text=True,
+            )
+            finished = False
+            try:
+                commit = None
+                for line in process.stdout or ():
+                    line = line.rstrip("\n")
+                    if line.startswith("\0"):
+                        commit, *parents = line[1:].split(" ")
+                        if len(parents) > 1:
+                            break
+                    elif line and commit:
+                        for name, paths in list(pending.items()):
+                            if any(
+                                line == path or line.startswith(path + "/")
+                                for path in paths
+                            ):
+                                revisions[name] = commit
+                                del pending[name]
+                        if not pending:
+                            break
+                else:
+                    finished = True
+            finally:
+                if not finished:
+                    process.kill()
+                returncode = process.wait(timeout=120)
+            if finished:
+                if returncode != 0:
+                    raise subprocess.CalledProcessError(returncode, process.args)
+                # The whole history was walked: these paths were never changed.
+                revisions.update({name: "" for name in pending})
+            else:
+                fallback += pending
+        if fallback:
+            with ThreadPoolExecutor(
+                max_workers=min(8, len(fallback)), thread_name_prefix="axis-revision"
+            ) as pool:
+                queries = {
+                    name: pool.submit(
+                        self._run,
+                        repository,
+                        "log",
+                        "-1",
+                        "--format=%H",
+                        "--",
+                        *capabilities[name]["paths"],
+                    )
+                    for name in fallback
+                }
+            revisions.update({name: query.result() for name, query in queries.items()})
+        return revisions
+
     def build(self, repository_convergence: dict) -> dict:
         matrix = json.loads(self.matrix_path.read_text(encoding="utf-8"))
         repository = Path(matrix["repository_path"])
@@ -116,13 +290,12 @@ class CapabilityConvergenceProjector:
         capabilities = []
         expected_by_capability = {}
         fingerprint_by_capability = {}
+        revisions = self._capability_revisions(
+            repository, matrix["capabilities"], expected_repository_revision
+        )
         for name, definition in matrix["capabilities"].items():
             paths = definition.get("paths") or []
-            revision = (
-                self._run(repository, "log", "-1", "--format=%H", "--", *paths)
-                if paths
-                else expected_repository_revision
-            )
+            revision = revisions[name]
             expected_by_capability[name] = revision
             fingerprint_by_capability[name] = (
                 "sha256:"
@@ -150,12 +323,13 @@ class CapabilityConvergenceProjector:
         runtime_records = []
         assignments = []
         blocked_capabilities: set[str] = set()
+        probes = self._probe(matrix["runtimes"])
+        contained_by_pair: dict[tuple[str, str], bool] = {}
         for runtime_name, runtime in sorted(
             matrix["runtimes"].items(), key=lambda value: int(value[1]["ring"])
         ):
             participation = str(runtime.get("participation") or "required")
-            identity, error = self._identity(runtime)
-            required_command_available = self._required_command_available(runtime)
+            identity, error, required_command_available = probes[runtime_name]
             if not required_command_available and error is None:
                 error = "required-artifact-missing:" + str(
                     runtime.get("required_path") or runtime.get("required_command")
@@ -182,23 +356,26 @@ class CapabilityConvergenceProjector:
                 if not running_revision or not observed_revision:
                     behind.append(capability)
                     continue
-                contained = (
-                    subprocess.run(
-                        [
-                            "git",
-                            "merge-base",
-                            "--is-ancestor",
-                            expected,
-                            observed_revision,
-                        ],
-                        cwd=repository,
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL,
-                        check=False,
-                    ).returncode
-                    == 0
-                )
-                if not contained:
+                # Capabilities usually share revisions; ask git once per pair.
+                pair = (expected, observed_revision)
+                if pair not in contained_by_pair:
+                    contained_by_pair[pair] = (
+                        subprocess.run(
+                            [
+                                "git",
+                                "merge-base",
+                                "--is-ancestor",
+                                expected,
+                                observed_revision,
+                            ],
+                            cwd=repository,
+                            stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL,
+                            check=False,
+                        ).returncode
+                        == 0
+                    )
+                if not contained_by_pair[pair]:
                     behind.append(capability)
             verification_pending = (identity or {}).get(
                 "verification_status"
@@ -4,6 +4,7 @@ from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path, PurePosixPath
 
+from .assignment_index import assignment_paths
 from .mutation import MutationGate, OperationClass
 from .schema_registry import RecordError, validate_record, write_record
 from .validation_evidence import ValidationEvidenceStore
@@ -618,7 +619,7 @@ class CapabilityGraduationProjector:
             str(value.get("assignment_id")): value
             for value in inventory.get("supervisor_assignments") or []
         }
-        for path in sorted((self.root / "assignments").glob("*.json")):
+        for path in assignment_paths(self.root):
             try:
                 value = json.loads(path.read_text(encoding="utf-8"))
             except (OSError, json.JSONDecodeError):
@@ -5,26 +5,40 @@ import os
 import re
 import shutil
 import subprocess
+import threading
 import time
 import uuid
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from urllib.parse import quote
 
 try:
+    from .assignment_index import assignment_paths
     from .canonical_work_item import reconstruct_work_item
+    from .fetch_pool import FetchPool
     from .finding_ingestion import normalize_gitlab_findings
+    from .gitlab_client import shared_client
     from .lifecycle import is_terminal
     from .models import validate_assignment
     from .mutation import MutationGate, OperationClass
-    from .schema_registry import read_record, write_record
+    from . import repository_facts
+    from .schema_registry import read_record, schema_digest, write_record
 except ImportError:
+    from axis_supervisor.assignment_index import assignment_paths
     from axis_supervisor.canonical_work_item import reconstruct_work_item
+    from axis_supervisor.fetch_pool import FetchPool
     from axis_supervisor.finding_ingestion import normalize_gitlab_findings
+    from axis_supervisor.gitlab_client import shared_client
     from axis_supervisor.lifecycle import is_terminal
     from axis_supervisor.models import validate_assignment
     from axis_supervisor.mutation import MutationGate, OperationClass
-    from axis_supervisor.schema_registry import read_record, write_record
+    from axis_supervisor import repository_facts
+    from axis_supervisor.schema_registry import (
+        read_record,
+        schema_digest,
+        write_record,
+    )
 
 ROOT = Path(
     os.environ.get(
@@ -33,6 +47,7 @@ ROOT = Path(
     )
 )
 CONTROL = ROOT / "control.json"
+COLLECTION_STATE = ROOT / "collector" / "collection-state.json"
 INVENTORY = Path(
     os.environ.get("AXIS_SUPERVISOR_INVENTORY_PATH", ROOT / "inventory.json")
 )
@@ -44,6 +59,7 @@ WORKSPACE = Path(
 GITLAB_HOST = "gitlab.com"
 GROUP = "ghostspace"
 NOTE_COLLECTION_REVISION = "gitlab-issue-notes-v1"
+INCREMENTAL_COLLECTION_REVISION = "collector-incremental-v1"
 NOTES_OK = "NOTES_OK"
 NOTES_EMPTY = "NOTES_EMPTY"
 NOTES_ERROR = "NOTES_ERROR"
@@ -55,6 +71,20 @@ NOTE_BODY_LIMIT = 12000
 _CLOSED_NOTE_TRACE_LIMIT = 500
 _CLOSED_NOTE_TRACE_FIELD_LIMIT = 512
 DEPENDENCY_LINK_TIMEOUT_SECONDS = 20
+COLLECTOR_WORKERS = int(os.environ.get("AXIS_SUPERVISOR_COLLECTOR_WORKERS", "8"))
+GITLAB_HOST_CONCURRENCY = int(
+    os.environ.get("AXIS_SUPERVISOR_GITLAB_CONCURRENCY", "6")
+)
+GITLAB_REQUESTS_PER_MINUTE = int(
+    os.environ.get("AXIS_SUPERVISOR_GITLAB_REQUESTS_PER_MINUTE", "1200")
+)
+REPOSITORY_PROBE_WORKERS = int(
+    os.environ.get("AXIS_SUPERVISOR_REPOSITORY_PROBE_WORKERS", "4")
+)
+COLLECTOR_MODE = os.environ.get("AXIS_SUPERVISOR_COLLECTOR_MODE", "incremental")
+FULL_RESYNC_SECONDS = int(
+    os.environ.get("AXIS_SUPERVISOR_COLLECTOR_FULL_RESYNC_SECONDS", "21600")
+)
 _CLOSED_NOTE_MARKERS = (
     "immutable planningrecord",
     "planningrecord v2",
@@ -62,6 +92,7 @@ _CLOSED_NOTE_MARKERS = (
     "finding amendment",
 )
 _ISSUE_REF = re.compile(r"[A-Za-z0-9_.-]+/[A-Za-z0-9_.-]+#\d+\Z")
+_TRACE_LOCK = threading.Lock()
 GLAB = (
     os.environ.get("AXIS_SUPERVISOR_GLAB")
     or shutil.which("glab")
@@ -111,6 +142,9 @@ def decode_json_stream(raw: str) -> list:
 
 
 def glab(path: str, paginate: bool = False, timeout: int = 90):
+    client = shared_client(GITLAB_HOST, GLAB)
+    if client is not None:
+        return client(path, paginate=paginate, timeout=timeout)
     command = [GLAB, "api", "--hostname", GITLAB_HOST]
     if paginate:
         command.append("--paginate")
@@ -166,14 +200,25 @@ def _normalize_note(note: object, fetched_at: str) -> dict:
     }
 
 
-def _read_issue_notes(request, project_id: str, issue_iid: int, fetched_at: str, retries: int):
+def _read_issue_notes(
+    request,
+    project_id: str,
+    issue_iid: int,
+    fetched_at: str,
+    retries: int,
+    updated_since: str | None = None,
+):
+    """Read an issue's notes; with ``updated_since`` stop at older notes."""
     notes: list[dict] = []
     seen_note_ids: set[int] = set()
+    order = (
+        "order_by=updated_at&sort=desc" if updated_since else "order_by=created_at&sort=asc"
+    )
     for page in range(1, NOTE_MAX_PAGES + 1):
         page_notes: list[dict] = []
         path = (
             f"projects/{project_id}/issues/{issue_iid}/notes?per_page={NOTE_PAGE_SIZE}"
-            f"&page={page}&order_by=created_at&sort=asc"
+            f"&page={page}&{order}"
         )
         for attempt in range(retries + 1):
             try:
@@ -187,6 +232,8 @@ def _read_issue_notes(request, project_id: str, issue_iid: int, fetched_at: str,
                     return None, f"page {page}: {type(exc).__name__}"
                 time.sleep(0.1 * (attempt + 1))
         for note in page_notes:
+            if updated_since and note["updated_at"] < updated_since:
+                return notes, None
             if note["id"] in seen_note_ids:
                 return None, f"page {page}: duplicate note id {note['id']}"
             seen_note_ids.add(note["id"])
@@ -196,6 +243,58 @@ def _read_issue_notes(request, project_id: str, issue_iid: int, fetched_at: str,
     return None, f"pagination exceeded {NOTE_MAX_PAGES} pages"
 
 
+class IssueNoteCache:
+    """Normalized issue notes kept on disk between collections.
+
+    Each issue's entry holds its notes keyed by id together with the note's
+    ``updated_at``, so a refresh only has to read notes at or after the
+    cached high-water mark.  Entries older than ``max_age_seconds`` are
+    ignored, which forces a full verified read that also catches deletions.
+    """
+
+    def __init__(self, root: Path, max_age_seconds: float):
+        self.root = root
+        self.max_age_seconds = max_age_seconds
+
+    def _path(self, project_id: str, issue_iid: int) -> Path:
+        return self.root / quote(str(project_id), safe="") / f"{int(issue_iid)}.json"
+
+    def load(self, project_id: str, issue_iid: int, now: float) -> dict | None:
+        try:
+            entry = load(self._path(project_id, issue_iid))
+        except (OSError, ValueError):
+            return None
+        if entry.get("collector_revision") != NOTE_COLLECTION_REVISION:
+            return None
+        if now - float(entry.get("verified_at_epoch") or 0) >= self.max_age_seconds:
+            return None
+        notes = entry.get("notes")
+        return entry if isinstance(notes, dict) else None
+
+    def store(
+        self, project_id: str, issue_iid: int, notes: list[dict], verified_at: float
+    ) -> None:
+        path = self._path(project_id, issue_iid)
+        entry = {
+            "collector_revision": NOTE_COLLECTION_REVISION,
+            "verified_at_epoch": verified_at,
+            "notes": {
+                str(note["id"]): {
+                    key: value for key, value in note.items() if key != "fetched_at"
+                }
+                for note in notes
+            },
+        }
+        try:
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            tmp = path.with_suffix(".json.tmp")
+            tmp.write_text(json.dumps(entry, sort_keys=True), encoding="utf-8")
+            tmp.chmod(0o600)
+            tmp.replace(path)
+        except OSError:
+            pass
+
+
 def _note_snapshot_signature(notes: list[dict]) -> list[tuple]:
     return sorted(
         (
@@ -211,6 +310,36 @@ def _note_snapshot_signature(notes: list[dict]) -> list[tuple]:
     )
 
 
+def _refresh_cached_notes(
+    request,
+    project_id: str,
+    issue_iid: int,
+    cached: dict,
+    fetched_at: str,
+    retries: int,
+) -> list[dict] | None:
+    """Merge two matching reads of notes at or after the cached high-water mark."""
+    notes = {int(note_id): note for note_id, note in cached["notes"].items()}
+    high_water = max(
+        (str(note["updated_at"]) for note in notes.values()), default=""
+    )
+    first, error = _read_issue_notes(
+        request, project_id, issue_iid, fetched_at, retries, high_water or None
+    )
+    if error or first is None:
+        return None
+    second, error = _read_issue_notes(
+        request, project_id, issue_iid, fetched_at, retries, high_water or None
+    )
+    if error or second is None:
+        return None
+    if _note_snapshot_signature(first) != _note_snapshot_signature(second):
+        return None
+    for note in first:
+        notes[note["id"]] = note
+    return [note | {"fetched_at": fetched_at} for note in notes.values()]
+
+
 def collect_issue_notes(
     request,
     project_id: str,
@@ -218,9 +347,29 @@ def collect_issue_notes(
     *,
     fetched_at: str | None = None,
     retries: int = NOTE_PAGE_RETRIES,
+    cache: IssueNoteCache | None = None,
 ) -> dict:
-    """Accept only two matching complete reads of the paginated GitLab note trace."""
+    """Accept only two matching complete reads of the paginated GitLab note trace.
+
+    With a fresh cache entry the two reads cover only notes updated at or
+    after the cached high-water mark; any failure falls back to full reads.
+    """
     fetched_at = fetched_at or datetime.now(timezone.utc).isoformat()
+    now = time.time()
+    cached = cache.load(project_id, issue_iid, now) if cache else None
+    if cache is not None and cached is not None:
+        notes = _refresh_cached_notes(
+            request, project_id, issue_iid, cached, fetched_at, retries
+        )
+        if notes is not None:
+            cache.store(project_id, issue_iid, notes, cached["verified_at_epoch"])
+            notes.sort(key=lambda note: (note["created_at"], note["id"]), reverse=True)
+            return {
+                "state": NOTES_OK if notes else NOTES_EMPTY,
+                "notes": notes,
+                "fetched_at": fetched_at,
+                "collector_revision": NOTE_COLLECTION_REVISION,
+            }
     last_error = "snapshot drift"
     for attempt in range(retries + 1):
         first, error = _read_issue_notes(
@@ -238,6 +387,8 @@ def collect_issue_notes(
         if _note_snapshot_signature(first) != _note_snapshot_signature(second):
             last_error = "snapshot drift"
             continue
+        if cache:
+            cache.store(project_id, issue_iid, first, now)
         first.sort(key=lambda note: (note["created_at"], note["id"]), reverse=True)
         return {
             "state": NOTES_OK if first else NOTES_EMPTY,
@@ -366,12 +517,15 @@ def _write_closed_note_eligibility_trace(
             "reason": decision["reason"],
             "notes_invocation": {"collect_issue_notes_called": decision["eligible"]},
         }
-        lines = path.read_text(encoding="utf-8").splitlines() if path.exists() else []
-        lines = [
-            *lines[-(_CLOSED_NOTE_TRACE_LIMIT - 1) :],
-            json.dumps(entry, sort_keys=True),
-        ]
-        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        with _TRACE_LOCK:
+            lines = (
+                path.read_text(encoding="utf-8").splitlines() if path.exists() else []
+            )
+            lines = [
+                *lines[-(_CLOSED_NOTE_TRACE_LIMIT - 1) :],
+                json.dumps(entry, sort_keys=True),
+            ]
+            path.write_text("\n".join(lines) + "\n", encoding="utf-8")
     except (OSError, TypeError, ValueError):
         pass
 
@@ -411,10 +565,13 @@ def collect_eligible_issue_notes(
     project_id: str,
     issue: dict,
     active_mission_refs: set[str],
+    cache: IssueNoteCache | None = None,
 ) -> dict:
     decision = _closed_note_eligibility(project, issue, active_mission_refs)
     if decision["eligible"]:
-        snapshot = collect_issue_notes(request, project_id, int(issue["iid"]))
+        snapshot = collect_issue_notes(
+            request, project_id, int(issue["iid"]), cache=cache
+        )
     else:
         snapshot = {
             "state": NOTES_EMPTY,
@@ -426,21 +583,239 @@ def collect_eligible_issue_notes(
     return snapshot
 
 
-def mr_mentions_issue(mr: dict, issue: dict) -> bool:
-    text = f"{mr.get('title', '')}\n{mr.get('description', '')}"
-    iid = str(issue["iid"])
-    branch = str(mr.get("source_branch") or "")
-    closing_ref = bool(
-        re.search(
-            rf"\b(?:close[sd]?|fix(?:e[sd])?|resolve[sd]?)\s+#(?:{re.escape(iid)})(?!\d)",
-            text,
-            re.I,
-        )
+def _optional_request(request, path: str):
+    try:
+        return request(path)
+    except Exception:
+        return None
+
+
+def _recent_first(values: list[dict]) -> list[dict]:
+    return sorted(
+        values,
+        key=lambda value: (str(value.get("updated_at") or ""), int(value["iid"])),
+        reverse=True,
+    )
+
+
+def _merge_updates(cached: list[dict], updates: list[dict]) -> list[dict]:
+    merged = {int(value["iid"]): value for value in cached}
+    merged.update({int(value["iid"]): value for value in updates})
+    return _recent_first(list(merged.values()))
+
+
+def _watermark(values: list[dict]) -> str | None:
+    stamps = [str(value["updated_at"]) for value in values if value.get("updated_at")]
+    return max(stamps) if stamps else None
+
+
+def _updated_after(cached: dict | None, field: str) -> str:
+    watermark = (cached or {}).get(field)
+    return f"&updated_after={quote(str(watermark), safe='')}" if watermark else ""
+
+
+def fetch_project_listing(request, project: dict, cached: dict | None = None) -> dict:
+    """Read the per-project issue, merge request, and milestone listings.
+
+    With a cached listing only issues and merge requests updated since their
+    watermarks are requested and merged over the cached copies by iid.
+    """
+    encoded = quote(str(project["id"]), safe="")
+    incremental = bool(cached)
+    issues = request(
+        f"projects/{encoded}/issues?scope=all&state=all&per_page=100"
+        f"&order_by=updated_at&sort=desc{_updated_after(cached, 'issue_watermark')}",
+        paginate=True,
     )
-    branch_ref = bool(
-        re.search(rf"(?:^|[-_/])(?:axis)?{re.escape(iid)}(?:[-_/]|$)", branch, re.I)
+    mrs = request(
+        f"projects/{encoded}/merge_requests?scope=all&state=all&per_page=100"
+        f"&order_by=updated_at&sort=desc{_updated_after(cached, 'mr_watermark')}",
+        paginate=True,
     )
-    return closing_ref or branch_ref
+    try:
+        project_milestones = request(
+            f"projects/{encoded}/milestones?state=all&per_page=100"
+        )
+    except Exception:
+        project_milestones = []
+    if cached:
+        previous_issues = {
+            int(issue["iid"]): issue.get("updated_at") for issue in cached["issues"]
+        }
+        changed_iids = {
+            int(issue["iid"])
+            for issue in issues
+            if previous_issues.get(int(issue["iid"])) != issue.get("updated_at")
+        }
+        issues = _merge_updates(cached["issues"], issues)
+        mrs = _merge_updates(cached["mrs"], mrs)
+    else:
+        changed_iids = {int(issue["iid"]) for issue in issues}
+        issues = _recent_first(issues)
+        mrs = _recent_first(mrs)
+    return {
+        "issues": issues,
+        "mrs": mrs,
+        "milestones": project_milestones,
+        "changed_iids": changed_iids,
+        "incremental": incremental,
+    }
+
+
+def fetch_issue_sources(
+    request,
+    project: dict,
+    encoded: str,
+    issue: dict,
+    active_mission_refs: set[str],
+    note_cache: IssueNoteCache | None = None,
+) -> dict:
+    """Read the notes and dependency links one issue contributes to inventory.
+
+    Link failures are returned rather than raised so the serial assembly can
+    account for them exactly as an inline read would.
+    """
+    sources: dict = {"note_snapshot": None, "links": None, "links_error": None}
+    if should_collect_issue_notes(project, issue, active_mission_refs):
+        sources["note_snapshot"] = collect_eligible_issue_notes(
+            request, project, encoded, issue, active_mission_refs, note_cache
+        )
+    if issue.get("state") == "opened":
+        try:
+            sources["links"] = request(
+                f"projects/{encoded}/issues/{issue['iid']}/links",
+                timeout=DEPENDENCY_LINK_TIMEOUT_SECONDS,
+            )
+        except Exception as exc:
+            sources["links_error"] = exc
+    return sources
+
+
+def _collection_context(
+    trusted_user_ids: set[int | str], repository_allowlist: set[str]
+) -> str:
+    context = {
+        "revision": INCREMENTAL_COLLECTION_REVISION,
+        "notes": NOTE_COLLECTION_REVISION,
+        "inventory_schema": schema_digest(
+            "axis.external-development-supervisor.inventory", INVENTORY
+        ),
+        "trusted_gitlab_user_ids": sorted(str(value) for value in trusted_user_ids),
+        "repository_allowlist": sorted(repository_allowlist),
+    }
+    encoded = json.dumps(context, sort_keys=True).encode("utf-8")
+    return "sha256:" + hashlib.sha256(encoded).hexdigest()
+
+
+def load_collection_state(context: str, now: float) -> tuple[dict | None, str]:
+    """Return the reusable incremental state, or why a full resync is required."""
+    if COLLECTOR_MODE != "incremental":
+        return None, f"mode {COLLECTOR_MODE}"
+    try:
+        state = load(COLLECTION_STATE)
+    except (OSError, ValueError):
+        return None, "no collection state"
+    if state.get("context") != context:
+        return None, "collection context changed"
+    if now - float(state.get("full_resync_at_epoch") or 0) >= FULL_RESYNC_SECONDS:
+        return None, "full resync due"
+    try:
+        previous = read_record(
+            INVENTORY, "axis.external-development-supervisor.inventory"
+        )
+    except Exception:
+        return None, "previous inventory unavailable"
+    if previous.get("generation_id") != state.get("inventory_generation_id"):
+        return None, "previous inventory generation mismatch"
+    state["previous_items"] = {
+        item["ref"]: item
+        for item in previous["work_items"]
+        if item.get("source_kind") == "gitlab-issue"
+    }
+    edges: dict[str, list[dict]] = {}
+    for edge in previous["dependency_edges"]:
+        edges.setdefault(edge["from_ref"], []).append(edge)
+    state["previous_edges"] = edges
+    return state, "incremental"
+
+
+def write_collection_state(path: Path, state: dict) -> None:
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps(state, sort_keys=True) + "\n", encoding="utf-8")
+    tmp.chmod(0o600)
+    tmp.replace(path)
+
+
+def _merge_request_fact(mr: dict) -> dict:
+    return {
+        "iid": mr["iid"],
+        "state": mr["state"],
+        "sha": mr.get("sha"),
+        "web_url": mr.get("web_url"),
+    }
+
+
+def reusable_work_item(
+    previous: dict | None,
+    issue: dict,
+    related_mrs: list[dict],
+    repository_head: str | None,
+    previous_edges: list[dict],
+    known_refs: set[str],
+    changed_refs: set[str],
+) -> bool:
+    """Return whether a previous work item still reflects every one of its inputs.
+
+    Notes and links bump the issue's ``updated_at``; merge requests, the
+    default-branch head, and the state of blocking issues do not, so those are
+    compared explicitly.  Items that carried retrieval errors are always
+    refreshed.
+    """
+    if previous is None or previous.get("retrieval_errors"):
+        return False
+    if previous.get("updated_at") != issue.get("updated_at"):
+        return False
+    if previous.get("repository_head") != repository_head:
+        return False
+    if previous.get("merge_request_facts") != [
+        _merge_request_fact(mr) for mr in related_mrs
+    ]:
+        return False
+    blockers = {
+        edge["to_ref"]
+        for edge in previous_edges
+        if edge["relationship"] == "is_blocked_by"
+    }
+    return blockers <= known_refs and not blockers & changed_refs
+
+
+_CLOSING_REFERENCE = re.compile(
+    r"\b(?:close[sd]?|fix(?:e[sd])?|resolve[sd]?)\s+#(\d+)(?!\d)", re.I
+)
+_BRANCH_REFERENCE = re.compile(r"(?:^|(?<=[-_/]))(?:axis)?(\d+)(?=[-_/]|$)", re.I)
+
+
+def mr_issue_references(mr: dict) -> set[str]:
+    """Issue iids an MR closes in its title/description or names in its branch."""
+    text = f"{mr.get('title', '')}\n{mr.get('description', '')}"
+    branch = str(mr.get("source_branch") or "")
+    return {match.group(1) for match in _CLOSING_REFERENCE.finditer(text)} | {
+        match.group(1) for match in _BRANCH_REFERENCE.finditer(branch)
+    }
+
+
+def mr_mentions_issue(mr: dict, issue: dict) -> bool:
+    return str(issue["iid"]) in mr_issue_references(mr)
+
+
+def index_mrs_by_issue(mrs: list[dict]) -> dict[str, list[dict]]:
+    """Map issue iids to the MRs that mention them, keeping listing order."""
+    index: dict[str, list[dict]] = {}
+    for mr in mrs:
+        for iid in mr_issue_references(mr):
+            index.setdefault(iid, []).append(mr)
+    return index
 
 
 def extract_acceptance_facts(text: str) -> dict:
@@ -532,13 +907,24 @@ def local_repository_state(project: dict, merge_requests: list[dict] | None = No
             check=True,
             timeout=120,
         )
-        default_remote = f"origin/{project.get('default_branch') or 'main'}"
+        default_branch = str(project.get("default_branch") or "main")
+        default_remote = f"origin/{default_branch}"
         state["default_remote"] = default_remote
-        state["default_remote_head"] = run([GIT, "rev-parse", default_remote], path).strip()
-        remote_ref = f"refs/heads/{project.get('default_branch') or 'main'}"
-        remote_lines = run([GIT, "ls-remote", "origin", remote_ref], path).splitlines()
+        remote_lines = run(
+            [GIT, "ls-remote", "origin", f"refs/heads/{default_branch}"], path
+        ).splitlines()
         remote_head = remote_lines[0].split()[0] if remote_lines else None
-        if remote_head and remote_head != state["default_remote_head"]:
+        worktree_fields = repository_facts.list_worktrees(GIT, path)
+        # Detached or bare worktree entries carry no HEAD and are not batched.
+        worktree_heads = [
+            head
+            for fields in worktree_fields
+            if (head := fields.get("HEAD") or fields.get("head"))
+        ]
+        resolved = repository_facts.resolve_commits(
+            GIT, path, [default_remote, "HEAD", *worktree_heads]
+        )
+        if remote_head and remote_head != resolved.get(default_remote):
             subprocess.run(
                 [GIT, "fetch", "--prune", "origin"],
                 cwd=path,
@@ -547,109 +933,117 @@ def local_repository_state(project: dict, merge_requests: list[dict] | None = No
                 check=True,
                 timeout=120,
             )
-            state["default_remote_head"] = run(
-                [GIT, "rev-parse", default_remote], path
-            ).strip()
-        state["remote_fresh"] = remote_head == state["default_remote_head"]
+            resolved.update(
+                repository_facts.resolve_commits(GIT, path, [default_remote])
+            )
+        for revision in (default_remote, "HEAD"):
+            if not resolved.get(revision):
+                raise RuntimeError(f"cannot resolve {revision} in {path}")
+        default_remote_head = str(resolved[default_remote])
+        root_head = str(resolved["HEAD"])
+        state["default_remote_head"] = default_remote_head
+        state["remote_fresh"] = remote_head == default_remote_head
         state["observed_remote_head"] = remote_head
-        state["head"] = run([GIT, "rev-parse", "HEAD"], path).strip()
-        state["branch"] = run([GIT, "branch", "--show-current"], path).strip()
-        state["dirty"] = bool(run([GIT, "status", "--porcelain"], path).strip())
-        default_branch = str(project.get("default_branch") or "main")
-        state["root_is_default_branch"] = state["branch"] == default_branch
-        state["root_fast_forward_safe"] = (
-            subprocess.run(
-                [GIT, "merge-base", "--is-ancestor", "HEAD", default_remote],
-                cwd=str(path),
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                check=False,
-            ).returncode
-            == 0
+        state["head"] = root_head
+        refs = repository_facts.list_refs(
+            GIT, path, "refs/heads", "refs/remotes/origin"
         )
-        state["root_needs_fast_forward"] = bool(
-            state["root_is_default_branch"]
-            and state["head"] != state["default_remote_head"]
+        root = path.resolve()
+        root_fields = next(
+            (
+                fields
+                for fields in worktree_fields
+                if Path(fields.get("worktree", "")).resolve() == root
+            ),
+            None,
         )
-        worktree_raw = run([GIT, "worktree", "list", "--porcelain"], path)
+        state["branch"] = (
+            root_fields.get("branch", "").removeprefix("refs/heads/")
+            if root_fields is not None
+            else run([GIT, "branch", "--show-current"], path).strip()
+        )
+        remote_refs = []
+        for remote_name, head in refs["refs/remotes/origin"]:
+            branch = remote_name.removeprefix("origin/")
+            if remote_name in {"origin", "origin/HEAD", default_remote} or branch in {
+                "HEAD",
+                default_branch,
+            }:
+                continue
+            remote_refs.append((remote_name, branch, head))
+        integrated = repository_facts.integrated_commits(
+            GIT,
+            path,
+            [root_head]
+            + [commit for head in worktree_heads if (commit := resolved.get(head))]
+            + [head for _name, head in refs["refs/heads"]]
+            + [head for _name, _branch, head in remote_refs],
+            default_remote_head,
+        )
+        # Each worktree has its own index, so status stays one process per
+        # checkout; those and the per-branch divergence reads run side by side.
+        status_paths = [Path(fields.get("worktree", "")) for fields in worktree_fields]
+        if root_fields is None:
+            status_paths.append(path)
+        with FetchPool(REPOSITORY_PROBE_WORKERS) as probes:
+            probed = probes.run(
+                [
+                    partial(repository_facts.worktree_dirty, GIT, worktree_path)
+                    for worktree_path in status_paths
+                ]
+                + [
+                    partial(
+                        repository_facts.branch_divergence,
+                        GIT,
+                        path,
+                        default_remote,
+                        remote_name,
+                    )
+                    for remote_name, _branch, _head in remote_refs
+                ]
+            )
+        statuses = probed[: len(status_paths)]
+        divergences = probed[len(status_paths) :]
+        root_dirty = statuses[-1] if root_fields is None else None
         worktrees = []
-        for block in (
-            block for block in worktree_raw.strip().split("\n\n") if block.strip()
-        ):
-            fields = {}
-            for line in block.splitlines():
-                key, _, value = line.partition(" ")
-                fields[key] = value
+        for fields, dirty in zip(worktree_fields, statuses):
             worktree_path = Path(fields.get("worktree", ""))
-            branch = fields.get("branch", "").removeprefix("refs/heads/")
             head = fields.get("HEAD") or fields.get("head")
-            dirty = None
-            if worktree_path.exists():
-                try:
-                    dirty = bool(
-                        run([GIT, "status", "--porcelain"], worktree_path).strip()
-                    )
-                except Exception:
-                    dirty = None
-            integrated = bool(
-                head
-                and subprocess.run(
-                    [GIT, "merge-base", "--is-ancestor", head, default_remote],
-                    cwd=str(path),
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    check=False,
-                ).returncode
-                == 0
-            )
+            is_root = worktree_path.resolve() == root
+            if fields is root_fields:
+                root_dirty = dirty
             worktrees.append(
                 {
                     "path": str(worktree_path),
                     "head": head,
-                    "branch": branch,
+                    "branch": fields.get("branch", "").removeprefix("refs/heads/"),
                     "dirty": dirty,
-                    "integrated_into_default": integrated,
-                    "is_root": worktree_path.resolve() == path.resolve(),
+                    "integrated_into_default": bool(
+                        head and resolved.get(head) in integrated
+                    ),
+                    "is_root": is_root,
                     "prunable": "prunable" in fields,
                 }
             )
-        state["worktrees"] = worktrees
-        branch_raw = run(
-            [GIT, "for-each-ref", "--format=%(refname:short)|%(objectname)", "refs/heads"],
-            path,
-        )
-        local_branches = []
-        for line in branch_raw.splitlines():
-            if "|" not in line:
-                continue
-            name, head = line.split("|", 1)
-            integrated = (
-                subprocess.run(
-                    [GIT, "merge-base", "--is-ancestor", head, default_remote],
-                    cwd=str(path),
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    check=False,
-                ).returncode
-                == 0
-            )
-            local_branches.append(
-                {
-                    "name": name,
-                    "head": head,
-                    "integrated_into_default": integrated,
-                }
-            )
-        state["local_branches"] = local_branches
-        remote_raw = run(
-            [
-                GIT,
-                "for-each-ref",
-                "--format=%(refname:short)|%(objectname)",
-                "refs/remotes/origin",
-            ],
-            path,
+        if root_dirty is None:
+            # Preserve the previous contract: a root status failure is an error.
+            root_dirty = bool(run([GIT, "status", "--porcelain"], path).strip())
+        state["dirty"] = root_dirty
+        state["root_is_default_branch"] = state["branch"] == default_branch
+        state["root_fast_forward_safe"] = state["head"] in integrated
+        state["root_needs_fast_forward"] = bool(
+            state["root_is_default_branch"]
+            and state["head"] != state["default_remote_head"]
         )
+        state["worktrees"] = worktrees
+        state["local_branches"] = [
+            {
+                "name": name,
+                "head": head,
+                "integrated_into_default": head in integrated,
+            }
+            for name, head in refs["refs/heads"]
+        ]
         mr_by_branch = {}
         for mr in sorted(
             merge_requests or [], key=lambda value: int(value.get("iid") or 0)
@@ -658,62 +1052,17 @@ def local_repository_state(project: dict, merge_requests: list[dict] | None = No
             if source_branch:
                 mr_by_branch[source_branch] = mr
         remote_branches = []
-        default_branch = str(project.get("default_branch") or "main")
-        for line in remote_raw.splitlines():
-            if "|" not in line:
-                continue
-            remote_name, head = line.split("|", 1)
-            branch = remote_name.removeprefix("origin/")
-            if remote_name in {"origin", "origin/HEAD", f"origin/{default_branch}"} or branch in {
-                "HEAD",
-                default_branch,
-            }:
-                continue
-            merge_base = run(
-                [GIT, "merge-base", default_remote, remote_name], path
-            ).strip()
-            behind, ahead = (
-                run(
-                    [
-                        GIT,
-                        "rev-list",
-                        "--left-right",
-                        "--count",
-                        f"{default_remote}...{remote_name}",
-                    ],
-                    path,
-                )
-                .strip()
-                .split()
-            )
-            integrated = (
-                subprocess.run(
-                    [GIT, "merge-base", "--is-ancestor", head, default_remote],
-                    cwd=str(path),
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    check=False,
-                ).returncode
-                == 0
-            )
-            changed_paths = [
-                value
-                for value in run(
-                    [GIT, "diff", "--name-only", f"{merge_base}..{remote_name}"],
-                    path,
-                ).splitlines()
-                if value
-            ]
+        for (remote_name, branch, head), divergence in zip(remote_refs, divergences):
             mr = mr_by_branch.get(branch) or {}
             remote_branches.append(
                 {
                     "name": branch,
                     "head": head,
-                    "merge_base": merge_base,
-                    "ahead": int(ahead),
-                    "behind": int(behind),
-                    "integrated_into_default": integrated,
-                    "changed_paths": changed_paths,
+                    "merge_base": divergence["merge_base"],
+                    "ahead": divergence["ahead"],
+                    "behind": divergence["behind"],
+                    "integrated_into_default": head in integrated,
+                    "changed_paths": divergence["changed_paths"],
                     "owned_by_supervisor": branch.startswith("hermes/"),
                     "active_worktree": next(
                         (
@@ -879,44 +1228,161 @@ def main() -> int:
     def supervisor_owned_branch(branch: str) -> bool:
         return bool(branch and branch.startswith(owned_branch_prefixes))
 
-    projects = glab(
-        f"groups/{quote(GROUP, safe='')}/projects"
-        "?include_subgroups=true&archived=false&per_page=100",
-        paginate=True,
+    context = _collection_context(trusted_user_ids, repository_allowlist)
+    state, collection_mode = load_collection_state(context, started)
+    cached_projects = (state or {}).get("projects") or {}
+    previous_items = (state or {}).get("previous_items") or {}
+    previous_edges = (state or {}).get("previous_edges") or {}
+    mission_changes = mission_issue_refs ^ set((state or {}).get("mission_refs") or [])
+    # A full resync re-verifies every note trace and reseeds the cache.
+    note_cache = IssueNoteCache(
+        COLLECTION_STATE.parent / "notes", FULL_RESYNC_SECONDS if state else 0
     )
-    projects = [
-        project for project in projects if str(project.get("path", "")).startswith("axis")
-    ]
-    projects.sort(key=lambda project: project["path_with_namespace"])
 
+    pool = FetchPool(
+        COLLECTOR_WORKERS,
+        host_limits={GITLAB_HOST: GITLAB_HOST_CONCURRENCY},
+        requests_per_minute=GITLAB_REQUESTS_PER_MINUTE,
+    )
+    request = pool.limited(GITLAB_HOST, glab)
+    reused_work_items = 0
+    try:
+        with pool.phase("projects"):
+            projects = request(
+                f"groups/{quote(GROUP, safe='')}/projects"
+                "?include_subgroups=true&archived=false&per_page=100",
+                paginate=True,
+            )
+            projects = [
+                project
+                for project in projects
+                if str(project.get("path", "")).startswith("axis")
+            ]
+            projects.sort(key=lambda project: project["path_with_namespace"])
+        with pool.phase("project_listings"):
+            listings = pool.run(
+                [
+                    partial(
+                        fetch_project_listing,
+                        request,
+                        project,
+                        cached_projects.get(str(project["id"])),
+                    )
+                    for project in projects
+                ]
+            )
+        with pool.phase("project_details"):
+            # One flat fan-out keeps every worker busy; results are consumed
+            # below in the exact order a serial walk would have produced them.
+            jobs = []
+            for project, listing in zip(projects, listings):
+                encoded = quote(str(project["id"]), safe="")
+                jobs.append(partial(local_repository_state, project, listing["mrs"]))
+                for mr in listing["mrs"]:
+                    if mr.get("state") != "opened":
+                        continue
+                    iid = int(mr["iid"])
+                    jobs.append(
+                        partial(
+                            _optional_request,
+                            request,
+                            f"projects/{encoded}/merge_requests/{iid}/approvals",
+                        )
+                    )
+                    jobs.append(
+                        partial(
+                            _optional_request,
+                            request,
+                            f"projects/{encoded}/merge_requests/{iid}",
+                        )
+                    )
+            results = iter(pool.run(jobs))
+            for listing in listings:
+                listing["local_facts"] = next(results)
+                listing["approval_facts"] = {}
+                listing["detail_facts"] = {}
+                for mr in listing["mrs"]:
+                    if mr.get("state") != "opened":
+                        continue
+                    # Unknown approval state must not be mistaken for an
+                    # approved, ownerless merge lane, and a missing pipeline
+                    # fact must remain explicitly non-actionable.
+                    listing["approval_facts"][int(mr["iid"])] = next(results)
+                    listing["detail_facts"][int(mr["iid"])] = next(results)
+        with pool.phase("issue_details"):
+            known_refs = {
+                issue_ref(project, issue)
+                for project, listing in zip(projects, listings)
+                for issue in listing["issues"]
+            }
+            changed_refs = {
+                issue_ref(project, issue)
+                for project, listing in zip(projects, listings)
+                for issue in listing["issues"]
+                if int(issue["iid"]) in listing["changed_iids"]
+            }
+            jobs = []
+            for project, listing in zip(projects, listings):
+                encoded = quote(str(project["id"]), safe="")
+                repository_head = (listing["local_facts"] or {}).get(
+                    "default_remote_head"
+                )
+                listing["related_mrs"] = []
+                listing["reused"] = []
+                mrs_by_issue = index_mrs_by_issue(listing["mrs"])
+                for issue in listing["issues"]:
+                    ref = issue_ref(project, issue)
+                    related_mrs = list(mrs_by_issue.get(str(issue["iid"]), ()))
+                    listing["related_mrs"].append(related_mrs)
+                    reused = (
+                        listing["incremental"]
+                        and ref not in mission_changes
+                        and reusable_work_item(
+                            previous_items.get(ref),
+                            issue,
+                            related_mrs,
+                            repository_head,
+                            previous_edges.get(ref) or [],
+                            known_refs,
+                            changed_refs,
+                        )
+                    )
+                    listing["reused"].append(reused)
+                    if not reused:
+                        jobs.append(
+                            partial(
+                                fetch_issue_sources,
+                                request,
+                                project,
+                                encoded,
+                                issue,
+                                mission_issue_refs,
+                                note_cache,
+                            )
+                        )
+            results = iter(pool.run(jobs))
+            for listing in listings:
+                listing["issue_sources"] = [
+                    None if reused else next(results) for reused in listing["reused"]
+                ]
+    finally:
+        pool.close()
+
+    phase_started = time.monotonic()
     source_items = []
     open_mrs = []
     repositories = {}
     dependency_edges = []
     milestones = []
     dependency_queries = 0
+    dependency_queries_reused = 0
     dependency_query_failures = 0
     dependency_link_timeouts = []
 
-    for project in projects:
+    for project, listing in zip(projects, listings):
         project_id = project["id"]
-        encoded = quote(str(project_id), safe="")
-        issues = glab(
-            f"projects/{encoded}/issues?scope=all&state=all&per_page=100"
-            "&order_by=updated_at&sort=desc",
-            paginate=True,
-        )
-        mrs = glab(
-            f"projects/{encoded}/merge_requests?scope=all&state=all&per_page=100"
-            "&order_by=updated_at&sort=desc",
-            paginate=True,
-        )
-        try:
-            project_milestones = glab(
-                f"projects/{encoded}/milestones?state=all&per_page=100"
-            )
-        except Exception:
-            project_milestones = []
+        issues = listing["issues"]
+        mrs = listing["mrs"]
         milestones.extend(
             {
                 "project": project["path_with_namespace"],
@@ -925,27 +1391,11 @@ def main() -> int:
                 "state": milestone.get("state"),
                 "web_url": milestone.get("web_url"),
             }
-            for milestone in project_milestones
+            for milestone in listing["milestones"]
         )
         project_open_mrs = [mr for mr in mrs if mr.get("state") == "opened"]
-        approval_facts = {}
-        detail_facts = {}
-        for mr in project_open_mrs:
-            iid = int(mr["iid"])
-            try:
-                approval_facts[iid] = glab(
-                    f"projects/{encoded}/merge_requests/{iid}/approvals"
-                )
-            except Exception:
-                # Keep collection available; unknown approval state must not be
-                # mistaken for an approved, ownerless merge lane.
-                approval_facts[iid] = None
-            try:
-                detail_facts[iid] = glab(f"projects/{encoded}/merge_requests/{iid}")
-            except Exception:
-                # The list response is an acceptable pipeline fallback, but a
-                # missing pipeline fact must remain explicitly non-actionable.
-                detail_facts[iid] = None
+        approval_facts = listing["approval_facts"]
+        detail_facts = listing["detail_facts"]
         open_mrs.extend(
             normalize_open_merge_request(
                 project["path_with_namespace"],
@@ -959,12 +1409,22 @@ def main() -> int:
             "project_id": project_id,
             "default_branch": project.get("default_branch"),
             "web_url": project.get("web_url"),
-            "local_facts": local_repository_state(project, mrs),
+            "local_facts": listing["local_facts"],
         }
 
-        for issue in issues:
+        for issue, related_mrs, sources in zip(
+            issues, listing["related_mrs"], listing["issue_sources"]
+        ):
             ref = issue_ref(project, issue)
-            related_mrs = [mr for mr in mrs if mr_mentions_issue(mr, issue)]
+            if sources is None:
+                # A reused item carries link facts from a successful earlier
+                # query; it is counted apart from the queries made this run.
+                if issue.get("state") == "opened":
+                    dependency_queries_reused += 1
+                source_items.append(previous_items[ref])
+                dependency_edges.extend(previous_edges.get(ref) or [])
+                reused_work_items += 1
+                continue
             note_snapshot = {
                 "state": NOTES_EMPTY,
                 "notes": [],
@@ -974,10 +1434,8 @@ def main() -> int:
             notes = []
             blocking_dependencies = []
             retrieval_errors = []
-            if should_collect_issue_notes(project, issue, mission_issue_refs):
-                note_snapshot = collect_eligible_issue_notes(
-                    glab, project, encoded, issue, mission_issue_refs
-                )
+            if sources["note_snapshot"] is not None:
+                note_snapshot = sources["note_snapshot"]
                 if note_snapshot["state"] == NOTES_ERROR:
                     retrieval_errors.append(
                         f"notes: {note_snapshot.get('error') or NOTES_ERROR}"
@@ -985,13 +1443,10 @@ def main() -> int:
                 else:
                     notes = note_snapshot["notes"]
             if issue.get("state") == "opened":
-                try:
-                    dependency_queries += 1
-                    links = glab(
-                        f"projects/{encoded}/issues/{issue['iid']}/links",
-                        timeout=DEPENDENCY_LINK_TIMEOUT_SECONDS,
-                    )
-                except Exception as exc:
+                dependency_queries += 1
+                links = sources["links"]
+                exc = sources["links_error"]
+                if exc is not None:
                     links = []
                     dependency_query_failures += 1
                     error = f"links: {type(exc).__name__}"
@@ -1089,13 +1544,7 @@ def main() -> int:
                     "findings": findings,
                     "blocking_dependency_refs": sorted(set(blocking_dependencies)),
                     "merge_request_facts": [
-                        {
-                            "iid": mr["iid"],
-                            "state": mr["state"],
-                            "sha": mr.get("sha"),
-                            "web_url": mr.get("web_url"),
-                        }
-                        for mr in related_mrs
+                        _merge_request_fact(mr) for mr in related_mrs
                     ],
                     "acceptance_criteria_present": "acceptance" in text.lower()
                     or "AC-" in text,
@@ -1295,12 +1744,11 @@ def main() -> int:
                 },
             )
 
+    pool.timings["assembly"] = round(time.monotonic() - phase_started, 3)
+    phase_started = time.monotonic()
     assignment_records = []
     state_record_errors = []
-    assignment_dir = ROOT / "assignments"
-    for assignment_path in (
-        sorted(assignment_dir.glob("*.json")) if assignment_dir.exists() else []
-    ):
+    for assignment_path in assignment_paths(ROOT):
         try:
             raw_assignment = load(assignment_path)
             if retire_unsupported_watchdog_assignment(raw_assignment):
@@ -1352,6 +1800,7 @@ def main() -> int:
         except Exception as exc:
             state_record_errors.append(f"lease {lease_path}: {type(exc).__name__}")
 
+    pool.timings["state_records"] = round(time.monotonic() - phase_started, 3)
     source_items.sort(key=lambda item: item["ref"])
     refs = [item["ref"] for item in source_items]
     if len(refs) != len(set(refs)):
@@ -1411,6 +1860,7 @@ def main() -> int:
                 repositories
             ),
             "dependency_queries": dependency_queries,
+            "dependency_queries_reused": dependency_queries_reused,
             "dependency_query_failures": dependency_query_failures,
             "dependency_link_timeouts": dependency_link_timeouts,
             "retrieval_error_count": retrieval_error_count,
@@ -1420,7 +1870,30 @@ def main() -> int:
             "active_lease_count": len(active_leases),
         },
     }
+    phase_started = time.monotonic()
     write_inventory(INVENTORY, inventory)
+    write_collection_state(
+        COLLECTION_STATE,
+        {
+            "revision": INCREMENTAL_COLLECTION_REVISION,
+            "context": context,
+            "inventory_generation_id": inventory["generation_id"],
+            "full_resync_at_epoch": (
+                state["full_resync_at_epoch"] if state else round(started, 3)
+            ),
+            "mission_refs": sorted(mission_issue_refs),
+            "projects": {
+                str(project["id"]): {
+                    "issue_watermark": _watermark(listing["issues"]),
+                    "mr_watermark": _watermark(listing["mrs"]),
+                    "issues": listing["issues"],
+                    "mrs": listing["mrs"],
+                }
+                for project, listing in zip(projects, listings)
+            },
+        },
+    )
+    pool.timings["write"] = round(time.monotonic() - phase_started, 3)
     print(
         json.dumps(
             {
@@ -1428,6 +1901,9 @@ def main() -> int:
                 "work_items_discovered": inventory["work_items_discovered"],
                 "dependency_edges": len(inventory["dependency_edges"]),
                 "collection_status": inventory["collection_status"],
+                "fetch": pool.report(),
+                "collection_mode": collection_mode,
+                "reused_work_items": reused_work_items,
             },
             sort_keys=True,
         )
@@ -13,6 +13,7 @@ if __package__ in {None, ""}:
     sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from axis_supervisor.accounting import AccountingLedger
+from axis_supervisor.assignment_index import AssignmentIndex, assignment_paths
 from axis_supervisor import progress_coherence
 from axis_supervisor.assignment_grants import (
     bind_mr as bind_assignment_grant_mr,
@@ -34,15 +35,16 @@ from axis_supervisor.deployment import (
 )
 from axis_supervisor.dispatcher import Dispatcher
 from axis_supervisor.graph import ExecutionGraphBuilder
+from axis_supervisor.fetch_pool import FetchPool
 from axis_supervisor.frontier import ExecutableFrontier
 from axis_supervisor.integrator import Integrator
+from axis_supervisor.leases import LeaseController
 from axis_supervisor.merge_lanes import consume_next as consume_next_merge_lane
 from axis_supervisor.merge_lanes import GATED_INTEGRATION
 from axis_supervisor.merge_lanes import reconcile as reconcile_merge_lanes
 from axis_supervisor.lifecycle import (
     is_completed,
     is_integrable,
-    is_terminal,
     set_lifecycle,
 )
 from axis_supervisor.missions import (
@@ -59,20 +61,23 @@ from axis_supervisor.mutation import (
 )
 from axis_supervisor.observability import (
     OperationalEventLog,
+    event_batch,
     record_engineering_retrospective,
     record_event,
     record_product_heartbeat,
     record_observability_failure,
 )
+from axis_supervisor import projection_pipeline
 from axis_supervisor.repository_convergence import RepositoryConvergenceProjector
 from axis_supervisor.roadmap_quality import RoadmapQualityProjector
 from axis_supervisor.schema_registry import (
     CorruptRecordError,
     read_record,
-    validate_record,
+    read_snapshot,
     write_record,
 )
 from axis_supervisor.semantic_escalation import quarantine_failed_assignment
+from axis_supervisor.state_store import record_transaction
 from axis_supervisor.verification import completion_receipt
 from axis_supervisor.workers import HermesWorkerManager, run_isolated_test
 from axis_supervisor.workflow_state import (
@@ -89,6 +94,20 @@ ROOT = Path(
         Path.home() / ".hermes" / "supervisor" / "axis-development-supervisor",
     )
 )
+# Above one, run-next dispatches every compatible frontier entry and runs them
+# concurrently; frontier stage capacities and the model-call budget bound the batch.
+EXECUTION_WORKERS = int(os.environ.get("AXIS_SUPERVISOR_EXECUTION_WORKERS", "1"))
+# Worker outcomes that finished their work; quarantines, waits and escalations
+# are returned too but do not count toward pool throughput.
+COMPLETED_RESULTS = frozenset(
+    {
+        "completed",
+        "awaiting-integration",
+        "repository-converged",
+        "runtime-converged",
+        "canonical-complete",
+    }
+)
 
 
 def deployed_source_revision() -> dict:
@@ -379,7 +398,7 @@ def converge_repository(
         )
         removed_worktree = completed.returncode == 0 or not worktree.exists()
     if scope in {"worktree", "branch"} and branch and branch != "detached":
-        control = read_record(
+        control = read_snapshot(
             ROOT / "control.json", "axis.external-development-supervisor.control"
         )
         prefixes = tuple(control.get("owned_branch_prefixes") or [])
@@ -574,17 +593,12 @@ def release_failed_assignment(
     except Exception:
         lease = None
     if lease is not None:
-        subprocess.run(
-            [
-                sys.executable,
-                supervisorctl,
-                "release",
-                assignment["assignment_id"],
-                "--token",
-                lease["fencing_token"],
-            ],
-            check=False,
-        )
+        try:
+            LeaseController(ROOT).release(
+                assignment["assignment_id"], lease["fencing_token"]
+            )
+        except Exception:  # noqa: BLE001 - recovery quarantines a stuck lease
+            pass
         assignment["lease_id"] = None
         assignment["lease_uri"] = None
     set_lifecycle(assignment, "failed")
@@ -696,21 +710,24 @@ def publish_source_generation(
     gate = MutationGate(ROOT, source="cycle")
     decision = gate.decide(OperationClass.RECONCILIATION)
     gate.require(decision, OperationClass.RECONCILIATION)
-    try:
-        for path, value, schema in records:
-            write_record(path, value, schema)
-        ExecutableFrontier(ROOT).build(
-            graph.get("executable_queue") or [],
-            active_assignments,
-            graph.get("generation_id"),
-        )
-    except Exception:
-        for path, value, schema in previous:
-            write_record(path, value, schema)
-        for path, _value, _schema in records:
-            if path not in previous_paths:
-                path.unlink(missing_ok=True)
-        raise
+    # With the SQLite state backend the generation commits as one transaction;
+    # the restore below covers the JSON backend.
+    with record_transaction(ROOT):
+        try:
+            for path, value, schema in records:
+                write_record(path, value, schema)
+            ExecutableFrontier(ROOT).build(
+                graph.get("executable_queue") or [],
+                active_assignments,
+                graph.get("generation_id"),
+            )
+        except Exception:
+            for path, value, schema in previous:
+                write_record(path, value, schema)
+            for path, _value, _schema in records:
+                if path not in previous_paths:
+                    path.unlink(missing_ok=True)
+            raise
 
 
 def rebuild(
@@ -718,11 +735,23 @@ def rebuild(
     reconcile_decisions: bool = True,
     inventory_path: Path | None = None,
 ) -> dict:
-    inventory = read_record(
+    """Rebuild every projection; their events are committed as one group."""
+    with event_batch(ROOT, "cycle"):
+        return rebuild_projections(
+            reconcile_decisions=reconcile_decisions, inventory_path=inventory_path
+        )
+
+
+def rebuild_projections(
+    *,
+    reconcile_decisions: bool = True,
+    inventory_path: Path | None = None,
+) -> dict:
+    inventory = read_snapshot(
         inventory_path or ROOT / "inventory.json",
         "axis.external-development-supervisor.inventory",
     )
-    control = read_record(
+    control = read_snapshot(
         ROOT / "control.json", "axis.external-development-supervisor.control"
     )
     remaining = max(
@@ -730,38 +759,70 @@ def rebuild(
         int(control.get("daily_model_call_limit", 0))
         - AccountingLedger(ROOT).model_attempts_today(),
     )
+    index = AssignmentIndex(ROOT)
+
     def active_assignments() -> list[dict]:
-        return [
-            assignment
-            for path in (ROOT / "assignments").glob("*.json")
-            if not is_terminal(
-                assignment := validate_assignment(
-                    json.loads(path.read_text(encoding="utf-8")), ROOT
-                )
-            )
-        ]
+        return index.active()
 
     active = active_assignments()
     now = int(time.time())
-    graph = ExecutionGraphBuilder(ROOT).build(
-        inventory,
-        {
-            "available_model_call_budget": remaining,
-            "active_assignments": active,
-            "engineering_metrics": OperationalEventLog(
-                ROOT, "cycle"
-            ).throughput_metrics(now - 30 * 86_400, now),
-        },
-        persist=False,
-    )
-    RoadmapQualityProjector(ROOT).build(inventory, graph)
-    repository_convergence = RepositoryConvergenceProjector(ROOT).build(inventory)
-    capability_convergence = CapabilityConvergenceProjector(ROOT).build(
-        repository_convergence
+    pipeline = projection_pipeline.current()
+
+    graph_builder = ExecutionGraphBuilder(ROOT)
+
+    def build_graph() -> dict:
+        return pipeline.stage(
+            "execution-graph",
+            lambda: graph_builder.build(
+                inventory,
+                {
+                    "available_model_call_budget": remaining,
+                    "active_assignments": active,
+                    "engineering_metrics": OperationalEventLog(
+                        ROOT, "cycle"
+                    ).throughput_metrics(now - 30 * 86_400, now),
+                },
+                persist=False,
+            ),
+            memoize=False,
+        )
+
+    def build_roadmap_quality() -> None:
+        pipeline.stage(
+            "roadmap-quality",
+            lambda: RoadmapQualityProjector(ROOT).build(inventory, graph),
+            memoize=False,
+        )
+
+    def build_graduation() -> dict:
+        return pipeline.stage(
+            "capability-graduation",
+            lambda: CapabilityGraduationProjector(ROOT).build(
+                inventory, graph, capability_convergence, persist=False
+            ),
+            inputs=(inventory, graph, capability_convergence),
+            files=(
+                ROOT / "capability-runtime-matrix.json",
+                ROOT / "capability-graduation.json",
+                *assignment_paths(ROOT),
+            ),
+        )
+
+    graph = build_graph()
+    build_roadmap_quality()
+    repository_convergence = pipeline.stage(
+        "repository-convergence",
+        lambda: RepositoryConvergenceProjector(ROOT).build(inventory),
+        inputs=(inventory,),
+        files=(ROOT / "branch-dispositions.json",),
     )
-    graduation = CapabilityGraduationProjector(ROOT).build(
-        inventory, graph, capability_convergence, persist=False
+    capability_convergence = pipeline.stage(
+        "capability-convergence",
+        lambda: CapabilityConvergenceProjector(ROOT).build(repository_convergence),
+        inputs=(repository_convergence,),
+        files=(ROOT / "capability-runtime-matrix.json",),
     )
+    graduation = build_graduation()
     reconcile_merge_lanes(ROOT, inventory)
     assignment_by_id = {
         value.get("assignment_id"): value
@@ -769,12 +830,7 @@ def rebuild(
     }
     collapsed = []
     collapse_gate = MutationGate(ROOT, source="cycle")
-    for path in sorted((ROOT / "assignments").glob("*.json")):
-        assignment = validate_assignment(
-            json.loads(path.read_text(encoding="utf-8")), ROOT
-        )
-        if is_terminal(assignment):
-            continue
+    for path, assignment in index.active_records():
         lease_id = assignment.get("lease_id")
         if lease_id and (ROOT / "leases" / str(lease_id) / "lease.json").exists():
             continue
@@ -803,28 +859,32 @@ def rebuild(
         save(path, assignment, collapse_gate)
         assignment_by_id[assignment["assignment_id"]] = assignment
         collapsed.append(assignment["assignment_id"])
+    collapse_gate.require(
+        collapse_gate.decide(OperationClass.RECONCILIATION),
+        OperationClass.RECONCILIATION,
+    )
+    index.archive_terminal(now)
     if collapsed:
         inventory["supervisor_assignments"] = list(assignment_by_id.values())
         active = active_assignments()
-        graph = ExecutionGraphBuilder(ROOT).build(
-            inventory,
-            {
-                "available_model_call_budget": remaining,
-                "active_assignments": active,
-                "engineering_metrics": OperationalEventLog(
-                    ROOT, "cycle"
-                ).throughput_metrics(now - 30 * 86_400, now),
-            },
-            persist=False,
-        )
-        RoadmapQualityProjector(ROOT).build(inventory, graph)
-    graduation = CapabilityGraduationProjector(ROOT).build(
-        inventory, graph, capability_convergence, persist=False
+        graph = build_graph()
+        build_roadmap_quality()
+    graduation = build_graduation()
+    mission = pipeline.stage(
+        "active-mission",
+        lambda: ActiveMissionState(ROOT).reconcile(
+            inventory, graph, graduation, persist=False
+        ),
+        memoize=False,
     )
-    mission = ActiveMissionState(ROOT).reconcile(
-        inventory, graph, graduation, persist=False
+    pipeline.stage(
+        "source-generation",
+        lambda: publish_source_generation(
+            inventory, graph, graduation, mission, active
+        ),
+        memoize=False,
     )
-    publish_source_generation(inventory, graph, graduation, mission, active)
+    graph_builder.write_node_cache()
     record_product_heartbeat(ROOT, graduation)
     if reconcile_decisions:
         completed, recovered_graph = recover_pending_decisions_safely()
@@ -834,7 +894,11 @@ def rebuild(
 
 
 def settle_run(
-    run_id: str, result: dict[str, Any], *, status: str = "completed"
+    run_id: str,
+    result: dict[str, Any],
+    *,
+    status: str = "completed",
+    stages: dict[str, dict[str, Any]] | None = None,
 ) -> None:
     """Durably settle a run after its bounded cycle has a deterministic result."""
     path = ROOT / "runs" / f"{run_id}.json"
@@ -848,10 +912,15 @@ def settle_run(
         :4096
     ]
     record["reconciled_at_epoch"] = int(time.time())
+    if stages:
+        record["projection_stages"] = stages
     gate = MutationGate(ROOT, source="cycle")
     decision = gate.decide(OperationClass.RECONCILIATION)
     gate.require(decision, OperationClass.RECONCILIATION)
     write_record(path, record, "axis.external-development-supervisor.run")
+    AccountingLedger(ROOT).record_worker_cycle(
+        run_id, int(record["started_at_epoch"])
+    )
 
 
 def execute_new_assignment(
@@ -859,46 +928,42 @@ def execute_new_assignment(
     manager: HermesWorkerManager,
     supervisorctl: str,
     gate: MutationGate,
+    *,
+    refresh: bool = True,
 ) -> dict:
     path = ROOT / "assignments" / f"{assignment['assignment_id']}.json"
     resource = f"repo:{assignment.get('project') or 'ghostspace/axis'}"
-    claim_command = [
-        sys.executable,
-        supervisorctl,
-        "claim",
-        assignment["assignment_id"],
-        "--run-id",
-        assignment["created_by_run"],
-        "--resource",
-        resource,
-        "--ttl",
-        "1200"
-        if assignment["assignment_type"] in {"read-only-analysis", "no-op-verification"}
-        else "3600",
-    ]
-    if assignment["assignment_type"] in {
+    read_only = assignment["assignment_type"] in {
         "read-only-analysis",
         "no-op-verification",
-    }:
-        claim_command.append("--read-only")
+    }
+    ttl = 1200 if read_only else 3600
     try:
         claim_started = time.time()
-        completed_claim = subprocess.run(
-            claim_command, text=True, capture_output=True, timeout=30
-        )
-        if completed_claim.returncode != 0:
+        try:
+            lease = LeaseController(ROOT).claim(
+                assignment["assignment_id"],
+                assignment["created_by_run"],
+                [resource],
+                ttl=ttl,
+                read_only=read_only,
+            )
+        except Exception as claim_error:
             diagnostic = {
                 "schema": "axis.supervisor.lease-claim-diagnostic.v1",
                 "assignment_id": assignment["assignment_id"],
                 "work_item": assignment["work_item"],
                 "repository": assignment["project"],
-                "argv": claim_command,
+                "operation": {
+                    "claim": assignment["assignment_id"],
+                    "run_id": assignment["created_by_run"],
+                    "ttl": ttl,
+                    "read_only": read_only,
+                },
                 "cwd": str(Path.cwd()),
                 "started_at_epoch": claim_started,
                 "ended_at_epoch": time.time(),
-                "exit_code": completed_claim.returncode,
-                "stdout": completed_claim.stdout,
-                "stderr": completed_claim.stderr,
+                "error": f"{type(claim_error).__name__}: {claim_error}",
                 "timeout": False,
                 "requested_lease_key": assignment["assignment_id"],
                 "requested_scope": [resource],
@@ -908,13 +973,8 @@ def execute_new_assignment(
             diagnostic_path = write_lease_claim_diagnostic(diagnostic)
             raise RuntimeError(
                 f"lease infrastructure failure; diagnostic={diagnostic_path}; "
-                f"stdout={completed_claim.stdout[-1000:]}; "
-                f"stderr={completed_claim.stderr[-1000:]}"
-            )
-        lease_output = completed_claim.stdout
-        lease = validate_record(
-            json.loads(lease_output), "axis.external-development-supervisor.lease"
-        )
+                f"error={str(claim_error)[-1000:]}"
+            ) from claim_error
     except Exception as exc:
         set_lifecycle(assignment, "failed")
         assignment["result_state"] = "failed"
@@ -1103,7 +1163,7 @@ def execute_new_assignment(
             )
             workflow = WorkflowState(ROOT)
             implementation_handoff = workflow.persist_handoff(assignment, result)
-            control = read_record(
+            control = read_snapshot(
                 ROOT / "control.json",
                 "axis.external-development-supervisor.control",
             )
@@ -1129,17 +1189,7 @@ def execute_new_assignment(
         assignment["worker"] = result
         save(path, assignment, gate)
         if is_completed(assignment):
-            subprocess.run(
-                [
-                    sys.executable,
-                    supervisorctl,
-                    "release",
-                    assignment["assignment_id"],
-                    "--token",
-                    token,
-                ],
-                check=True,
-            )
+            LeaseController(ROOT).release(assignment["assignment_id"], token)
             assignment["lease_id"] = None
             assignment["lease_uri"] = None
             save(path, assignment, gate)
@@ -1157,7 +1207,8 @@ def execute_new_assignment(
                 source="cycle",
             )
             record_engineering_retrospective(ROOT, assignment, source="cycle")
-        rebuild()
+        if refresh:
+            rebuild()
         return {
             "result": assignment["lifecycle_state"],
             "assignment": assignment["assignment_id"],
@@ -1186,7 +1237,8 @@ def execute_new_assignment(
             # The failure has already been durably quarantined and its lease
             # released.  Return control to the scheduler so capacity is refilled
             # in this same cycle rather than turning the retry into a sink.
-            rebuild()
+            if refresh:
+                rebuild()
             return {
                 "result": "semantic-escalation-quarantined",
                 "assignment": assignment["assignment_id"],
@@ -1194,6 +1246,82 @@ def execute_new_assignment(
         raise
 
 
+def dispatch_worker_batch(
+    dispatcher: Dispatcher, graph: dict, run_id: str, items: list[dict]
+) -> list[dict]:
+    """Dispatch frontier entries for the worker pool within the model-call budget.
+
+    Every assignment starts at least one model call, so the batch stops once it
+    holds as many assignments as the scheduler has budget for.
+    """
+    budget = (graph.get("scheduler_state") or {}).get("available_model_call_budget")
+    dispatched = []
+    for item in items:
+        if budget is not None and len(dispatched) >= budget:
+            break
+        assignment = dispatcher.dispatch(graph, run_id, item)
+        if assignment is not None:
+            dispatched.append(assignment)
+    return dispatched
+
+
+def execute_assignments_concurrently(
+    assignments: list[dict],
+    manager: HermesWorkerManager,
+    supervisorctl: str,
+    gate: MutationGate,
+    workers: int = EXECUTION_WORKERS,
+) -> dict:
+    """Run dispatched assignments on a worker pool and rebuild once at the end.
+
+    Each assignment still claims its own lease and fencing token inside
+    ``execute_new_assignment``; the dispatcher has already proven the set
+    compatible, so only the shared projection rebuild is deferred until every
+    worker has finished.  ``manager`` and ``gate`` are shared by all worker
+    threads: both only hold configuration set at construction, and the ledgers
+    and records they write are guarded by file locks opened per call, so they
+    need no further locking.
+    """
+
+    def run(assignment: dict) -> dict:
+        try:
+            return {
+                "result": execute_new_assignment(
+                    assignment, manager, supervisorctl, gate, refresh=False
+                )
+            }
+        except Exception as exc:
+            return {
+                "failure": {
+                    "assignment": assignment["assignment_id"],
+                    "error": f"{type(exc).__name__}: {exc}",
+                }
+            }
+
+    started = time.monotonic()
+    with FetchPool(min(workers, len(assignments))) as pool:
+        outcomes = pool.map(run, assignments)
+    elapsed = time.monotonic() - started
+    rebuild()
+    results = [outcome["result"] for outcome in outcomes if "result" in outcome]
+    failures = [outcome["failure"] for outcome in outcomes if "failure" in outcome]
+    completed = sum(value.get("result") in COMPLETED_RESULTS for value in results)
+    return {
+        "result": "worker-pool-partial" if failures else "worker-pool-complete",
+        "batch_size": len(assignments),
+        "assignments": results,
+        "failures": failures,
+        "throughput": {
+            "workers": max(1, min(workers, len(assignments))),
+            "elapsed_seconds": round(elapsed, 3),
+            "completed": completed,
+            "completed_per_hour": round(completed * 3600 / elapsed, 1)
+            if elapsed > 0
+            else None,
+        },
+    }
+
+
 def run_next(run_id: str, hermes: str, supervisorctl: str) -> dict:
     graph = rebuild()
     inventory = read_record(
@@ -1205,33 +1333,17 @@ def run_next(run_id: str, hermes: str, supervisorctl: str) -> dict:
     workflow = WorkflowState(ROOT)
 
     def claim_recovered_integration_lease(assignment: dict) -> dict:
-        command = [
-            sys.executable,
-            supervisorctl,
-            "claim",
-            assignment["assignment_id"],
-            "--run-id",
-            assignment["created_by_run"],
-            "--resource",
-            f"repo:{assignment['project']}",
-            "--ttl",
-            "3600",
-        ]
         try:
-            output = subprocess.check_output(command, text=True, timeout=120)
-        except subprocess.CalledProcessError as exc:
-            detail = str(exc.output or exc.stderr or "").strip()
-            try:
-                detail = str(json.loads(detail).get("error") or detail)
-            except json.JSONDecodeError:
-                pass
+            return LeaseController(ROOT).claim(
+                assignment["assignment_id"],
+                assignment["created_by_run"],
+                [f"repo:{assignment['project']}"],
+                ttl=3600,
+            )
+        except RuntimeError as exc:
             raise RuntimeError(
-                "canonical integration lease claim failed: "
-                f"{detail or f'exit status {exc.returncode}'}"
+                f"canonical integration lease claim failed: {exc}"
             ) from exc
-        return validate_record(
-            json.loads(output), "axis.external-development-supervisor.lease"
-        )
 
     projected_integrations = workflow.project_owned_awaiting_integrations(
         inventory,
@@ -1255,7 +1367,11 @@ def run_next(run_id: str, hermes: str, supervisorctl: str) -> dict:
         # the same current inventory so this cycle's lane consumer can observe
         # the exact durable assignment and lease it just materialized.
         reconcile_merge_lanes(ROOT, inventory)
-    mission = read_mission_record(ROOT / "active-mission.json")
+    mission = read_snapshot(
+        ROOT / "active-mission.json",
+        "axis.external-development-supervisor.active-mission",
+        read_mission_record,
+    )
     if (mission.get("termination_condition") or {}).get("should_terminate"):
         return {
             "result": "mission-terminated",
@@ -1306,16 +1422,12 @@ def run_next(run_id: str, hermes: str, supervisorctl: str) -> dict:
     if deployment_plans and not any(is_integrable(value) for value in active):
         plan = deployment_plans[0]
         existing = []
-        for assignment_path in (ROOT / "assignments").glob("*.json"):
-            value = validate_assignment(
-                json.loads(assignment_path.read_text(encoding="utf-8")), ROOT
-            )
+        for value in AssignmentIndex(ROOT).active():
             if (
                 value.get("assignment_type") == "capability-deployment"
                 and value.get("source_fingerprint") == plan["assignment_id"]
             ):
-                if not is_terminal(value):
-                    existing.append(value)
+                existing.append(value)
         if not existing:
             # A terminal deployment failure owns neither an active lease nor a
             # worker.  The projected runtime convergence requirement remains
@@ -1365,7 +1477,7 @@ def run_next(run_id: str, hermes: str, supervisorctl: str) -> dict:
     gate = MutationGate(ROOT, source="cycle")
     manager = HermesWorkerManager(ROOT, hermes, supervisorctl, gate)
 
-    def dispatch_first_available(current_graph: dict) -> dict | None:
+    def frontier_order(current_graph: dict) -> list[dict]:
         queue_by_ref = {
             item.get("ref"): item
             for item in current_graph.get("executable_queue") or []
@@ -1389,7 +1501,10 @@ def run_next(run_id: str, hermes: str, supervisorctl: str) -> dict:
             for ref in frontier.get("selected") or []
             if ref in queue_by_ref and ref not in selected_refs
         )
-        for item in ordered:
+        return ordered
+
+    def dispatch_first_available(current_graph: dict) -> dict | None:
+        for item in frontier_order(current_graph):
             dispatched = dispatcher.dispatch(current_graph, run_id, item)
             if dispatched is not None:
                 return dispatched
@@ -1487,41 +1602,19 @@ def run_next(run_id: str, hermes: str, supervisorctl: str) -> dict:
         )
         try:
             lease = load_canonical_lease(ROOT, assignment)
-            subprocess.run(
-                [
-                    sys.executable,
-                    supervisorctl,
-                    "heartbeat",
-                    assignment["assignment_id"],
-                    "--token",
-                    lease["fencing_token"],
-                    "--ttl",
-                    "3600",
-                ],
-                check=True,
+            LeaseController(ROOT).heartbeat(
+                assignment["assignment_id"], lease["fencing_token"], 3600
             )
         except CorruptRecordError:
             if inspection["mr"].get("state") != "merged":
                 raise
-            output = subprocess.check_output(
-                [
-                    sys.executable,
-                    supervisorctl,
-                    "claim",
-                    assignment["assignment_id"],
-                    "--run-id",
-                    assignment["created_by_run"],
-                    "--resource",
-                    f"repo:{assignment['project']}",
-                    "--ttl",
-                    "3600",
-                    "--merged-mr-json",
-                    json.dumps(inspection["mr"], sort_keys=True),
-                ],
-                text=True,
-                timeout=120,
+            lease = LeaseController(ROOT).claim(
+                assignment["assignment_id"],
+                assignment["created_by_run"],
+                [f"repo:{assignment['project']}"],
+                ttl=3600,
+                merged_mr=inspection["mr"],
             )
-            lease = json.loads(output)
         pipeline_status = str((inspection.get("pipeline") or {}).get("status") or "")
         integration_result = (
             "integrated-existing"
@@ -1885,18 +1978,13 @@ def run_next(run_id: str, hermes: str, supervisorctl: str) -> dict:
                     )
                 except Exception as exc:
                     verification_error = f"{type(exc).__name__}: {exc}"
-            released = subprocess.run(
-                [
-                    sys.executable,
-                    supervisorctl,
-                    "release",
-                    assignment["assignment_id"],
-                    "--token",
-                    lease["fencing_token"],
-                ],
-                check=False,
-            )
-            cleanup["lease_removed"] = released.returncode == 0
+            try:
+                LeaseController(ROOT).release(
+                    assignment["assignment_id"], lease["fencing_token"]
+                )
+                cleanup["lease_removed"] = True
+            except Exception:  # noqa: BLE001 - recorded as incomplete cleanup
+                cleanup["lease_removed"] = False
             if cleanup["lease_removed"]:
                 assignment["lease_id"] = None
                 assignment["lease_uri"] = None
@@ -2001,17 +2089,12 @@ def run_next(run_id: str, hermes: str, supervisorctl: str) -> dict:
                 set_lifecycle(assignment, "blocked")
                 assignment["result_state"] = "blocked"
                 assignment["work_item_disposition"] = "requires-implementation"
-                subprocess.run(
-                    [
-                        sys.executable,
-                        supervisorctl,
-                        "release",
-                        assignment["assignment_id"],
-                        "--token",
-                        lease["fencing_token"],
-                    ],
-                    check=False,
-                )
+                try:
+                    LeaseController(ROOT).release(
+                        assignment["assignment_id"], lease["fencing_token"]
+                    )
+                except Exception:  # noqa: BLE001 - recovery quarantines the lease
+                    pass
                 assignment["lease_id"] = None
                 assignment["lease_uri"] = None
                 if (assignment.get("authority") or {}).get("state") == "canary":
@@ -2061,6 +2144,19 @@ def run_next(run_id: str, hermes: str, supervisorctl: str) -> dict:
     scheduler = graph.get("scheduler_state") or {}
     if scheduler.get("limiting_constraint") == "model-call-budget-exhausted":
         return {"result": "model-call-budget-exhausted", "remaining": 0}
+    if EXECUTION_WORKERS > 1:
+        # Dispatch sees each new assignment as active, so stage capacity and
+        # conflict domains still hold across the whole batch.
+        dispatched = dispatch_worker_batch(
+            dispatcher, graph, run_id, frontier_order(graph)
+        )
+        if not dispatched:
+            return {"result": "no-assignment", "queue_depth": graph["queue_depth"]}
+        if len(dispatched) == 1:
+            return execute_with_continuation(dispatched[0])
+        return execute_assignments_concurrently(
+            dispatched, manager, supervisorctl, gate
+        )
     queue_by_ref = {
         item.get("ref"): item for item in graph.get("executable_queue") or []
     }
@@ -2115,6 +2211,42 @@ def run_canary(
     return execute_new_assignment(assignment, manager, supervisorctl, gate)
 
 
+def run_cycle(
+    command: str,
+    run_id: str,
+    hermes: str,
+    supervisorctl: str,
+    assignment_id: str | None = None,
+) -> dict:
+    """Run one ``run-next``/``run-canary`` trigger and settle its run record."""
+    with projection_pipeline.cycle_scope() as pipeline:
+        try:
+            if command == "run-canary":
+                if not assignment_id:
+                    raise ValueError("run-canary requires assignment_id")
+                result = run_canary(assignment_id, run_id, hermes, supervisorctl)
+            else:
+                result = run_next(run_id, hermes, supervisorctl)
+        except Exception as exc:
+            settle_run(
+                run_id,
+                {"error": f"{type(exc).__name__}: {exc}"},
+                status="abandoned",
+                stages=pipeline.report(),
+            )
+            raise
+    settle_run(run_id, result, stages=pipeline.report())
+    record_event(
+        ROOT,
+        "cycle_completed",
+        details={"run_id": run_id, "result": result},
+        source="cycle",
+        notify=False,
+    )
+    mission = ActiveMissionState(ROOT).observe(result, source="cycle-response")
+    return {**result, "mission": mission_summary(mission)}
+
+
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("command", choices=("rebuild", "run-next", "run-canary"))
@@ -2134,32 +2266,11 @@ def main() -> int:
         return 0
     if args.command in {"run-next", "run-canary"} and not args.run_id:
         parser.error("run-next requires --run-id")
-    try:
-        if args.command == "run-canary":
-            if not args.assignment_id:
-                parser.error("run-canary requires --assignment-id")
-            result = run_canary(
-                args.assignment_id, args.run_id, args.hermes, args.supervisorctl
-            )
-        else:
-            result = run_next(args.run_id, args.hermes, args.supervisorctl)
-    except Exception as exc:
-        settle_run(
-            args.run_id,
-            {"error": f"{type(exc).__name__}: {exc}"},
-            status="abandoned",
-        )
-        raise
-    settle_run(args.run_id, result)
-    record_event(
-        ROOT,
-        "cycle_completed",
-        details={"run_id": args.run_id, "result": result},
-        source="cycle",
-        notify=False,
+    if args.command == "run-canary" and not args.assignment_id:
+        parser.error("run-canary requires --assignment-id")
+    result = run_cycle(
+        args.command, args.run_id, args.hermes, args.supervisorctl, args.assignment_id
     )
-    mission = ActiveMissionState(ROOT).observe(result, source="cycle-response")
-    result = {**result, "mission": mission_summary(mission)}
     print(json.dumps(result, sort_keys=True))
     return 0
 
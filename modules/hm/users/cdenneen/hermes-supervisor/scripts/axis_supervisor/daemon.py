@@ -0,0 +1,237 @@
+import argparse
+import fcntl
+import json
+import os
+import socket
+import socketserver
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, cast
+
+if __package__ in {None, ""}:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+ROOT = Path(
+    os.environ.get(
+        "AXIS_SUPERVISOR_ROOT",
+        Path.home() / ".hermes" / "supervisor" / "axis-development-supervisor",
+    )
+)
+SOCKET_PATH = Path(
+    os.environ.get("AXIS_SUPERVISOR_DAEMON_SOCKET", ROOT / "supervisor.sock")
+)
+LOCK_PATH = ROOT / "supervisor-daemon.lock"
+TRIGGER_TIMEOUT = int(os.environ.get("AXIS_SUPERVISOR_DAEMON_TIMEOUT", "3600"))
+COMMANDS = ("ping", "rebuild", "run-next", "run-canary")
+DEFAULT_SUPERVISORCTL = str(
+    Path.home() / ".hermes" / "scripts" / "axis-development-supervisorctl.py"
+)
+WARM_RECORDS = (
+    ("control.json", "axis.external-development-supervisor.control"),
+    ("inventory.json", "axis.external-development-supervisor.inventory"),
+    ("execution-graph.json", "axis.external-development-supervisor.execution-graph"),
+    (
+        "capability-graduation.json",
+        "axis.external-development-supervisor.capability-graduation",
+    ),
+)
+
+
+class DaemonUnavailable(RuntimeError):
+    pass
+
+
+class DaemonBusy(RuntimeError):
+    pass
+
+
+def trigger(
+    command: str,
+    *,
+    socket_path: Path = SOCKET_PATH,
+    timeout: float = TRIGGER_TIMEOUT,
+    **arguments: Any,
+) -> Any:
+    """Send one trigger to a running daemon and return its result.
+
+    Raises ``DaemonUnavailable`` only when no daemon accepts the connection,
+    before anything was sent, so callers can fall back to a cold process.
+    ``DaemonBusy`` means the daemon rejected the trigger without starting it
+    because another one is running.  A timeout after the trigger was sent is
+    re-raised as ``TimeoutError``: the daemon may still be running it.
+    """
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(timeout)
+    try:
+        try:
+            client.connect(str(socket_path))
+        except (FileNotFoundError, ConnectionRefusedError, TimeoutError) as exc:
+            raise DaemonUnavailable(
+                f"supervisor daemon is not listening: {socket_path}"
+            ) from exc
+        request = {"command": command, **arguments}
+        client.sendall((json.dumps(request, sort_keys=True) + "\n").encode("utf-8"))
+        with client.makefile("rb") as stream:
+            line = stream.readline()
+    finally:
+        client.close()
+    if not line:
+        raise RuntimeError(f"supervisor daemon closed the {command} trigger")
+    response = json.loads(line)
+    if response.get("busy"):
+        raise DaemonBusy(f"supervisor daemon is busy: {response['error']}")
+    if not response.get("ok"):
+        raise RuntimeError(f"supervisor daemon {command} failed: {response['error']}")
+    return response["result"]
+
+
+class TriggerHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        server = cast("SupervisorDaemon", self.server)
+        try:
+            server.verify_peer(self.connection)
+            request = json.loads(self.rfile.readline())
+            if not isinstance(request, dict):
+                raise ValueError("daemon trigger must be a JSON object")
+            response = {"ok": True, "result": server.handle_trigger(request)}
+        except DaemonBusy as exc:
+            response = {"ok": False, "busy": True, "error": str(exc)}
+        except Exception as exc:  # noqa: BLE001 - reported to the triggering client
+            response = {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+        self.wfile.write((json.dumps(response, sort_keys=True) + "\n").encode("utf-8"))
+
+
+class SupervisorDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Long-lived supervisor process that runs cycle triggers in-process.
+
+    Imports, compiled schema validators and the validated control, inventory
+    and graph records stay warm between triggers.  Connections are accepted
+    concurrently but only one trigger runs at a time: a trigger arriving while
+    another runs is rejected as busy rather than queued, so its client decides
+    whether to wait and retry.  Every cycle trigger passes the
+    ``MutationGate`` first, and lease operations still take the lease
+    controller lock.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, root: Path = ROOT):
+        # The cycle imports are the cold-start cost the daemon amortizes; the
+        # trigger client above must stay importable without them.
+        from axis_supervisor import cycle
+        from axis_supervisor.mutation import MutationGate, OperationClass
+        from axis_supervisor.schema_registry import read_record, warm_schemas
+
+        self.root = root
+        self.cycle = cycle
+        self.gate = MutationGate(root, source="cycle")
+        self.operation = OperationClass.RECONCILIATION
+        self.started = time.monotonic()
+        self.triggers = 0
+        self.running = threading.Lock()
+        warm_schemas(root / "control.json")
+        for name, schema in WARM_RECORDS:
+            if (root / name).exists():
+                read_record(root / name, schema)
+        super().__init__(str(socket_path), TriggerHandler)
+
+    def verify_peer(self, connection: socket.socket) -> None:
+        if not hasattr(socket, "SO_PEERCRED"):
+            return
+        credentials = connection.getsockopt(
+            socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")
+        )
+        _pid, uid, _gid = struct.unpack("3i", credentials)
+        if uid != os.getuid():
+            raise PermissionError(f"daemon trigger from foreign uid {uid}")
+
+    def handle_trigger(self, request: dict[str, Any]) -> Any:
+        command = request.get("command")
+        if command == "ping":
+            return {
+                "pid": os.getpid(),
+                "triggers": self.triggers,
+                "uptime_seconds": round(time.monotonic() - self.started, 3),
+            }
+        if command not in COMMANDS:
+            raise ValueError(f"unsupported daemon command: {command}")
+        if command != "rebuild" and not request.get("run_id"):
+            raise ValueError(f"{command} requires run_id")
+        if command == "run-canary" and not request.get("assignment_id"):
+            raise ValueError("run-canary requires assignment_id")
+        if not self.running.acquire(blocking=False):
+            raise DaemonBusy(f"another trigger is running; {command} was not started")
+        try:
+            self.gate.require(self.gate.decide(self.operation), self.operation)
+            self.triggers += 1
+            if command == "rebuild":
+                inventory_path = request.get("inventory_path")
+                return self.cycle.rebuild(
+                    inventory_path=Path(inventory_path) if inventory_path else None
+                )
+            return self.cycle.run_cycle(
+                command,
+                request["run_id"],
+                request.get("hermes") or "hermes",
+                request.get("supervisorctl") or DEFAULT_SUPERVISORCTL,
+                request.get("assignment_id"),
+            )
+        finally:
+            self.running.release()
+
+
+def serve(socket_path: Path = SOCKET_PATH, root: Path = ROOT) -> None:
+    root.mkdir(mode=0o700, parents=True, exist_ok=True)
+    lock_path = root / LOCK_PATH.name
+    with lock_path.open("a", encoding="utf-8") as lock:
+        os.chmod(lock_path, 0o600)
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError as exc:
+            raise RuntimeError("another supervisor daemon is running") from exc
+        # Holding the lock proves any existing socket belongs to a dead daemon.
+        socket_path.unlink(missing_ok=True)
+        server = SupervisorDaemon(socket_path, root)
+        try:
+            os.chmod(socket_path, 0o600)
+            server.serve_forever()
+        finally:
+            server.server_close()
+            socket_path.unlink(missing_ok=True)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    subcommands = parser.add_subparsers(dest="action", required=True)
+    subcommands.add_parser("serve")
+    request = subcommands.add_parser("trigger")
+    request.add_argument("command", choices=COMMANDS)
+    request.add_argument("--inventory-path")
+    request.add_argument("--run-id")
+    request.add_argument("--assignment-id")
+    request.add_argument("--hermes")
+    request.add_argument("--supervisorctl")
+    args = parser.parse_args()
+    if args.action == "serve":
+        serve()
+        return 0
+    arguments = {
+        key: value
+        for key, value in {
+            "inventory_path": args.inventory_path,
+            "run_id": args.run_id,
+            "assignment_id": args.assignment_id,
+            "hermes": args.hermes,
+            "supervisorctl": args.supervisorctl,
+        }.items()
+        if value is not None
+    }
+    print(json.dumps(trigger(args.command, **arguments), sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
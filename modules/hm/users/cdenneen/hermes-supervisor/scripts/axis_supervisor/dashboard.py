@@ -1,6 +1,8 @@
 import hashlib
+import inspect
 import json
 import re
+import sys
 from pathlib import Path
 
 from . import progress_coherence
@@ -20,6 +22,22 @@ DASHBOARD_PROOF_SECTIONS = (
     "RECENT PRODUCT PROGRESS",
 )
 
+# Cached section text is only reused by the renderer that produced it, which
+# includes the modules whose helpers shape the rendered sections.
+RENDERER_DIGEST = hashlib.sha256(
+    b"".join(
+        Path(inspect.getfile(source)).read_bytes()
+        for source in (
+            sys.modules[__name__],
+            progress_coherence,
+            read_capability_graduation,
+            DecisionStore,
+            read_mission_record,
+            read_record,
+        )
+    )
+).hexdigest()
+
 PRODUCT_CAPABILITIES = (
     ("CLI", "CLI"),
     ("Node", "Node Runtime"),
@@ -161,65 +179,46 @@ def _milestone_lines(semantics: dict, graduation: dict) -> list[str]:
     return lines or ["• No milestone evidence is available"]
 
 
-def render_executive_dashboard(
-    root: Path,
-    inventory: dict,
-    graph: dict,
-    semantics: dict,
-    events: list[dict],
-) -> tuple[str, list[dict], str]:
-    graduation_path = root / "capability-graduation.json"
-    graduation = (
-        read_capability_graduation(graduation_path)
-        if graduation_path.exists()
-        else {}
-    )
-    convergence = _load(
-        root,
-        "capability-convergence.json",
-        "axis.external-development-supervisor.capability-convergence",
+def _axis_section(value: dict) -> str:
+    primary = value["primary"]
+    graduated = int(primary.get("count") or 0)
+    capability_total = int(primary.get("denominator") or 0)
+    risk = value["risk"]
+    return (
+        (value["notice"] + "\n" if value["notice"] else "")
+        + f"Capabilities `{progress_bar(graduated, capability_total)}` *{graduated}/{capability_total} graduated* "
+        f"({_confidence(primary.get('percent')):g}%)\nProduction confidence *{_confidence(value['production_confidence']):g}%* | "
+        f"Operator confidence *{confidence_text(value['operator_confidence'])}* | "
+        f"Risk *{public_text(risk.get('level') or 'unknown')} ({int(risk.get('score') or 0)}/100)*\n"
+        "Drill down: `!axis capabilities`, `!axis risk`"
     )
-    mission_path = root / "active-mission.json"
-    mission = read_mission_record(mission_path) if mission_path.exists() else {}
-    coherence = progress_coherence(inventory, graph, graduation, mission)
-    progress_notice = None
-    if not coherence["trusted"]:
-        progress_notice = (
-            "⚠️ Supervisor progress state is reconciling; capability and mission "
-            "claims are withheld until source generations agree ("
-            + ", ".join(coherence["failures"])
-            + ")."
-        )
-        graduation = {}
-        mission = {}
 
-    total = int(semantics.get("total_governed_items") or 0)
-    verified = int(
-        ((semantics.get("composition") or {}).get("verified_complete") or {}).get(
-            "count"
-        )
-        or 0
+
+def _roadmap_section(value: dict) -> str:
+    return (
+        f"Verified product outcomes `{progress_bar(value['verified'], value['total'])}` "
+        f"*{value['verified']}/{value['total']}*\n"
+        + "\n".join(_milestone_lines(value["semantics"], value["graduation"]))
+        + "\nDrill down: `!axis milestones` or `!axis milestone AX-M4`"
     )
-    primary = graduation.get("primary_kpi") or {}
-    graduated = int(primary.get("count") or 0)
-    capability_total = int(primary.get("denominator") or 0)
-    capability_percent = _confidence(primary.get("percent"))
-    production_confidence = _confidence(graduation.get("production_confidence"))
-    operator_confidence = graduation.get("operator_confidence")
-    risk = graduation.get("program_risk") or {}
 
+
+def _capabilities_section(value: dict) -> str:
     capability_by_name = {
-        str(value.get("capability")): value
-        for value in graduation.get("capabilities") or []
+        str(item.get("capability")): item for item in value["capabilities"]
     }
-    capability_lines = [
-        _capability_line(label, capability_by_name.get(name) or {})
-        for label, name in PRODUCT_CAPABILITIES
-    ]
+    return (
+        "\n".join(
+            _capability_line(label, capability_by_name.get(name) or {})
+            for label, name in PRODUCT_CAPABILITIES
+        )
+        + "\nDrill down: `!axis capability CLI` (also Node, Web, Desktop, HUD, Neural)"
+    )
+
 
-    actions = mission.get("generated_actions") or []
+def _active_work_section(value: dict) -> str:
     active_lines = []
-    for action in actions[:5]:
+    for action in value["actions"]:
         capabilities = action.get("expected_capabilities") or []
         active_lines.append(
             f"• *{public_text(action.get('target') or 'Product work')}* — "
@@ -228,10 +227,14 @@ def render_executive_dashboard(
         )
     if not active_lines:
         active_lines.append("• No active product change; evidence reconciliation may continue")
+    return (
+        "\n".join(active_lines)
+        + "\nDrill down to source-linked evidence with `!axis inspect group/project#id`"
+    )
 
-    runtimes = {
-        str(value.get("runtime")): value for value in convergence.get("runtimes") or []
-    }
+
+def _deployment_section(value: dict) -> str:
+    runtimes = value["runtimes"]
     ghost = runtimes.get("ghost")
     ghost_web_verified = bool(
         ghost
@@ -263,14 +266,116 @@ def render_executive_dashboard(
         f"• *macbookpro* — {_runtime_status(runtimes.get('macbookpro'))}",
         f"• *mbair* — {_runtime_status(runtimes.get('mbair'), offline=True)} (optional)",
     ]
+    return "\n".join(deployment_lines) + "\nDrill down: `!axis deployments`"
+
 
-    validation_streams = graduation.get("validation_streams") or []
+def _validation_section(value: dict) -> str:
     validation_lines = [
-        f"• *{public_text(value.get('title') or value.get('stream'))}* — "
-        f"{public_text(value.get('status') or 'pending')} | "
-        f"Evidence: `{public_text((value.get('evidence') or {}).get('uri') or 'not yet available')}`"
-        for value in validation_streams
+        f"• *{public_text(item.get('title') or item.get('stream'))}* — "
+        f"{public_text(item.get('status') or 'pending')} | "
+        f"Evidence: `{public_text((item.get('evidence') or {}).get('uri') or 'not yet available')}`"
+        for item in value["streams"]
     ] or ["• No product validation evidence is available"]
+    return "\n".join(validation_lines) + "\nDrill down: `!axis validation`"
+
+
+def _decisions_section(value: dict) -> str:
+    decision_lines = [
+        f"• `{public_text(decision_id)}` — {public_text(requested)}"
+        for decision_id, requested in value["decisions"]
+    ] or ["• No Product Owner decision is pending"]
+    return "\n".join(decision_lines) + "\nDrill down: `!axis decisions`"
+
+
+def _recent_section(value: dict) -> str:
+    return "\n".join(_recent_lines(value["events"])) + "\nDrill down: `!axis recent`"
+
+
+SECTION_RENDERERS = dict(
+    zip(
+        DASHBOARD_PROOF_SECTIONS,
+        (
+            _axis_section,
+            _roadmap_section,
+            _capabilities_section,
+            _active_work_section,
+            _deployment_section,
+            _validation_section,
+            _decisions_section,
+            _recent_section,
+        ),
+    )
+)
+RECENT_EVENT_TYPES = frozenset(
+    {
+        "implementation_completed",
+        "mr_created",
+        "mr_merged",
+        "post_main_verified",
+        "capability_deployment_verified",
+    }
+)
+
+
+def section_digest(value: dict) -> str:
+    return hashlib.sha256(
+        json.dumps(value, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def render_executive_dashboard(
+    root: Path,
+    inventory: dict,
+    graph: dict,
+    semantics: dict,
+    events: list[dict],
+    cache: dict | None = None,
+) -> tuple[str, list[dict], str]:
+    """Render the product dashboard from one input slice per section.
+
+    ``cache`` maps section titles to ``{"digest", "text"}`` from an earlier
+    render; a section whose input slice digest is unchanged reuses its text.
+    The mapping is updated in place with the digests rendered now.
+    """
+    graduation_path = root / "capability-graduation.json"
+    graduation = (
+        read_capability_graduation(graduation_path)
+        if graduation_path.exists()
+        else {}
+    )
+    convergence = _load(
+        root,
+        "capability-convergence.json",
+        "axis.external-development-supervisor.capability-convergence",
+    )
+    mission_path = root / "active-mission.json"
+    mission = read_mission_record(mission_path) if mission_path.exists() else {}
+    coherence = progress_coherence(inventory, graph, graduation, mission)
+    progress_notice = None
+    if not coherence["trusted"]:
+        progress_notice = (
+            "⚠️ Supervisor progress state is reconciling; capability and mission "
+            "claims are withheld until source generations agree ("
+            + ", ".join(coherence["failures"])
+            + ")."
+        )
+        graduation = {}
+        mission = {}
+
+    total = int(semantics.get("total_governed_items") or 0)
+    verified = int(
+        ((semantics.get("composition") or {}).get("verified_complete") or {}).get(
+            "count"
+        )
+        or 0
+    )
+    primary = graduation.get("primary_kpi") or {}
+    graduated = int(primary.get("count") or 0)
+    capability_total = int(primary.get("denominator") or 0)
+    capability_percent = _confidence(primary.get("percent"))
+    production_confidence = _confidence(graduation.get("production_confidence"))
+    operator_confidence = graduation.get("operator_confidence")
+    risk = graduation.get("program_risk") or {}
 
     decision_store = DecisionStore(root)
     decisions = []
@@ -281,56 +386,53 @@ def render_executive_dashboard(
         decision_id = str(packet.get("decision_id") or node.get("ref") or "")
         if decision_store.load(decision_id) is not None:
             continue
-        decisions.append(
-            f"• `{public_text(decision_id)}` — {public_text(packet.get('decision_requested'))}"
-        )
-    decision_lines = decisions or ["• No Product Owner decision is pending"]
-
-    sections = (
-        (
-            "AXIS",
-            (progress_notice + "\n" if progress_notice else "")
-            + f"Capabilities `{progress_bar(graduated, capability_total)}` *{graduated}/{capability_total} graduated* "
-            f"({capability_percent:g}%)\nProduction confidence *{production_confidence:g}%* | "
-            f"Operator confidence *{confidence_text(operator_confidence)}* | "
-            f"Risk *{public_text(risk.get('level') or 'unknown')} ({int(risk.get('score') or 0)}/100)*\n"
-            "Drill down: `!axis capabilities`, `!axis risk`",
-        ),
-        (
-            "ROADMAP",
-            f"Verified product outcomes `{progress_bar(verified, total)}` *{verified}/{total}*\n"
-            + "\n".join(_milestone_lines(semantics, graduation))
-            + "\nDrill down: `!axis milestones` or `!axis milestone AX-M4`",
-        ),
-        (
-            "CAPABILITIES",
-            "\n".join(capability_lines)
-            + "\nDrill down: `!axis capability CLI` (also Node, Web, Desktop, HUD, Neural)",
-        ),
-        (
-            "ACTIVE PRODUCT WORK",
-            "\n".join(active_lines)
-            + "\nDrill down to source-linked evidence with `!axis inspect group/project#id`",
-        ),
-        (
-            "DEPLOYMENT RING",
-            "\n".join(deployment_lines) + "\nDrill down: `!axis deployments`",
-        ),
-        (
-            "VALIDATION",
-            "\n".join(validation_lines) + "\nDrill down: `!axis validation`",
-        ),
-        (
-            "DECISIONS",
-            "\n".join(decision_lines) + "\nDrill down: `!axis decisions`",
-        ),
-        (
-            "RECENT PRODUCT PROGRESS",
-            "\n".join(_recent_lines(events)) + "\nDrill down: `!axis recent`",
-        ),
-    )
-    if tuple(title for title, _text in sections) != DASHBOARD_PROOF_SECTIONS:
-        raise ValueError("product dashboard section contract changed")
+        decisions.append((decision_id, packet.get("decision_requested")))
+
+    slices = {
+        "AXIS": {
+            "notice": progress_notice,
+            "primary": primary,
+            "production_confidence": graduation.get("production_confidence"),
+            "operator_confidence": operator_confidence,
+            "risk": risk,
+        },
+        "ROADMAP": {
+            "verified": verified,
+            "total": total,
+            "semantics": {
+                "complete_roadmap": semantics.get("complete_roadmap") or []
+            },
+            "graduation": {"milestones": graduation.get("milestones") or []},
+        },
+        "CAPABILITIES": {"capabilities": graduation.get("capabilities") or []},
+        "ACTIVE PRODUCT WORK": {
+            "actions": (mission.get("generated_actions") or [])[:5]
+        },
+        "DEPLOYMENT RING": {
+            "runtimes": {
+                str(value.get("runtime")): value
+                for value in convergence.get("runtimes") or []
+            }
+        },
+        "VALIDATION": {"streams": graduation.get("validation_streams") or []},
+        "DECISIONS": {"decisions": decisions},
+        "RECENT PRODUCT PROGRESS": {
+            "events": [
+                event
+                for event in events
+                if str(event.get("event_type") or "") in RECENT_EVENT_TYPES
+            ][-4:]
+        },
+    }
+    cache = {} if cache is None else cache
+    sections = []
+    for title in DASHBOARD_PROOF_SECTIONS:
+        digest = section_digest(slices[title])
+        cached = cache.get(title) or {}
+        if cached.get("digest") != digest:
+            cached = {"digest": digest, "text": SECTION_RENDERERS[title](slices[title])}
+            cache[title] = cached
+        sections.append((title, cached["text"]))
 
     fallback = (
         ("AXIS | Progress reconciling | " if progress_notice else "AXIS | ")
@@ -4,17 +4,17 @@ import uuid
 from pathlib import Path
 
 from .assignment_grants import create_grant
+from .assignment_index import AssignmentIndex, assignment_paths
 from .canonical_work_item import projection_for
 from .capability_graduation import read_capability_graduation
 from .frontier import compatible
-from .lifecycle import is_terminal
 from .missions import read_mission_record
 from .models import validate_assignment
 from .mutation import MutationGate, OperationClass
 from .noop import is_suppressed_no_op, no_op_fingerprint
 from .observability import record_event
 from .repository_ownership import resolve_repository_ownership
-from .schema_registry import RecordError, read_record, write_record
+from .schema_registry import RecordError, read_record, read_snapshot, write_record
 from .semantic_escalation import pending as pending_semantic_escalation
 
 READ_ONLY_ASSIGNMENT_TYPES = {"read-only-analysis", "no-op-verification"}
@@ -44,15 +44,8 @@ class Dispatcher:
         self.gate = MutationGate(root, source="dispatcher")
 
     def active(self) -> list[dict]:
-        values = []
-        for path in self.assignments.glob("*.json"):
-            value = validate_assignment(
-                json.loads(path.read_text(encoding="utf-8")), self.root
-            )
-            if not is_terminal(value):
-                values.append(value)
         return sorted(
-            values,
+            AssignmentIndex(self.root).active(),
             key=lambda value: (
                 int(value.get("last_integration_check_epoch") or 0),
                 int(value.get("created_at_epoch") or 0),
@@ -65,7 +58,11 @@ class Dispatcher:
         if not path.exists():
             return None, "mission-unavailable:missing"
         try:
-            mission = read_mission_record(path)
+            mission = read_snapshot(
+                path,
+                "axis.external-development-supervisor.active-mission",
+                read_mission_record,
+            )
         except (OSError, ValueError, json.JSONDecodeError) as exc:
             return None, f"mission-unavailable:{type(exc).__name__}"
         item_ref = item.get("ref")
@@ -212,7 +209,7 @@ class Dispatcher:
             return False
         graduation = read_capability_graduation(path)
         current = graduation.get("effectiveness_fingerprint")
-        for assignment_path in self.assignments.glob("*.json"):
+        for assignment_path in assignment_paths(self.root):
             assignment = validate_assignment(
                 json.loads(assignment_path.read_text(encoding="utf-8")), self.root
             )
@@ -237,7 +234,7 @@ class Dispatcher:
         identity = item.get("finding_identity")
         if not identity:
             return False
-        for assignment_path in self.assignments.glob("*.json"):
+        for assignment_path in assignment_paths(self.root):
             assignment = validate_assignment(
                 json.loads(assignment_path.read_text(encoding="utf-8")), self.root
             )
@@ -247,7 +244,9 @@ class Dispatcher:
 
     def dispatch(self, graph: dict, run_id: str, selected: dict | None = None) -> dict | None:
         active = self.active()
-        control = json.loads((self.root / "control.json").read_text(encoding="utf-8"))
+        control = read_snapshot(
+            self.root / "control.json", "axis.external-development-supervisor.control"
+        )
         if len(active) >= int(control.get("max_active_assignments", 1)) or (
             selected is None and not graph.get("executable_queue")
         ):
@@ -407,7 +406,7 @@ class Dispatcher:
         }
         if assignment["assignment_type"] == "code-implementation":
             prior_failures = []
-            for prior_path in self.assignments.glob("*.json"):
+            for prior_path in assignment_paths(self.root):
                 prior = validate_assignment(
                     json.loads(prior_path.read_text(encoding="utf-8")), self.root
                 )
@@ -471,7 +470,7 @@ class Dispatcher:
 
     def completed_no_ops(self) -> list[dict]:
         values = []
-        for path in self.assignments.glob("*.json"):
+        for path in assignment_paths(self.root):
             value = validate_assignment(
                 json.loads(path.read_text(encoding="utf-8")), self.root
             )
@@ -0,0 +1,129 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Sequence
+
+
+class RequestBudget:
+    """Token bucket shared by every worker that calls the same API host."""
+
+    def __init__(self, requests_per_minute: int, burst: int = 1):
+        self.rate = requests_per_minute / 60.0 if requests_per_minute > 0 else 0.0
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Reserve one request slot and return the seconds spent waiting for it."""
+        if not self.rate:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.burst), self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if delay:
+            time.sleep(delay)
+        return delay
+
+
+class FetchPool:
+    """Bounded fan-out whose results always come back in submission order.
+
+    A single worker executes every job inline on the calling thread, which is
+    the serial reference behaviour the concurrent mode must reproduce.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        *,
+        host_limits: dict[str, int] | None = None,
+        requests_per_minute: int = 0,
+    ):
+        self.workers = max(1, int(workers))
+        self._executor = (
+            ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="axis-fetch"
+            )
+            if self.workers > 1
+            else None
+        )
+        self._host_slots = {
+            host: threading.BoundedSemaphore(max(1, int(limit)))
+            for host, limit in (host_limits or {}).items()
+        }
+        self._budgets = {
+            host: RequestBudget(requests_per_minute, burst=max(1, int(limit)))
+            for host, limit in (host_limits or {}).items()
+        }
+        self._counter_lock = threading.Lock()
+        self.timings: dict[str, float] = {}
+        self.requests: dict[str, int] = {}
+        self.throttled_seconds = 0.0
+
+    def __enter__(self) -> "FetchPool":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def limited(self, host: str, request: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap ``request`` so calls respect the host's slot and rate budget."""
+        slots = self._host_slots.get(host)
+        budget = self._budgets.get(host)
+
+        def call(*args, **kwargs):
+            if slots is None or budget is None:
+                return request(*args, **kwargs)
+            with slots:
+                waited = budget.acquire()
+                with self._counter_lock:
+                    self.requests[host] = self.requests.get(host, 0) + 1
+                    self.throttled_seconds += waited
+                return request(*args, **kwargs)
+
+        return call
+
+    def run(self, jobs: Sequence[Callable[[], Any]]) -> list[Any]:
+        """Run jobs concurrently and re-raise the first failure in job order."""
+        if self._executor is None:
+            return [job() for job in jobs]
+        futures: list[Future] = [self._executor.submit(job) for job in jobs]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+    def map(self, function: Callable[[Any], Any], values: Sequence[Any]) -> list[Any]:
+        return self.run([lambda value=value: function(value) for value in values])
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.timings[name] = round(
+                self.timings.get(name, 0.0) + time.monotonic() - started, 3
+            )
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "phase_seconds": dict(self.timings),
+            "requests": dict(sorted(self.requests.items())),
+            "throttled_seconds": round(self.throttled_seconds, 3),
+        }
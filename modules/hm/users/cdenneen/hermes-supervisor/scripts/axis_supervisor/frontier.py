@@ -83,6 +83,76 @@ def compatible(left: dict, right: dict) -> bool:
     return not any(_path_overlaps(a, b) for a in left_paths for b in right_paths)
 
 
+class _PathNode:
+    __slots__ = ("children", "first", "claimed")
+
+    def __init__(self, first: int):
+        self.children: dict[str, "_PathNode"] = {}
+        # Claims arrive in order, so the first index to touch a node is the
+        # earliest claim at or below it.
+        self.first = first
+        self.claimed: int | None = None
+
+
+class ClaimedPaths:
+    """Per-repository path tries answering ``compatible`` against every claim.
+
+    ``conflict`` returns the earliest added value whose paths overlap, which is
+    the value the pairwise ``compatible`` scan over the same list finds first.
+    """
+
+    def __init__(self):
+        self.values: list[dict] = []
+        self._roots: dict[str, _PathNode] = {}
+        self._wildcards: dict[str, int] = {}
+
+    @staticmethod
+    def _key(value: dict) -> tuple[str, list[str]]:
+        repository = str(value.get("project") or value.get("repository") or "")
+        return repository, [path.rstrip("/") for path in _paths(value)] or ["*"]
+
+    def add(self, value: dict) -> None:
+        index = len(self.values)
+        self.values.append(value)
+        repository, paths = self._key(value)
+        root = self._roots.get(repository)
+        if root is None:
+            root = self._roots[repository] = _PathNode(index)
+        for path in paths:
+            if path == "*":
+                self._wildcards.setdefault(repository, index)
+                continue
+            node = root
+            for part in path.split("/"):
+                child = node.children.get(part)
+                if child is None:
+                    child = node.children[part] = _PathNode(index)
+                node = child
+            if node.claimed is None:
+                node.claimed = index
+
+    def conflict(self, value: dict) -> dict | None:
+        repository, paths = self._key(value)
+        root = self._roots.get(repository)
+        if root is None:
+            return None
+        found = [self._wildcards[repository]] if repository in self._wildcards else []
+        for path in paths:
+            if path == "*":
+                found.append(root.first)
+                continue
+            node = root
+            for part in path.split("/"):
+                node = node.children.get(part)
+                if node is None:
+                    break
+                if node.claimed is not None:
+                    found.append(node.claimed)
+            else:
+                found.append(node.first)
+        return self.values[min(found)] if found else None
+
+
 def _quarantined_refs(root: Path, now: int) -> set[str]:
     path = root / "quarantines.json"
     if not path.exists():
@@ -113,12 +183,14 @@ def build_executable_frontier(
         if value.get("lifecycle_state") not in TERMINAL_STATES
     ]
     in_use = {stage: 0 for stage in STAGE_CAPACITIES}
+    claimed = ClaimedPaths()
     for value in active:
         in_use[stage_for(value)] += 1
+        claimed.add(value)
+    occupied = dict(in_use)
 
     entries = []
     selected: list[str] = []
-    selected_values: list[dict] = []
     deferred = []
     seen: set[str] = set()
     quarantined = _quarantined_refs(root, now)
@@ -147,19 +219,12 @@ def build_executable_frontier(
                 {"entry_id": entry_id, "reason": "quarantined", "conflicts_with": None}
             )
             continue
-        if in_use[stage] + sum(stage_for(item) == stage for item in selected_values) >= STAGE_CAPACITIES[stage]:
+        if occupied[stage] >= STAGE_CAPACITIES[stage]:
             deferred.append(
                 {"entry_id": entry_id, "reason": "stage-capacity", "conflicts_with": None}
             )
             continue
-        conflict = next(
-            (
-                item
-                for item in [*active, *selected_values]
-                if not compatible(value, item)
-            ),
-            None,
-        )
+        conflict = claimed.conflict(value)
         if conflict is not None:
             deferred.append(
                 {
@@ -172,7 +237,8 @@ def build_executable_frontier(
             )
             continue
         selected.append(entry_id)
-        selected_values.append(value)
+        occupied[stage] += 1
+        claimed.add(value)
 
     return {
         "schema": FRONTIER_SCHEMA,
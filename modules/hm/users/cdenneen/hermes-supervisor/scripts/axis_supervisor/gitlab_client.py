@@ -0,0 +1,234 @@
+import http.client
+import json
+import os
+import queue
+import re
+import shutil
+import socket
+import subprocess
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+from urllib.parse import urlsplit
+
+GITLAB_CLIENT = os.environ.get("AXIS_SUPERVISOR_GITLAB_CLIENT", "http")
+GITLAB_API_URL = os.environ.get("AXIS_SUPERVISOR_GITLAB_API_URL")
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# A 304 need not repeat these, so they are kept with the cached body.
+CACHED_HEADERS = ("link",)
+_NEXT_LINK = re.compile(r'<([^>]+)>\s*;\s*rel="?next"?')
+
+
+class GitLabAPIError(RuntimeError):
+    def __init__(self, status: int, target: str, body: str = ""):
+        super().__init__(f"GitLab API {status} for {target}: {body[:200]}")
+        self.status = status
+        self.target = target
+
+
+def resolve_token(host: str, glab: str | None = None) -> str | None:
+    """Return an API token from the environment or the glab configuration."""
+    for name in ("AXIS_SUPERVISOR_GITLAB_TOKEN", "GITLAB_TOKEN"):
+        value = os.environ.get(name)
+        if value:
+            return value
+    executable = glab or shutil.which("glab")
+    if not executable:
+        return None
+    try:
+        value = subprocess.check_output(
+            [executable, "config", "get", "token", "--host", host],
+            text=True,
+            stderr=subprocess.DEVNULL,
+            timeout=30,
+        ).strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return value or None
+
+
+class GitLabClient:
+    """Keep-alive GitLab REST reader with the calling convention of ``glab api``.
+
+    ``client(path, paginate=False, timeout=90)`` returns decoded JSON exactly
+    like the glab wrapper: paginated reads follow ``Link: rel="next"`` and are
+    flattened into one list, and exceeding ``timeout`` raises
+    ``subprocess.TimeoutExpired`` so callers keep their timeout accounting.
+    """
+
+    def __init__(
+        self,
+        host: str = "gitlab.com",
+        token: str | None = None,
+        *,
+        base_url: str | None = None,
+        pool_size: int = 8,
+        retries: int = 3,
+        backoff_seconds: float = 0.5,
+        etag_cache_size: int = 1024,
+    ):
+        base = urlsplit(base_url or f"https://{host}/api/v4/")
+        if base.scheme not in {"http", "https"} or not base.netloc:
+            raise ValueError(f"invalid GitLab API base URL: {base_url}")
+        self.scheme = base.scheme
+        self.netloc = base.netloc
+        self.prefix = base.path.rstrip("/") + "/"
+        self.token = token
+        self.retries = retries
+        self.backoff_seconds = backoff_seconds
+        self._pool: queue.LifoQueue = queue.LifoQueue(maxsize=max(1, pool_size))
+        self._etags: OrderedDict[str, tuple[str, bytes, dict]] = OrderedDict()
+        self._etag_cache_size = etag_cache_size
+        self._lock = threading.Lock()
+        self.stats = {
+            "requests": 0,
+            "connections": 0,
+            "not_modified": 0,
+            "retries": 0,
+        }
+
+    def __call__(self, path: str, paginate: bool = False, timeout: int = 90) -> Any:
+        deadline = time.monotonic() + timeout
+        target = self.prefix + path.lstrip("/")
+        if not paginate:
+            return json.loads(self._get(target, deadline, timeout)[0])
+        values: list = []
+        while target:
+            body, headers = self._get(target, deadline, timeout)
+            value = json.loads(body)
+            values.extend(value if isinstance(value, list) else [value])
+            target = self._next_target(headers.get("link") or "")
+        return values
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def _next_target(self, link_header: str) -> str | None:
+        match = _NEXT_LINK.search(link_header)
+        if not match:
+            return None
+        parts = urlsplit(match.group(1))
+        if (parts.scheme, parts.netloc) != (self.scheme, self.netloc):
+            # Never forward credentials to a host other than the configured one.
+            raise GitLabAPIError(0, match.group(1), "pagination left the API host")
+        return parts.path + (f"?{parts.query}" if parts.query else "")
+
+    def _connection(self, timeout: float) -> http.client.HTTPConnection:
+        try:
+            connection = self._pool.get_nowait()
+        except queue.Empty:
+            factory = (
+                http.client.HTTPSConnection
+                if self.scheme == "https"
+                else http.client.HTTPConnection
+            )
+            connection = factory(self.netloc, timeout=timeout)
+            with self._lock:
+                self.stats["connections"] += 1
+        connection.timeout = timeout
+        if connection.sock is not None:
+            connection.sock.settimeout(timeout)
+        return connection
+
+    def _release(self, connection: http.client.HTTPConnection) -> None:
+        try:
+            self._pool.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    def _get(self, target: str, deadline: float, timeout: int) -> tuple[bytes, dict]:
+        headers = {"Accept": "application/json", "Connection": "keep-alive"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        with self._lock:
+            cached = self._etags.get(target)
+        if cached:
+            headers["If-None-Match"] = cached[0]
+        for attempt in range(self.retries + 1):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(target, timeout)
+            connection = self._connection(remaining)
+            try:
+                connection.request("GET", target, headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+            except (socket.timeout, TimeoutError) as exc:
+                connection.close()
+                raise subprocess.TimeoutExpired(target, timeout) from exc
+            except (OSError, http.client.HTTPException):
+                # A pooled keep-alive socket may have been closed by the server.
+                connection.close()
+                if attempt == self.retries:
+                    raise
+                self._pause(attempt, None, deadline)
+                continue
+            if response.will_close:
+                connection.close()
+            else:
+                self._release(connection)
+            response_headers = {key.lower(): value for key, value in response.getheaders()}
+            with self._lock:
+                self.stats["requests"] += 1
+            if response.status == 304 and cached:
+                with self._lock:
+                    self.stats["not_modified"] += 1
+                    if target in self._etags:
+                        self._etags.move_to_end(target)
+                return cached[1], response_headers | cached[2]
+            if response.status in RETRY_STATUSES and attempt < self.retries:
+                self._pause(attempt, response_headers.get("retry-after"), deadline)
+                continue
+            if response.status != 200:
+                raise GitLabAPIError(
+                    response.status, target, body.decode("utf-8", "replace")
+                )
+            etag = response_headers.get("etag")
+            if etag:
+                with self._lock:
+                    self._etags[target] = (
+                        etag,
+                        body,
+                        {
+                            key: response_headers[key]
+                            for key in CACHED_HEADERS
+                            if key in response_headers
+                        },
+                    )
+                    self._etags.move_to_end(target)
+                    while len(self._etags) > self._etag_cache_size:
+                        self._etags.popitem(last=False)
+            return body, response_headers
+        raise GitLabAPIError(0, target, "retries exhausted")
+
+    def _pause(self, attempt: int, retry_after: str | None, deadline: float) -> None:
+        with self._lock:
+            self.stats["retries"] += 1
+        try:
+            delay = float(retry_after) if retry_after else 0.0
+        except ValueError:
+            delay = 0.0
+        delay = max(delay, self.backoff_seconds * (2**attempt))
+        time.sleep(max(0.0, min(delay, deadline - time.monotonic())))
+
+
+_SHARED: dict[str, GitLabClient | None] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_client(host: str, glab: str | None = None) -> GitLabClient | None:
+    """Return the process-wide client for ``host``, or None to keep using glab."""
+    if GITLAB_CLIENT != "http":
+        return None
+    with _SHARED_LOCK:
+        if host not in _SHARED:
+            token = resolve_token(host, glab)
+            _SHARED[host] = (
+                GitLabClient(host, token, base_url=GITLAB_API_URL) if token else None
+            )
+        return _SHARED[host]
@@ -1,4 +1,6 @@
+import hashlib
 import json
+import os
 import re
 import uuid
 from collections import Counter
@@ -18,7 +20,7 @@ from .classifier import (
     classify_source_item,
     legacy_fingerprint_item,
 )
-from .decisions import DecisionStore
+from .decisions import DECISION_ID, DecisionStore
 from .decomposition import SemanticDecompositionEngine
 from .frontier import ExecutableFrontier
 from .semantic_escalation import exclude_pending as exclude_pending_semantic_escalations
@@ -39,9 +41,24 @@ from .revalidation import (
     revalidation_tier,
     select_tier_a_batch,
 )
-from .schema_registry import RecordError, read_record, write_record
+from .schema_registry import RecordError, read_snapshot, write_record
+from .state_store import file_signature, write_cache_atomic
 from .verification import verification_for
 
+# Node evaluation reads these modules; changing any of them retires cached nodes.
+NODE_SOURCES = (
+    "authority.py",
+    "canonical_work_item.py",
+    "classifier.py",
+    "decomposition.py",
+    "graph.py",
+    "revalidation.py",
+    "verification.py",
+)
+NODE_CODE_DIGEST = hashlib.sha256(
+    b"".join((Path(__file__).parent / name).read_bytes() for name in NODE_SOURCES)
+).hexdigest()
+
 AUTHORITY_PRIORITY = {
     "direct": 30,
     "inherited": 20,
@@ -651,6 +668,54 @@ def _scheduler_state(
     }
 
 
+def _digest(value: object) -> str:
+    encoded = json.dumps(value, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=20).hexdigest()
+
+
+def _directory_signatures(directory: Path) -> dict[str, str]:
+    signatures = {}
+    try:
+        entries = list(os.scandir(directory))
+    except FileNotFoundError:
+        return signatures
+    for entry in entries:
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:
+            continue
+        signatures[entry.name] = f"{stat.st_mtime_ns}:{stat.st_size}:{stat.st_ino}"
+    return signatures
+
+
+def _node_dependencies(
+    item: dict,
+    semantic: dict | None,
+    assignments: list[dict],
+    generation_id: str | None,
+    item_digests: dict[str, str],
+    dispatched_finding_identities: set[str],
+) -> dict:
+    """Inputs a node reads beyond its own source item and semantic files."""
+    parent = ((semantic or {}).get("authority_resolution") or {}).get(
+        "controlling_parent"
+    )
+    return {
+        "parent": [parent, item_digests.get(parent) if parent else None],
+        # Verification freshness only compares generations for equality.
+        "current_generation": [
+            bool(generation_id) and value.get("source_inventory_generation_id")
+            == generation_id
+            for value in [semantic or {}, *assignments]
+        ],
+        "dispatched_findings": sorted(
+            str(candidate["finding_identity"])
+            for candidate in _candidates(item, semantic)
+            if candidate.get("finding_identity") in dispatched_finding_identities
+        ),
+    }
+
+
 def write_execution_graph(path: Path, graph: dict, gate: MutationGate) -> None:
     decision = gate.decide(OperationClass.RECONCILIATION)
     gate.require(decision, OperationClass.RECONCILIATION)
@@ -664,6 +729,122 @@ class ExecutionGraphBuilder:
         self.decisions = DecisionStore(root)
         self.authority = AuthorityResolver()
         self.gate = MutationGate(root, source="graph")
+        self.node_cache_path = root / "execution-graph-node-cache.json"
+        self._pending_node_cache: dict[str, str] | None = None
+
+    def _load_node_cache(self) -> dict:
+        """Nodes from the last build, keyed by ref with their input digests.
+
+        Entries from different node evaluation code are discarded, so a deploy
+        never reuses nodes computed by older rules.
+        """
+        try:
+            value = json.loads(self.node_cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(value, dict) or value.get("code") != NODE_CODE_DIGEST:
+            return {}
+        return value.get("nodes") or {}
+
+    def write_node_cache(self) -> None:
+        """Persist the nodes of the last ``build(persist=False)`` once published."""
+        if self._pending_node_cache is not None:
+            self._write_node_cache(self._pending_node_cache)
+            self._pending_node_cache = None
+
+    def _write_node_cache(self, nodes: dict[str, str]) -> None:
+        # Entries arrive pre-serialized so later queue assembly cannot leak in.
+        entries = ", ".join(
+            f"{json.dumps(ref)}: {entry}" for ref, entry in sorted(nodes.items())
+        )
+        text = f'{{"code": {json.dumps(NODE_CODE_DIGEST)}, "nodes": {{{entries}}}}}\n'
+        write_cache_atomic(self.node_cache_path, text)
+
+    def _evaluate_node(
+        self,
+        item: dict,
+        source_item: dict,
+        items_by_ref: dict[str, dict],
+        assignments: list[dict],
+        generation_id: str | None,
+        dispatched_finding_identities: set[str],
+    ) -> dict:
+        source_fingerprint = self.decomposition.source_fingerprint(source_item)
+        legacy_fingerprint = self.decomposition.legacy_source_fingerprint(
+            legacy_fingerprint_item(item)
+        )
+        try:
+            semantic = self.decomposition.load(
+                item["ref"],
+                source_fingerprint,
+                compatibility_fingerprints={legacy_fingerprint},
+            )
+        except (ValueError, RepositoryOwnershipDenied) as exc:
+            if not isinstance(
+                exc, RepositoryOwnershipDenied
+            ) and "semantic evidence fingerprint mismatch" not in str(exc):
+                raise
+            semantic = None
+        verification = verification_for(
+            item,
+            assignments,
+            semantic,
+            current_inventory_generation_id=generation_id,
+            current_source_fingerprint=source_fingerprint,
+        )
+        tier = revalidation_tier(item, semantic, verification)
+        controlling_parent = (
+            (semantic or {}).get("authority_resolution") or {}
+        ).get("controlling_parent")
+        authority = self.authority.resolve(
+            item,
+            semantic,
+            items_by_ref.get(controlling_parent) if controlling_parent else None,
+        )
+        decision_record = self.decisions.approval_for(
+            item["ref"], (semantic or {}).get("decision_packet") or {}
+        )
+        if decision_record is not None:
+            authority = {
+                "state": "direct",
+                "source": decision_record,
+                "reason": "exact immutable Product Owner decision",
+                "decision_record": decision_record,
+            }
+        candidates = [
+            candidate
+            for candidate in _candidates(item, semantic)
+            if candidate.get("finding_identity") not in dispatched_finding_identities
+        ]
+        flow_stage, flow_evidence = _flow_state(
+            item, semantic, verification, authority, assignments, candidates
+        )
+        ranking_score, ranking_factors = _rank_node(item, authority)
+        return {
+            "ref": item["ref"],
+            "source_kind": item.get("source_kind"),
+            "kind": item.get("kind"),
+            "project": item.get("project"),
+            "title": item.get("title"),
+            "labels": item.get("labels") or [],
+            "milestone": item.get("milestone"),
+            "source_state": item.get("source_state"),
+            "classification": item["classification"],
+            "blocker_type": item.get("blocker_type"),
+            "waiting_reason": item.get("waiting_reason"),
+            "classification_rationale": item.get("classification_rationale"),
+            "authority": authority,
+            "dependencies": item.get("dependencies") or [],
+            "ranking_score": ranking_score,
+            "ranking_factors": ranking_factors,
+            "semantic_record": semantic,
+            "findings": item.get("findings") or [],
+            "source_fingerprint": source_fingerprint,
+            "verification": verification,
+            "revalidation_tier": tier,
+            "flow_stage": flow_stage,
+            "flow_evidence": flow_evidence,
+        }
 
     def build(
         self,
@@ -672,7 +853,7 @@ class ExecutionGraphBuilder:
         *,
         persist: bool = True,
     ) -> dict:
-        control = read_record(
+        control = read_snapshot(
             self.root / "control.json",
             "axis.external-development-supervisor.control",
         )
@@ -708,49 +889,83 @@ class ExecutionGraphBuilder:
         semantic_unresolved = 0
         policy_suppressed_executable = 0
 
+        generation_id = inventory.get("generation_id")
+        item_digests = {
+            ref: _digest(raw_item) for ref, raw_item in source_by_ref.items()
+        }
+        assignments_by_ref: dict[str, list[dict]] = {}
+        for assignment in assignments:
+            for ref in {assignment.get("work_item"), assignment.get("target_ref")}:
+                if ref:
+                    assignments_by_ref.setdefault(ref, []).append(assignment)
+        decision_signature = file_signature(self.decisions.decision_path(DECISION_ID))
+        record_signatures = _directory_signatures(self.decomposition.records)
+        evidence_signatures = _directory_signatures(self.decomposition.evidence)
+        cached_nodes = self._load_node_cache()
+        node_cache = {}
+        node_cache_changed = set(cached_nodes) != set(item_digests)
+
         for item in classified_items:
-            source_fingerprint = self.decomposition.source_fingerprint(
-                source_by_ref[item["ref"]]
-            )
-            legacy_fingerprint = self.decomposition.legacy_source_fingerprint(
-                legacy_fingerprint_item(item)
+            relevant = assignments_by_ref.get(item["ref"]) or []
+            filename = self.decomposition.filename(item["ref"])
+            key = _digest(
+                [
+                    item_digests[item["ref"]],
+                    record_signatures.get(filename),
+                    evidence_signatures.get(filename),
+                    decision_signature,
+                    relevant,
+                ]
             )
-            try:
-                semantic = self.decomposition.load(
-                    item["ref"],
-                    source_fingerprint,
-                    compatibility_fingerprints={legacy_fingerprint},
+            cached = cached_nodes.get(item["ref"]) or {}
+            node = cached.get("node") if cached.get("key") == key else None
+            dependencies = None
+            if node is not None:
+                dependencies = _node_dependencies(
+                    item,
+                    node["semantic_record"],
+                    relevant,
+                    generation_id,
+                    item_digests,
+                    dispatched_finding_identities,
                 )
-            except (ValueError, RepositoryOwnershipDenied) as exc:
-                if not isinstance(
-                    exc, RepositoryOwnershipDenied
-                ) and "semantic evidence fingerprint mismatch" not in str(exc):
-                    raise
-                semantic = None
-            verification = verification_for(
-                item,
-                assignments,
-                semantic,
-                current_inventory_generation_id=inventory.get("generation_id"),
-                current_source_fingerprint=source_fingerprint,
-            )
-            tier = revalidation_tier(item, semantic, verification)
-            controlling_parent = (
-                (semantic or {}).get("authority_resolution") or {}
-            ).get("controlling_parent")
-            authority = self.authority.resolve(
-                item, semantic, items_by_ref.get(controlling_parent)
-            )
-            decision_record = self.decisions.approval_for(
-                item["ref"], (semantic or {}).get("decision_packet") or {}
+                if cached.get("dependencies") != dependencies:
+                    node = None
+            if node is None:
+                node = self._evaluate_node(
+                    item,
+                    source_by_ref[item["ref"]],
+                    items_by_ref,
+                    assignments,
+                    generation_id,
+                    dispatched_finding_identities,
+                )
+                dependencies = _node_dependencies(
+                    item,
+                    node["semantic_record"],
+                    relevant,
+                    generation_id,
+                    item_digests,
+                    dispatched_finding_identities,
+                )
+                node_cache_changed = True
+            semantic = node["semantic_record"]
+            authority = node["authority"]
+            verification = node["verification"]
+            source_fingerprint = node["source_fingerprint"]
+            tier = node["revalidation_tier"]
+            flow_stage = node["flow_stage"]
+            ranking_score = node["ranking_score"]
+            ranking_factors = node["ranking_factors"]
+            # Stored before queue assembly below can touch the shared node values.
+            node_cache[item["ref"]] = json.dumps(
+                {
+                    "key": key,
+                    "dependencies": dependencies,
+                    "node": node,
+                },
+                sort_keys=True,
             )
-            if decision_record is not None:
-                authority = {
-                    "state": "direct",
-                    "source": decision_record,
-                    "reason": "exact immutable Product Owner decision",
-                    "decision_record": decision_record,
-                }
             candidates = [
                 candidate
                 for candidate in _candidates(item, semantic)
@@ -762,35 +977,6 @@ class ExecutionGraphBuilder:
                 "needs-governance",
             }:
                 semantic_unresolved += 1
-            flow_stage, flow_evidence = _flow_state(
-                item, semantic, verification, authority, assignments, candidates
-            )
-            ranking_score, ranking_factors = _rank_node(item, authority)
-            node = {
-                "ref": item["ref"],
-                "source_kind": item.get("source_kind"),
-                "kind": item.get("kind"),
-                "project": item.get("project"),
-                "title": item.get("title"),
-                "labels": item.get("labels") or [],
-                "milestone": item.get("milestone"),
-                "source_state": item.get("source_state"),
-                "classification": item["classification"],
-                "blocker_type": item.get("blocker_type"),
-                "waiting_reason": item.get("waiting_reason"),
-                "classification_rationale": item.get("classification_rationale"),
-                "authority": authority,
-                "dependencies": item.get("dependencies") or [],
-                "ranking_score": ranking_score,
-                "ranking_factors": ranking_factors,
-                "semantic_record": semantic,
-                "findings": item.get("findings") or [],
-                "source_fingerprint": source_fingerprint,
-                "verification": verification,
-                "revalidation_tier": tier,
-                "flow_stage": flow_stage,
-                "flow_evidence": flow_evidence,
-            }
             nodes.append(node)
 
             if (
@@ -1151,7 +1337,9 @@ class ExecutionGraphBuilder:
             "queue_zero_proof": proof_conditions,
             "governed_queue_zero_proven": governed_zero,
         }
+        self._pending_node_cache = node_cache if node_cache_changed else None
         if persist:
+            self.write_node_cache()
             write_execution_graph(self.root / "execution-graph.json", graph, self.gate)
             ExecutableFrontier(self.root).build(
                 queue, assignments, graph["generation_id"]
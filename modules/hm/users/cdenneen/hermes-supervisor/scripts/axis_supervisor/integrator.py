@@ -2,6 +2,7 @@ import json
 import subprocess
 from urllib.parse import quote, urlencode
 
+from .gitlab_client import shared_client
 from .mutation import GateDecision, MutationGate, OperationClass
 from .repository_ownership import validate_repository_ownership
 
@@ -12,6 +13,9 @@ class Integrator:
         self.host = host
 
     def api(self, path: str):
+        client = shared_client(self.host, self.glab)
+        if client is not None:
+            return client(path)
         output = subprocess.check_output(
             [self.glab, "api", "--hostname", self.host, path],
             text=True,
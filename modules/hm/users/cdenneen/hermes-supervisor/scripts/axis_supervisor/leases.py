@@ -0,0 +1,379 @@
+import json
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+from .assignment_grants import AssignmentGrantDenied, validate_grant
+from .canary import CanaryDenied, validate_canary
+from .lifecycle import adapt_assignment, is_read_only_work, is_terminal, set_lifecycle
+from .models import validate_assignment
+from .mutation import MutationGate, OperationClass
+from .schema_registry import read_record, read_snapshot, write_record
+
+LEASE_SCHEMA = "axis.external-development-supervisor.lease"
+ASSIGNMENT_ID_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]{0,127}")
+RESOURCE_PATTERN = re.compile(r"^(repo|path|branch|worktree):([^:]+/[^:]+)(?::.*)?$")
+
+# The on-disk controller lock only distinguishes processes; threads of one
+# process (a worker heartbeat beside the cycle) queue here instead of failing.
+_PROCESS_LOCK = threading.Lock()
+
+
+def process_start_time(pid: int) -> str | None:
+    try:
+        return Path(f"/proc/{pid}/stat").read_text(encoding="utf-8").split()[21]
+    except (OSError, IndexError):
+        return None
+
+
+def _check_assignment_id(assignment_id: str) -> None:
+    if not ASSIGNMENT_ID_PATTERN.fullmatch(assignment_id):
+        raise RuntimeError("invalid assignment_id")
+
+
+class LeaseController:
+    """Assignment lease claim, heartbeat, release and recovery.
+
+    Every mutation runs under ``leases/.controller.lock``, the same lock the
+    ``supervisorctl`` CLI takes, so in-process callers and CLI invocations
+    serialize against each other.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.leases = root / "leases"
+        self.lock_path = self.leases / ".controller.lock"
+        self.owner_path = self.lock_path / "owner.json"
+
+    def _control(self) -> dict[str, Any]:
+        return read_snapshot(
+            self.root / "control.json",
+            "axis.external-development-supervisor.control",
+        )
+
+    def authorize_write(self) -> None:
+        gate = MutationGate(self.root, source="lease-controller")
+        decision = gate.decide(OperationClass.RECONCILIATION)
+        gate.require(decision, OperationClass.RECONCILIATION)
+
+    def _acquire(self, now: int) -> None:
+        if self.lock_path.exists() and now - int(self.lock_path.stat().st_mtime) > 60:
+            try:
+                owner = json.loads(self.owner_path.read_text(encoding="utf-8"))
+                owner_pid = int(owner.get("pid") or 0)
+                if owner_pid <= 0:
+                    raise ValueError("invalid lock owner pid")
+                os.kill(owner_pid, 0)
+                if owner.get("process_start_time") != process_start_time(owner_pid):
+                    raise ValueError("lease controller pid was reused")
+            except (OSError, ValueError, json.JSONDecodeError):
+                shutil.rmtree(self.lock_path, ignore_errors=True)
+            else:
+                raise RuntimeError("lease controller lock owner is still alive")
+        self.leases.mkdir(mode=0o700, parents=True, exist_ok=True)
+        try:
+            self.lock_path.mkdir(mode=0o700)
+        except FileExistsError as exc:
+            raise RuntimeError("another lease operation is in progress") from exc
+        self.owner_path.write_text(
+            json.dumps(
+                {
+                    "pid": os.getpid(),
+                    "process_start_time": process_start_time(os.getpid()),
+                    "acquired_at_epoch": now,
+                }
+            ),
+        )
+        self.owner_path.chmod(0o600)
+
+    def _release(self) -> None:
+        try:
+            owner = json.loads(self.owner_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        if int(owner.get("pid") or 0) == os.getpid():
+            shutil.rmtree(self.lock_path, ignore_errors=True)
+
+    @contextmanager
+    def locked(self, now: int) -> Iterator[None]:
+        with _PROCESS_LOCK:
+            self._acquire(now)
+            try:
+                yield
+            finally:
+                self._release()
+
+    def _live_paths(self) -> list[Path]:
+        # Quarantined ``stale-*`` leases are expired by construction and pile
+        # up over time; skip them by name instead of reading each one.
+        try:
+            entries = list(os.scandir(self.leases))
+        except FileNotFoundError:
+            return []
+        return [
+            Path(entry.path) / "lease.json"
+            for entry in entries
+            if not entry.name.startswith(("stale-", "."))
+            and entry.is_dir()
+            and os.path.exists(os.path.join(entry.path, "lease.json"))
+        ]
+
+    def active(self, now: int) -> list[dict]:
+        values = []
+        for path in self._live_paths():
+            lease = read_record(path, LEASE_SCHEMA)
+            if int(lease.get("expires_at_epoch", 0)) > now:
+                lease["path"] = str(path)
+                values.append(lease)
+        return values
+
+    def all(self) -> list[dict]:
+        values = []
+        for path in self._live_paths():
+            lease = read_record(path, LEASE_SCHEMA)
+            lease["path"] = str(path)
+            values.append(lease)
+        return values
+
+    def recover_expired(self, now: int) -> list[str]:
+        """Quarantine expired leases; the caller must hold the controller lock."""
+        self.authorize_write()
+        recovered = []
+        for directory in self.leases.iterdir() if self.leases.exists() else []:
+            if not directory.is_dir() or directory.name.startswith(("stale-", ".")):
+                continue
+            lease_path = directory / "lease.json"
+            try:
+                lease = read_record(lease_path, LEASE_SCHEMA)
+                expired = int(lease.get("expires_at_epoch", 0)) <= now
+            except Exception:
+                expired = True
+            if not expired:
+                continue
+            stale = self.leases / f"stale-{now}-{directory.name}"
+            suffix = 0
+            while stale.exists():
+                suffix += 1
+                stale = self.leases / f"stale-{now}-{directory.name}-{suffix}"
+            directory.rename(stale)
+            recovered.append(str(stale / "lease.json"))
+            assignment_path = self.root / "assignments" / f"{directory.name}.json"
+            if assignment_path.exists():
+                assignment = validate_assignment(
+                    adapt_assignment(
+                        json.loads(assignment_path.read_text(encoding="utf-8")),
+                        self.root,
+                    )
+                )
+                if not is_terminal(assignment):
+                    set_lifecycle(assignment, "recovery-required")
+                    assignment["lease_id"] = None
+                    assignment["lease_uri"] = None
+                    assignment["recovery_lease_uri"] = (stale / "lease.json").as_uri()
+                    write_record(
+                        assignment_path,
+                        assignment,
+                        "axis.external-development-supervisor.assignment",
+                    )
+        return recovered
+
+    def recover(self, now: int | None = None) -> list[str]:
+        now = int(time.time()) if now is None else now
+        with self.locked(now):
+            return self.recover_expired(now)
+
+    def _authorize_mutating_claim(
+        self,
+        control: dict,
+        assignment: dict,
+        resources: list[str],
+        merged_mr: dict | None,
+    ) -> None:
+        authority_state = (assignment.get("authority") or {}).get("state")
+        bounded_grant = False
+        if merged_mr is not None and not isinstance(merged_mr, dict):
+            raise RuntimeError("merged MR recovery evidence must be an object")
+        if assignment.get("assignment_type") == "capability-deployment":
+            repository_convergence = read_record(
+                self.root / "repository-convergence.json",
+                "axis.external-development-supervisor.repository-convergence",
+            )
+            capability_convergence = read_record(
+                self.root / "capability-convergence.json",
+                "axis.external-development-supervisor.capability-convergence",
+            )
+            plan = assignment.get("deployment_plan") or {}
+            expected = next(
+                (
+                    value
+                    for value in capability_convergence.get("deployment_assignments")
+                    or []
+                    if value.get("assignment_id") == plan.get("assignment_id")
+                ),
+                None,
+            )
+            if repository_convergence.get("status") != "green" or expected != plan:
+                raise RuntimeError(
+                    "capability deployment is not authorized by current "
+                    "convergence state"
+                )
+            if resources != [f"runtime:{plan.get('target_runtime')}"]:
+                raise RuntimeError("capability deployment runtime resource mismatch")
+            bounded_grant = True
+        elif authority_state == "canary":
+            try:
+                validate_canary(
+                    self.root,
+                    assignment,
+                    "repository-mutation",
+                    assignment.get("project"),
+                    merged_mr=merged_mr,
+                )
+            except CanaryDenied as exc:
+                raise RuntimeError(str(exc)) from exc
+        elif assignment.get("mutation_grant_id"):
+            try:
+                validate_grant(
+                    self.root,
+                    assignment,
+                    "repository-mutation",
+                    assignment.get("project"),
+                    effect="clone",
+                    merged_mr=merged_mr,
+                )
+                bounded_grant = True
+            except AssignmentGrantDenied as exc:
+                raise RuntimeError(str(exc)) from exc
+        elif authority_state not in {"direct", "inherited"}:
+            raise RuntimeError("mutating lease requires direct or inherited authority")
+        if (
+            not control.get("allow_repository_mutation")
+            and authority_state != "canary"
+            and not bounded_grant
+        ):
+            raise RuntimeError("repository mutation is disabled")
+        if assignment.get("governance_state") not in {"Executable", "Running"}:
+            raise RuntimeError("mutating lease requires executable governance state")
+
+    def claim(
+        self,
+        assignment_id: str,
+        run_id: str,
+        resources: list[str],
+        *,
+        ttl: int | None = None,
+        read_only: bool = False,
+        merged_mr: dict | None = None,
+    ) -> dict:
+        now = int(time.time())
+        control = self._control()
+        if control.get("kill_switch") or control.get("mode") != "enabled":
+            raise RuntimeError("supervisor is not enabled")
+        _check_assignment_id(assignment_id)
+        assignment_path = self.root / "assignments" / f"{assignment_id}.json"
+        if not assignment_path.is_file():
+            raise RuntimeError("lease claim requires an existing assignment")
+        assignment = validate_assignment(
+            json.loads(assignment_path.read_text(encoding="utf-8")), self.root
+        )
+        if is_terminal(assignment):
+            raise RuntimeError("terminal assignment cannot acquire a lease")
+        if assignment.get("created_by_run") != run_id:
+            raise RuntimeError("lease owner run does not match assignment")
+        if bool(read_only) != is_read_only_work(assignment):
+            raise RuntimeError("lease read-only mode does not match assignment kind")
+        if not read_only:
+            self._authorize_mutating_claim(control, assignment, resources, merged_mr)
+        ttl = int(ttl or control.get("lease_seconds", 1200))
+        if ttl <= 0:
+            raise RuntimeError("lease TTL must be positive")
+        resources = sorted(set(resources))
+        if assignment.get("assignment_type") == "capability-deployment":
+            target = (assignment.get("deployment_plan") or {}).get("target_runtime")
+            if resources != [f"runtime:{target}"]:
+                raise RuntimeError("deployment lease must identify the exact runtime")
+        else:
+            allowlist = set(control.get("repository_allowlist") or [])
+            parsed = [RESOURCE_PATTERN.fullmatch(resource) for resource in resources]
+            if (
+                not resources
+                or any(match is None for match in parsed)
+                or any(match.group(2) not in allowlist for match in parsed if match)
+            ):
+                raise RuntimeError(
+                    "lease resources must identify an allowlisted repository"
+                )
+            if any(
+                match.group(2) != assignment.get("project") for match in parsed if match
+            ):
+                raise RuntimeError("lease resources must match the assignment project")
+
+        with self.locked(now):
+            self.recover_expired(now)
+            leases = self.all()
+            maximum = int(control.get("max_active_assignments", 1))
+            if len(leases) >= maximum:
+                raise RuntimeError(
+                    f"active/recovery assignment limit reached: {len(leases)}/{maximum}"
+                )
+            for existing in leases:
+                overlap = sorted(set(resources) & set(existing.get("resources") or []))
+                if overlap:
+                    raise RuntimeError(
+                        f"resource conflict with {existing.get('assignment_id')}: "
+                        f"{overlap}"
+                    )
+            directory = self.leases / assignment_id
+            directory.mkdir(mode=0o700, parents=False, exist_ok=False)
+            lease = {
+                "schema": LEASE_SCHEMA,
+                "schema_version": "1.0.0",
+                "lease_id": assignment_id,
+                "assignment_id": assignment_id,
+                "owner_run_id": run_id,
+                "fencing_token": uuid.uuid4().hex,
+                "resources": resources,
+                "read_only": bool(read_only),
+                "acquired_at_epoch": now,
+                "heartbeat_at_epoch": now,
+                "expires_at_epoch": now + ttl,
+            }
+            write_record(directory / "lease.json", lease, LEASE_SCHEMA)
+        return lease
+
+    def heartbeat(self, assignment_id: str, token: str, ttl: int | None = None) -> dict:
+        now = int(time.time())
+        _check_assignment_id(assignment_id)
+        with self.locked(now):
+            path = self.leases / assignment_id / "lease.json"
+            lease = read_record(path, LEASE_SCHEMA)
+            if lease.get("fencing_token") != token:
+                raise RuntimeError("fencing token mismatch")
+            if int(lease.get("expires_at_epoch", 0)) <= now:
+                raise RuntimeError(
+                    "expired or recovery-required lease cannot be renewed"
+                )
+            ttl = int(ttl or self._control().get("lease_seconds", 1200))
+            if ttl <= 0:
+                raise RuntimeError("lease TTL must be positive")
+            lease["heartbeat_at_epoch"] = now
+            lease["expires_at_epoch"] = now + ttl
+            self.authorize_write()
+            write_record(path, lease, LEASE_SCHEMA)
+        return lease
+
+    def release(self, assignment_id: str, token: str) -> None:
+        _check_assignment_id(assignment_id)
+        with self.locked(int(time.time())):
+            directory = self.leases / assignment_id
+            lease = read_record(directory / "lease.json", LEASE_SCHEMA)
+            if lease.get("fencing_token") != token:
+                raise RuntimeError("fencing token mismatch")
+            self.authorize_write()
+            shutil.rmtree(directory)
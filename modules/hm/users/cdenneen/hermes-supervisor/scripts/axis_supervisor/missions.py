@@ -4,6 +4,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from .assignment_index import assignment_paths
 from .lifecycle import adapt_assignment, is_terminal
 from .mutation import MutationGate, OperationClass
 from .schema_registry import validate_record, write_record
@@ -497,7 +498,7 @@ class ActiveMissionState:
             for value in inventory.get("supervisor_assignments") or []
             if value.get("assignment_id")
         }
-        for path in sorted((self.root / "assignments").glob("*.json")):
+        for path in assignment_paths(self.root):
             try:
                 value = adapt_assignment(
                     json.loads(path.read_text(encoding="utf-8")), self.root
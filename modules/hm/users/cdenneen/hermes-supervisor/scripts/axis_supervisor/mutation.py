@@ -13,7 +13,7 @@ from .assignment_grants import (
 )
 from .canary import CanaryDenied, append_event, validate_canary
 from .lifecycle import is_terminal
-from .schema_registry import read_record
+from .schema_registry import read_record, read_snapshot
 
 
 class OperationClass(str, Enum):
@@ -94,7 +94,7 @@ class MutationGate:
     ) -> GateDecision:
         if not isinstance(operation, OperationClass):
             raise MutationDenied(f"unknown operation class: {operation}")
-        control = read_record(
+        control = read_snapshot(
             self.root / "control.json",
             "axis.external-development-supervisor.control",
         )
@@ -110,6 +110,7 @@ class MutationGate:
                 "mission-reconciler",
                 "preflight",
                 "reporter",
+                "state-store",
                 "worker",
                 "workflow-state",
             }:
@@ -357,7 +358,7 @@ class MutationGate:
                 raise MutationDenied("assignment became terminal after decision")
             if repository and repository != assignment.get("project"):
                 raise MutationDenied("assignment project changed after decision")
-            control = read_record(
+            control = read_snapshot(
                 self.root / "control.json",
                 "axis.external-development-supervisor.control",
             )
@@ -1,32 +1,22 @@
 import fcntl
+import hashlib
 import json
 import os
+import threading
 import time
 import uuid
-from datetime import datetime, timezone
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from .accounting import AccountingLedger
 from .mutation import MutationGate, OperationClass
 from .schema_registry import read_record, validate_record, write_record
+from .slack_outbox import SlackOutbox
 
 EVENT_SCHEMA = "axis.external-development-supervisor.operational-event"
 HEALTH_SCHEMA = "axis.external-development-supervisor.observability-health"
-OUTBOX_SCHEMA = "axis.external-development-supervisor.slack-outbox"
-DELIVERY_STAGES = frozenset(
-    {
-        "notification_created",
-        "notification_queued",
-        "notification_send_attempted",
-        "Slack_API_accepted",
-        "Slack_message_created",
-        "Slack_message_updated",
-        "Slack_message_verified",
-        "delivery_failed",
-        "delivery_unknown",
-    }
-)
 NOTIFY_EVENT_TYPES = frozenset(
     {
         "assignment_retry",
@@ -35,6 +25,7 @@ NOTIFY_EVENT_TYPES = frozenset(
     }
 )
 PRODUCT_HEARTBEAT_SECONDS = 30 * 60
+_BATCHES = threading.local()
 
 
 def utc_now() -> str:
@@ -103,14 +94,7 @@ def record_product_heartbeat(
     """Deliver a bounded product outcome, never a worker/activity heartbeat."""
     now = int(time.time()) if now is None else now
     log = OperationalEventLog(root, "cycle")
-    latest = next(
-        (
-            event
-            for event in reversed(log.events(limit=1_000))
-            if event.get("event_type") == "product_heartbeat"
-        ),
-        None,
-    )
+    latest = log.latest_event("product_heartbeat")
     if latest and now - int(latest.get("created_at_epoch") or 0) < PRODUCT_HEARTBEAT_SECONDS:
         return None
     kpi = graduation.get("primary_kpi") or {}
@@ -130,27 +114,237 @@ def record_product_heartbeat(
     return log.emit("product_heartbeat", details={"product_outcome": outcome}, notify=True)
 
 
+THROUGHPUT_COUNTED_EVENT_TYPES = ("assignment_retry", "grant_consumed")
+THROUGHPUT_ASSIGNMENT_EVENT_TYPES = frozenset(
+    {
+        "assignment_selected",
+        "assignment_disposition",
+        "implementation_completed",
+        "post_main_verified",
+        "mr_merged",
+    }
+)
+
+
+def _throughput_bucket() -> dict[str, Any]:
+    return {"counts": {}, "assignments": {}}
+
+
+def _fold_throughput(
+    bucket: dict[str, Any], offset: int, event: dict[str, Any]
+) -> None:
+    """Keep only what throughput metrics read: counters and each assignment's
+    latest event per type, reduced to the fields the metrics use."""
+    event_type = event.get("event_type")
+    if event_type in THROUGHPUT_COUNTED_EVENT_TYPES:
+        bucket["counts"][event_type] = bucket["counts"].get(event_type, 0) + 1
+    assignment_id = event.get("assignment_id")
+    if not assignment_id or event_type not in THROUGHPUT_ASSIGNMENT_EVENT_TYPES:
+        return
+    details = event.get("details") or {}
+    bucket["assignments"].setdefault(assignment_id, {})[event_type] = {
+        "offset": offset,
+        "event_type": event_type,
+        "assignment_id": assignment_id,
+        "created_at_epoch": event.get("created_at_epoch"),
+        "work_item": event.get("work_item"),
+        "details": {
+            key: details[key]
+            for key in ("assignment_type", "disposition")
+            if key in details
+        },
+    }
+
+
+def _merge_throughput(buckets: list[dict[str, Any]]) -> dict[str, Any]:
+    merged = _throughput_bucket()
+    for bucket in buckets:
+        for event_type, count in bucket["counts"].items():
+            merged["counts"][event_type] = merged["counts"].get(event_type, 0) + count
+        for assignment_id, latest in bucket["assignments"].items():
+            target = merged["assignments"].setdefault(assignment_id, {})
+            for event_type, event in latest.items():
+                if (
+                    event_type not in target
+                    or event["offset"] > target[event_type]["offset"]
+                ):
+                    target[event_type] = event
+    return merged
+
+
+def _throughput_events(bucket: dict[str, Any]) -> list[dict[str, Any]]:
+    """Expand a bucket into the smallest event stream with the same metrics."""
+    values = [
+        {"event_type": event_type}
+        for event_type, count in sorted(bucket["counts"].items())
+        for _ in range(count)
+    ]
+    values.extend(
+        sorted(
+            (
+                event
+                for latest in bucket["assignments"].values()
+                for event in latest.values()
+            ),
+            key=lambda event: event["offset"],
+        )
+    )
+    return values
+
+
+def summarize_throughput(
+    values: list[dict[str, Any]], start_epoch: int, end_epoch: int
+) -> dict[str, Any]:
+    selected = {
+        event.get("assignment_id"): event
+        for event in values
+        if event.get("event_type") == "assignment_selected"
+        and event.get("assignment_id")
+    }
+    dispositions = {
+        event.get("assignment_id"): event
+        for event in values
+        if event.get("event_type") == "assignment_disposition"
+        and event.get("assignment_id")
+    }
+    implementation_selected = {
+        assignment_id
+        for assignment_id, event in selected.items()
+        if (event.get("details") or {}).get("assignment_type")
+        in {
+            "governance-document-mutation",
+            "code-implementation",
+            "ci-integration-repair",
+        }
+    }
+    analysis_selected = {
+        assignment_id
+        for assignment_id, event in selected.items()
+        if (event.get("details") or {}).get("assignment_type")
+        in {"read-only-analysis", "no-op-verification"}
+    }
+    analysis_completed = {
+        assignment_id
+        for assignment_id, event in dispositions.items()
+        if (event.get("details") or {}).get("disposition")
+        in {"analysis-completed", "no-op-verification-completed"}
+    }
+    implementation_completed = {
+        event.get("assignment_id")
+        for event in values
+        if event.get("event_type") == "implementation_completed"
+        and event.get("assignment_id")
+    }
+    post_main_verified = {
+        event.get("assignment_id")
+        for event in values
+        if event.get("event_type") == "post_main_verified"
+        and event.get("assignment_id")
+    }
+    merged = {
+        event.get("assignment_id")
+        for event in values
+        if event.get("event_type") == "mr_merged"
+        and event.get("assignment_id")
+    }
+    retries = sum(event.get("event_type") == "assignment_retry" for event in values)
+    grants_consumed = sum(
+        event.get("event_type") == "grant_consumed" for event in values
+    )
+    blocked = sum(
+        (event.get("details") or {}).get("disposition")
+        in {"blocked", "failed", "recovery-required"}
+        for event in dispositions.values()
+    )
+
+    def average_duration(end_event_type: str) -> int | None:
+        ends = {
+            event.get("assignment_id"): int(event.get("created_at_epoch") or 0)
+            for event in values
+            if event.get("event_type") == end_event_type
+            and event.get("assignment_id")
+        }
+        durations = [
+            ends[assignment_id]
+            - int(event.get("created_at_epoch") or ends[assignment_id])
+            for assignment_id, event in selected.items()
+            if assignment_id in ends
+        ]
+        return round(sum(durations) / len(durations)) if durations else None
+
+    analysis_work_items = {
+        selected[assignment_id].get("work_item")
+        for assignment_id in analysis_completed
+        if assignment_id in selected
+    }
+    implementation_work_items = {
+        selected[assignment_id].get("work_item")
+        for assignment_id in implementation_selected
+        if assignment_id in selected
+    }
+
+    def percent(numerator: int, denominator: int) -> int:
+        return round(numerator * 100 / denominator) if denominator else 0
+
+    return {
+        "start_epoch": start_epoch,
+        "end_epoch": end_epoch,
+        "window_days": max(1, round((end_epoch - start_epoch) / 86_400)),
+        "assignments_selected": len(selected),
+        "analysis_selected": len(analysis_selected),
+        "analysis_completed": len(analysis_completed),
+        "implementation_selected": len(implementation_selected),
+        "implementation_commits": len(implementation_completed),
+        "merged": len(merged),
+        "post_main_verified": len(post_main_verified),
+        "blocked_or_failed": blocked,
+        "retries": retries,
+        "grants_consumed": grants_consumed,
+        "analysis_to_implementation_percent": percent(
+            len(analysis_work_items & implementation_work_items),
+            len(analysis_work_items),
+        ),
+        "implementation_to_merge_percent": percent(
+            len(merged), len(implementation_selected)
+        ),
+        "merge_to_verified_percent": percent(
+            len(post_main_verified), len(merged)
+        ),
+        "retry_rate_percent": percent(retries, len(selected)),
+        "average_implementation_seconds": average_duration(
+            "implementation_completed"
+        ),
+        "average_integration_seconds": average_duration(
+            "post_main_verified"
+        ),
+    }
+
+
 class OperationalEventLog:
+    """Append-only event log with a byte-offset index over daily buckets.
+
+    The JSONL file stays the single source of truth; the sidecar index records
+    the byte range of each UTC day, where the latest event of each type lives
+    and per-day throughput buckets.  Writers catch it up (or rebuild it) under
+    the exclusive log lock; readers take a shared lock and catch a lagging
+    index up in memory only.
+    """
+
+    INDEX_VERSION = 2
+    TAIL_CHUNK_BYTES = 64 * 1024
+    METRICS_RETENTION_DAYS = 62
+
     def __init__(self, root: Path, source: str):
         self.root = root
         self.path = root / "operational-events.jsonl"
-        self.outbox_path = root / "slack-outbox.json"
+        self.index_path = root / "operational-events.index.json"
+        self.outbox = SlackOutbox(root)
         self.gate = MutationGate(root, source=source)
 
     def _authorize(self) -> None:
         decision = self.gate.decide(OperationClass.RECONCILIATION)
         self.gate.require(decision, OperationClass.RECONCILIATION)
 
-    def _load_outbox(self) -> dict[str, Any]:
-        if self.outbox_path.exists():
-            return read_record(self.outbox_path, OUTBOX_SCHEMA)
-        return {
-            "schema": OUTBOX_SCHEMA,
-            "schema_version": "1.0.0",
-            "notifications": [],
-            "updated_at": utc_now(),
-        }
-
     def emit(
         self,
         event_type: str,
@@ -176,32 +370,89 @@ class OperationalEventLog:
         }
         validate_record(event, EVENT_SCHEMA)
         self._authorize()
-        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
-        with self.path.open("a", encoding="utf-8") as handle:
-            os.chmod(self.path, 0o600)
-            fcntl.flock(handle, fcntl.LOCK_EX)
-            handle.write(json.dumps(event, sort_keys=True) + "\n")
-            handle.flush()
-            os.fsync(handle.fileno())
-            fcntl.flock(handle, fcntl.LOCK_UN)
         should_notify = notify if notify is not None else event_type in NOTIFY_EVENT_TYPES
         if is_routine_analysis_event(event):
             should_notify = False
-        if should_notify:
-            outbox = self._load_outbox()
-            pending = [
-                item
-                for item in outbox["notifications"]
-                if item["current_stage"] != "Slack_message_verified"
-            ]
-            delivered = [
-                item
-                for item in outbox["notifications"]
-                if item["current_stage"] == "Slack_message_verified"
-            ][-200:]
-            outbox["notifications"] = delivered + pending
-            now = utc_now()
-            outbox["notifications"].append(
+        batch = self._active_batch()
+        if batch is not None:
+            batch.append((event, should_notify))
+        else:
+            self._commit([(event, should_notify)])
+        return event
+
+    def _active_batch(self) -> list[tuple[dict[str, Any], bool]] | None:
+        return getattr(_BATCHES, "pending", {}).get(str(self.path))
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Commit every event this thread emits to this log as one group.
+
+        Events are still validated and authorized as they are emitted, but are
+        appended with a single fsync and queue their notifications with one
+        outbox journal append when the block exits. Reads through any log
+        instance for the same root flush the pending group first. Nested
+        batches join the outermost one.
+
+        Batching is opt-in because it widens the data-loss window: events
+        emitted in the block live only in memory until the group is committed,
+        so a crash of the process inside the block loses them. When the block
+        raises, the group is still flushed best-effort; a failed flush is noted
+        on the original exception rather than replacing it.
+        """
+        pending = getattr(_BATCHES, "pending", None)
+        if pending is None:
+            pending = _BATCHES.pending = {}
+        key = str(self.path)
+        if key in pending:
+            yield
+            return
+        pending[key] = []
+        try:
+            yield
+        except BaseException as error:
+            try:
+                self._commit(pending.pop(key))
+            except Exception as flush_error:
+                error.add_note(f"batched events were not committed: {flush_error!r}")
+            raise
+        self._commit(pending.pop(key))
+
+    def _flush_batch(self) -> None:
+        batch = self._active_batch()
+        if batch:
+            entries = list(batch)
+            batch.clear()
+            self._commit(entries)
+
+    def _commit(self, entries: list[tuple[dict[str, Any], bool]]) -> None:
+        """Append events durably, then queue notifications for the notifying ones.
+
+        The outbox only ever references events already fsynced to the log.
+        """
+        if not entries:
+            return
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with self.path.open("a+b") as handle:
+            os.chmod(self.path, 0o600)
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                handle.write(
+                    "".join(
+                        json.dumps(event, sort_keys=True) + "\n" for event, _ in entries
+                    ).encode()
+                )
+                handle.flush()
+                os.fsync(handle.fileno())
+                self._indexed(handle)
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+        notifying = [event for event, should_notify in entries if should_notify]
+        if not notifying:
+            return
+        now = utc_now()
+        self._authorize()
+        self.outbox.enqueue(
+            [
                 {
                     "notification_id": uuid.uuid4().hex,
                     "event_id": event["event_id"],
@@ -218,160 +469,228 @@ class OperationalEventLog:
                     "ts": None,
                     "recovery_summary": False,
                 }
-            )
-            outbox["updated_at"] = now
-            self._authorize()
-            write_record(self.outbox_path, outbox, OUTBOX_SCHEMA)
-        return event
+                for event in notifying
+            ]
+        )
+
+    @staticmethod
+    def _day(epoch: int) -> str:
+        return datetime.fromtimestamp(epoch, timezone.utc).date().isoformat()
+
+    @staticmethod
+    def _lines(data: bytes, base: int, partial_head: bool) -> list[tuple[int, bytes]]:
+        """Complete, non-blank lines of ``data`` with their absolute offsets."""
+        end = data.rfind(b"\n") + 1
+        start = 0
+        if partial_head:
+            start = data.find(b"\n", 0, end) + 1
+            if not start:
+                return []
+        lines = []
+        while start < end:
+            stop = data.index(b"\n", start) + 1
+            if data[start:stop].strip():
+                lines.append((base + start, data[start:stop]))
+            start = stop
+        return lines
+
+    @staticmethod
+    def _event(offset: int, line: bytes) -> dict[str, Any]:
+        try:
+            return validate_record(json.loads(line), EVENT_SCHEMA)
+        except Exception as exc:
+            raise ValueError(
+                f"corrupt operational event line at byte {offset}: {exc}"
+            ) from exc
+
+    def _empty_index(self) -> dict[str, Any]:
+        return {
+            "version": self.INDEX_VERSION,
+            "size": 0,
+            "last": None,
+            "day_ranges": {},
+            "latest_offsets": {},
+            "throughput": {"from_day": None, "days": {}},
+        }
+
+    def _index_matches(self, handle, index: Any, size: int) -> bool:
+        if not isinstance(index, dict) or index.get("version") != self.INDEX_VERSION:
+            return False
+        indexed = int(index.get("size") or 0)
+        last = index.get("last")
+        if indexed > size:
+            return False
+        if last is None:
+            return indexed == 0
+        handle.seek(int(last["offset"]))
+        line = handle.read(int(last["length"]))
+        # A rewritten log no longer holds the last indexed line where the
+        # index expects it.
+        return hashlib.sha256(line).hexdigest() == last["sha256"]
+
+    def _indexed(self, handle, *, persist: bool = True) -> dict[str, Any]:
+        """Return the offset index caught up to the log held locked by the caller.
+
+        Only a writer holding the exclusive lock persists it; readers share the
+        lock and catch a lagging index up in memory.
+        """
+        size = os.fstat(handle.fileno()).st_size
+        try:
+            loaded: Any = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            loaded = None
+        index: dict[str, Any] = (
+            loaded
+            if self._index_matches(handle, loaded, size)
+            else self._empty_index()
+        )
+        if index["size"] == size:
+            return index
+        handle.seek(index["size"])
+        for offset, line in self._lines(handle.read(), index["size"], False):
+            try:
+                value = json.loads(line)
+                epoch = int(value.get("created_at_epoch") or 0)
+                event_type = str(value.get("event_type") or "")
+            except (ValueError, TypeError, AttributeError):
+                continue
+            day = self._day(epoch)
+            first, _end = index["day_ranges"].get(day, (offset, offset))
+            index["day_ranges"][day] = [first, offset + len(line)]
+            index["latest_offsets"][event_type] = offset
+            if isinstance(value, dict):
+                _fold_throughput(
+                    index["throughput"]["days"].setdefault(day, _throughput_bucket()),
+                    offset,
+                    value,
+                )
+            index["last"] = {
+                "offset": offset,
+                "length": len(line),
+                "sha256": hashlib.sha256(line).hexdigest(),
+            }
+            index["size"] = offset + len(line)
+        self._prune_throughput(index["throughput"])
+        if not persist:
+            return index
+        tmp = self.index_path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(index, sort_keys=True) + "\n", encoding="utf-8")
+        tmp.chmod(0o600)
+        tmp.replace(self.index_path)
+        return index
+
+    def _prune_throughput(self, throughput: dict[str, Any]) -> None:
+        days = sorted(throughput["days"])
+        if not days:
+            return
+        newest = datetime.fromisoformat(days[-1]).date()
+        cutoff = (newest - timedelta(days=self.METRICS_RETENTION_DAYS)).isoformat()
+        for day in days:
+            if day < cutoff:
+                del throughput["days"][day]
+                throughput["from_day"] = cutoff
+
+    def _locked_index(self) -> dict[str, Any] | None:
+        self._flush_batch()
+        if not self.path.exists():
+            return None
+        with self.path.open("rb") as handle:
+            fcntl.flock(handle, fcntl.LOCK_SH)
+            try:
+                return self._indexed(handle, persist=False)
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
 
     def events(self, limit: int = 100) -> list[dict[str, Any]]:
+        """Return the last ``limit`` events, reading the log backwards."""
+        self._flush_batch()
         if not self.path.exists():
             return []
+        with self.path.open("rb") as handle:
+            position = handle.seek(0, os.SEEK_END)
+            data = b""
+            while True:
+                lines = self._lines(data, position, position > 0)
+                if position == 0 or (limit > 0 and len(lines) >= limit):
+                    break
+                step = min(position, max(self.TAIL_CHUNK_BYTES, len(data)))
+                position -= step
+                handle.seek(position)
+                data = handle.read(step) + data
+        return [self._event(offset, line) for offset, line in lines[-limit:]]
+
+    def _read_range(self, first: int, end: int) -> list[tuple[int, bytes]]:
+        with self.path.open("rb") as handle:
+            handle.seek(first)
+            return self._lines(handle.read(max(0, end - first)), first, False)
+
+    def events_between(self, start_epoch: int, end_epoch: int) -> list[dict[str, Any]]:
+        """Return events created within the window, scanning only its days."""
+        index = self._locked_index()
+        if index is None:
+            return []
+        ranges = [
+            bounds
+            for day, bounds in index["day_ranges"].items()
+            if self._day(start_epoch) <= day <= self._day(end_epoch)
+        ]
+        if not ranges:
+            return []
         values = []
-        for line_number, line in enumerate(
-            self.path.read_text(encoding="utf-8").splitlines(), 1
+        for offset, line in self._read_range(
+            min(first for first, _end in ranges), max(end for _first, end in ranges)
         ):
-            if not line.strip():
-                continue
-            try:
-                values.append(validate_record(json.loads(line), EVENT_SCHEMA))
-            except Exception as exc:
-                raise ValueError(
-                    f"corrupt operational event line {line_number}: {exc}"
-                ) from exc
-        return values[-limit:]
+            event = self._event(offset, line)
+            if start_epoch <= int(event.get("created_at_epoch") or 0) <= end_epoch:
+                values.append(event)
+        return values
+
+    def latest_event(self, event_type: str) -> dict[str, Any] | None:
+        index = self._locked_index()
+        offset = (index or {}).get("latest_offsets", {}).get(event_type)
+        if offset is None:
+            return None
+        with self.path.open("rb") as handle:
+            handle.seek(offset)
+            return self._event(offset, handle.readline())
 
     def throughput_metrics(self, start_epoch: int, end_epoch: int) -> dict[str, Any]:
-        values = [
-            event
-            for event in self.events(limit=100_000)
-            if start_epoch
-            <= int(event.get("created_at_epoch") or 0)
-            <= end_epoch
+        """Combine daily throughput buckets, reading raw events only for the
+        partial days at either edge of the window."""
+        index = self._locked_index()
+        if index is None:
+            return summarize_throughput([], start_epoch, end_epoch)
+        throughput = index["throughput"]
+        start_day = self._day(start_epoch)
+        end_day = self._day(end_epoch)
+        if throughput["from_day"] and start_day < throughput["from_day"]:
+            return self.throughput_metrics_full_scan(start_epoch, end_epoch)
+        buckets = [
+            bucket
+            for day, bucket in throughput["days"].items()
+            if start_day < day < end_day
         ]
-        selected = {
-            event.get("assignment_id"): event
-            for event in values
-            if event.get("event_type") == "assignment_selected"
-            and event.get("assignment_id")
-        }
-        dispositions = {
-            event.get("assignment_id"): event
-            for event in values
-            if event.get("event_type") == "assignment_disposition"
-            and event.get("assignment_id")
-        }
-        implementation_selected = {
-            assignment_id
-            for assignment_id, event in selected.items()
-            if (event.get("details") or {}).get("assignment_type")
-            in {
-                "governance-document-mutation",
-                "code-implementation",
-                "ci-integration-repair",
-            }
-        }
-        analysis_selected = {
-            assignment_id
-            for assignment_id, event in selected.items()
-            if (event.get("details") or {}).get("assignment_type")
-            in {"read-only-analysis", "no-op-verification"}
-        }
-        analysis_completed = {
-            assignment_id
-            for assignment_id, event in dispositions.items()
-            if (event.get("details") or {}).get("disposition")
-            in {"analysis-completed", "no-op-verification-completed"}
-        }
-        implementation_completed = {
-            event.get("assignment_id")
-            for event in values
-            if event.get("event_type") == "implementation_completed"
-            and event.get("assignment_id")
-        }
-        post_main_verified = {
-            event.get("assignment_id")
-            for event in values
-            if event.get("event_type") == "post_main_verified"
-            and event.get("assignment_id")
-        }
-        merged = {
-            event.get("assignment_id")
-            for event in values
-            if event.get("event_type") == "mr_merged"
-            and event.get("assignment_id")
-        }
-        retries = sum(event.get("event_type") == "assignment_retry" for event in values)
-        grants_consumed = sum(
-            event.get("event_type") == "grant_consumed" for event in values
-        )
-        blocked = sum(
-            (event.get("details") or {}).get("disposition")
-            in {"blocked", "failed", "recovery-required"}
-            for event in dispositions.values()
+        for day in {start_day, end_day}:
+            if day not in index["day_ranges"]:
+                continue
+            bucket = _throughput_bucket()
+            for offset, line in self._read_range(*index["day_ranges"][day]):
+                event = self._event(offset, line)
+                epoch = int(event.get("created_at_epoch") or 0)
+                if self._day(epoch) == day and start_epoch <= epoch <= end_epoch:
+                    _fold_throughput(bucket, offset, event)
+            buckets.append(bucket)
+        return summarize_throughput(
+            _throughput_events(_merge_throughput(buckets)), start_epoch, end_epoch
         )
 
-        def average_duration(end_event_type: str) -> int | None:
-            ends = {
-                event.get("assignment_id"): int(event.get("created_at_epoch") or 0)
-                for event in values
-                if event.get("event_type") == end_event_type
-                and event.get("assignment_id")
-            }
-            durations = [
-                ends[assignment_id]
-                - int(event.get("created_at_epoch") or ends[assignment_id])
-                for assignment_id, event in selected.items()
-                if assignment_id in ends
-            ]
-            return round(sum(durations) / len(durations)) if durations else None
-
-        analysis_work_items = {
-            selected[assignment_id].get("work_item")
-            for assignment_id in analysis_completed
-            if assignment_id in selected
-        }
-        implementation_work_items = {
-            selected[assignment_id].get("work_item")
-            for assignment_id in implementation_selected
-            if assignment_id in selected
-        }
-
-        def percent(numerator: int, denominator: int) -> int:
-            return round(numerator * 100 / denominator) if denominator else 0
-
-        return {
-            "start_epoch": start_epoch,
-            "end_epoch": end_epoch,
-            "window_days": max(1, round((end_epoch - start_epoch) / 86_400)),
-            "assignments_selected": len(selected),
-            "analysis_selected": len(analysis_selected),
-            "analysis_completed": len(analysis_completed),
-            "implementation_selected": len(implementation_selected),
-            "implementation_commits": len(implementation_completed),
-            "merged": len(merged),
-            "post_main_verified": len(post_main_verified),
-            "blocked_or_failed": blocked,
-            "retries": retries,
-            "grants_consumed": grants_consumed,
-            "analysis_to_implementation_percent": percent(
-                len(analysis_work_items & implementation_work_items),
-                len(analysis_work_items),
-            ),
-            "implementation_to_merge_percent": percent(
-                len(merged), len(implementation_selected)
-            ),
-            "merge_to_verified_percent": percent(
-                len(post_main_verified), len(merged)
-            ),
-            "retry_rate_percent": percent(retries, len(selected)),
-            "average_implementation_seconds": average_duration(
-                "implementation_completed"
-            ),
-            "average_integration_seconds": average_duration(
-                "post_main_verified"
-            ),
-        }
+    def throughput_metrics_full_scan(
+        self, start_epoch: int, end_epoch: int
+    ) -> dict[str, Any]:
+        """Reference implementation over every event in the window."""
+        return summarize_throughput(
+            self.events_between(start_epoch, end_epoch), start_epoch, end_epoch
+        )
 
 
 def record_event(
@@ -388,6 +707,11 @@ def record_event(
     )
 
 
+def event_batch(root: Path, source: str):
+    """Group the events emitted under ``root`` on this thread into one commit."""
+    return OperationalEventLog(root, source).batch()
+
+
 def record_engineering_retrospective(
     root: Path, assignment: dict[str, Any], *, source: str
 ) -> dict[str, Any]:
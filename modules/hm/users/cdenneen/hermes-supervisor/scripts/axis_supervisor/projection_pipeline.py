@@ -0,0 +1,102 @@
+import hashlib
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+from .state_store import file_signature
+
+_local = threading.local()
+
+
+def _digest(value: Any) -> str:
+    return hashlib.blake2b(
+        json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode(),
+        digest_size=16,
+    ).hexdigest()
+
+
+class ProjectionPipeline:
+    """Projection stages of one supervisor cycle, each computed once per input.
+
+    A stage declares what it is derived from: ``inputs`` are values and
+    ``files`` are paths it reads, keyed by their stat signature.  The stage
+    re-runs only when that digest differs from its previous run in this
+    pipeline.  The output of an earlier stage is keyed by that stage's own
+    digest, so large projections are never serialized to be compared.  Stages
+    that read undeclared state pass ``memoize=False`` and are only timed.
+    """
+
+    def __init__(self) -> None:
+        self._results: dict[str, tuple[str, Any]] = {}
+        self._produced: dict[int, tuple[Any, str]] = {}
+        self._unmemoized_runs = 0
+        self.timings: dict[str, dict[str, Any]] = {}
+
+    def _input_digest(self, value: Any) -> str:
+        produced = self._produced.get(id(value))
+        if produced is not None and produced[0] is value:
+            return produced[1]
+        return _digest(value)
+
+    def stage(
+        self,
+        name: str,
+        compute: Callable[[], Any],
+        *,
+        inputs: Iterable[Any] = (),
+        files: Iterable[Path] = (),
+        memoize: bool = True,
+    ) -> Any:
+        timing = self.timings.setdefault(
+            name, {"runs": 0, "reused": 0, "seconds": 0.0}
+        )
+        if memoize:
+            key = _digest(
+                [
+                    name,
+                    [self._input_digest(value) for value in inputs],
+                    [[str(path), file_signature(path)] for path in files],
+                ]
+            )
+            cached = self._results.get(name)
+            if cached is not None and cached[0] == key:
+                timing["reused"] += 1
+                return cached[1]
+        else:
+            self._unmemoized_runs += 1
+            key = f"{name}:{self._unmemoized_runs}"
+        started = time.perf_counter()
+        value = compute()
+        timing["seconds"] = round(
+            timing["seconds"] + time.perf_counter() - started, 6
+        )
+        timing["runs"] += 1
+        if memoize:
+            self._results[name] = (key, value)
+        self._produced[id(value)] = (value, key)
+        return value
+
+    def report(self) -> dict[str, dict[str, Any]]:
+        return {name: dict(value) for name, value in sorted(self.timings.items())}
+
+
+def current() -> ProjectionPipeline:
+    """The pipeline of the enclosing ``cycle_scope``, or a fresh one."""
+    return getattr(_local, "pipeline", None) or ProjectionPipeline()
+
+
+@contextmanager
+def cycle_scope() -> Iterator[ProjectionPipeline]:
+    """Share one pipeline across every rebuild of a trigger on this thread."""
+    pipeline = getattr(_local, "pipeline", None)
+    if pipeline is not None:
+        yield pipeline
+        return
+    _local.pipeline = pipeline = ProjectionPipeline()
+    try:
+        yield pipeline
+    finally:
+        _local.pipeline = None
@@ -0,0 +1,132 @@
+import subprocess
+from pathlib import Path
+from typing import Iterable
+
+
+def _git(
+    git: str, path: Path, *args: str, stdin: str | None = None, timeout: int = 60
+) -> str:
+    return subprocess.run(
+        [git, *args],
+        cwd=str(path),
+        input=stdin,
+        text=True,
+        capture_output=True,
+        check=True,
+        timeout=timeout,
+    ).stdout
+
+
+def resolve_commits(
+    git: str, path: Path, revisions: Iterable[str]
+) -> dict[str, str | None]:
+    """Resolve revisions to commit ids with one ``cat-file --batch-check``.
+
+    Revisions that are missing or do not peel to a commit map to None.
+    """
+    unique = list(dict.fromkeys(value for value in revisions if value))
+    if not unique:
+        return {}
+    raw = _git(
+        git,
+        path,
+        "cat-file",
+        "--batch-check=%(objectname) %(objecttype)",
+        stdin="".join(f"{value}^{{commit}}\n" for value in unique),
+    )
+    resolved: dict[str, str | None] = {}
+    for revision, line in zip(unique, raw.splitlines()):
+        fields = line.split()
+        resolved[revision] = (
+            fields[0] if len(fields) == 2 and fields[1] == "commit" else None
+        )
+    return resolved
+
+
+def integrated_commits(
+    git: str, path: Path, commits: Iterable[str], target: str
+) -> set[str]:
+    """Return the subset of ``commits`` already reachable from ``target``.
+
+    One ``rev-list`` walk replaces a ``merge-base --is-ancestor`` per ref: every
+    commit it prints is missing from ``target``, so the remainder is merged.
+    """
+    candidates = sorted({value for value in commits if value})
+    if not candidates:
+        return set()
+    raw = _git(
+        git,
+        path,
+        "rev-list",
+        "--stdin",
+        stdin="".join(f"{value}\n" for value in candidates) + f"^{target}\n",
+        timeout=120,
+    )
+    return set(candidates) - set(raw.split())
+
+
+def list_worktrees(git: str, path: Path) -> list[dict[str, str]]:
+    raw = _git(git, path, "worktree", "list", "--porcelain")
+    worktrees = []
+    for block in (block for block in raw.strip().split("\n\n") if block.strip()):
+        fields = {}
+        for line in block.splitlines():
+            key, _, value = line.partition(" ")
+            fields[key] = value
+        worktrees.append(fields)
+    return worktrees
+
+
+def list_refs(
+    git: str, path: Path, *prefixes: str
+) -> dict[str, list[tuple[str, str]]]:
+    """Return ``(short name, object id)`` pairs per prefix from one for-each-ref."""
+    raw = _git(
+        git,
+        path,
+        "for-each-ref",
+        "--format=%(refname)|%(refname:short)|%(objectname)",
+        *prefixes,
+    )
+    refs: dict[str, list[tuple[str, str]]] = {prefix: [] for prefix in prefixes}
+    for line in raw.splitlines():
+        if line.count("|") < 2:
+            continue
+        refname, short, objectname = line.split("|", 2)
+        for prefix in prefixes:
+            if refname == prefix or refname.startswith(prefix + "/"):
+                refs[prefix].append((short, objectname))
+                break
+    return refs
+
+
+def worktree_dirty(git: str, path: Path) -> bool | None:
+    if not path.exists():
+        return None
+    try:
+        return bool(_git(git, path, "status", "--porcelain").strip())
+    except Exception:
+        return None
+
+
+def branch_divergence(git: str, path: Path, base: str, branch: str) -> dict:
+    """Merge base, ahead/behind counts and changed paths of ``branch`` vs ``base``."""
+    merge_base = _git(git, path, "merge-base", base, branch).strip()
+    behind, ahead = (
+        _git(git, path, "rev-list", "--left-right", "--count", f"{base}...{branch}")
+        .strip()
+        .split()
+    )
+    changed_paths = [
+        value
+        for value in _git(
+            git, path, "diff", "--name-only", f"{merge_base}..{branch}"
+        ).splitlines()
+        if value
+    ]
+    return {
+        "merge_base": merge_base,
+        "ahead": int(ahead),
+        "behind": int(behind),
+        "changed_paths": changed_paths,
+    }
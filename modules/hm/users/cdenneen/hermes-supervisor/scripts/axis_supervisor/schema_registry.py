@@ -1,12 +1,17 @@
+import hashlib
 import json
 import os
+import threading
+from collections import OrderedDict
 from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from jsonschema import Draft202012Validator, FormatChecker
 from referencing import Registry, Resource
 
+from .state_store import file_signature, store_for, write_text_atomic
+
 
 SCHEMA_FILES = {
     "axis.external-development-supervisor.active-mission": "active-mission.schema.json",
@@ -51,6 +56,15 @@ RUNTIME_SCHEMAS = Path(
         / "schemas",
     )
 )
+VALIDATED_RECORD_LIMIT = 512
+
+# Digests of record text that already passed validation, keyed with the schema
+# and schema directory.  Validation is deterministic, so an unchanged file read
+# again (or read back after ``write_record``) only needs to be parsed.
+_validated: OrderedDict[tuple[str, str, str], None] = OrderedDict()
+_validated_lock = threading.Lock()
+_snapshots: dict[tuple[str, str], tuple[str, dict[str, Any]]] = {}
+_snapshots_lock = threading.Lock()
 
 
 class RecordError(ValueError):
@@ -78,14 +92,20 @@ def _schema_directory(record_path: Path | None = None) -> Path:
     if configured:
         return Path(configured)
     if record_path is not None:
-        for parent in record_path.resolve().parents:
-            candidate = parent / "schemas"
-            if candidate.is_dir():
-                return candidate
+        return _record_schema_directory(str(record_path))
+    return SOURCE_SCHEMAS if SOURCE_SCHEMAS.is_dir() else RUNTIME_SCHEMAS
+
+
+@lru_cache(maxsize=1024)
+def _record_schema_directory(record_path: str) -> Path:
+    for parent in Path(record_path).resolve().parents:
+        candidate = parent / "schemas"
+        if candidate.is_dir():
+            return candidate
     return SOURCE_SCHEMAS if SOURCE_SCHEMAS.is_dir() else RUNTIME_SCHEMAS
 
 
-@lru_cache(maxsize=32)
+@lru_cache(maxsize=128)
 def _load_schema(schema_id: str, directory: str) -> dict[str, Any]:
     filename = SCHEMA_FILES.get(schema_id)
     if filename is None:
@@ -110,6 +130,22 @@ def _schema_registry(directory: str) -> Registry:
     return registry
 
 
+@lru_cache(maxsize=128)
+def _compiled_validator(schema_id: str, directory: str) -> Draft202012Validator:
+    return Draft202012Validator(
+        _load_schema(schema_id, directory),
+        registry=_schema_registry(directory),
+        format_checker=FormatChecker(),
+    )
+
+
+def schema_digest(schema_id: str, record_path: Path | None = None) -> str:
+    """Return a stable digest of a registered schema's current definition."""
+    schema = _load_schema(schema_id, str(_schema_directory(record_path)))
+    encoded = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return "sha256:" + hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
 def validate_record(
     value: Any,
     expected_schema: str,
@@ -127,9 +163,8 @@ def validate_record(
     version = value.get("schema_version")
     if not version:
         raise PartialRecordError(f"{expected_schema} schema_version is missing")
-    schema = schema_definition or _load_schema(
-        expected_schema, str(_schema_directory(record_path))
-    )
+    directory = str(_schema_directory(record_path))
+    schema = schema_definition or _load_schema(expected_schema, directory)
     expected_version = (
         (schema.get("properties") or {}).get("schema_version") or {}
     ).get("const")
@@ -137,13 +172,17 @@ def validate_record(
         raise RecordVersionError(
             f"unsupported {expected_schema} schema_version: {version}; expected {expected_version}"
         )
-    errors = sorted(
+    validator = (
         Draft202012Validator(
             schema,
-            registry=_schema_registry(str(_schema_directory(record_path))),
+            registry=_schema_registry(directory),
             format_checker=FormatChecker(),
-        ).iter_errors(value),
-        key=lambda error: list(error.absolute_path),
+        )
+        if schema_definition
+        else _compiled_validator(expected_schema, directory)
+    )
+    errors = sorted(
+        validator.iter_errors(value), key=lambda error: list(error.absolute_path)
     )
     if errors:
         message = "; ".join(error.message for error in errors[:3])
@@ -153,18 +192,96 @@ def validate_record(
     return value
 
 
+def _validation_key(
+    text: str, expected_schema: str, path: Path
+) -> tuple[str, str, str]:
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=20).hexdigest()
+    return expected_schema, str(_schema_directory(path)), digest
+
+
+def _remember_valid(key: tuple[str, str, str]) -> None:
+    with _validated_lock:
+        _validated[key] = None
+        _validated.move_to_end(key)
+        while len(_validated) > VALIDATED_RECORD_LIMIT:
+            _validated.popitem(last=False)
+
+
+def warm_schemas(record_path: Path | None = None) -> None:
+    """Compile every registered validator ahead of the first record read."""
+    directory = str(_schema_directory(record_path))
+    for schema_id in SCHEMA_FILES:
+        _compiled_validator(schema_id, directory)
+
+
 def read_record(path: Path, expected_schema: str) -> dict[str, Any]:
+    store = store_for(path)
+    # A file missing from the store or changed outside it is read from disk
+    # but not adopted here: reads never write, and ``query`` re-adopts it.
+    text = store.read(path, expected_schema) if store is not None else None
+    if text is None:
+        try:
+            text = path.read_text(encoding="utf-8")
+        except OSError as exc:
+            raise CorruptRecordError(f"cannot read record {path}: {exc}") from exc
     try:
-        value = json.loads(path.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError) as exc:
+        value = json.loads(text)
+    except json.JSONDecodeError as exc:
         raise CorruptRecordError(f"cannot read record {path}: {exc}") from exc
-    return validate_record(value, expected_schema, record_path=path)
+    key = _validation_key(text, expected_schema, path)
+    with _validated_lock:
+        known = key in _validated
+    if not known:
+        validate_record(value, expected_schema, record_path=path)
+        _remember_valid(key)
+    return value
+
+
+def _copy_json(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    return value
+
+
+def read_snapshot(
+    path: Path,
+    expected_schema: str,
+    load: Callable[[Path], dict[str, Any]] | None = None,
+) -> dict[str, Any]:
+    """Return a record from one validated copy shared by every reader in the process.
+
+    The shared copy is reused while the file keeps its mtime, size and inode,
+    so each call costs one ``stat`` and an on-disk change (a kill switch flip,
+    a new inventory generation) is seen by the very next read.  Every call
+    returns its own deep copy, so a caller that mutates or embeds part of the
+    value never changes what later readers see.  ``load`` replaces
+    ``read_record`` for records that are migrated on read.
+    """
+    load = load or (lambda record_path: read_record(record_path, expected_schema))
+    store = store_for(path)
+    signature = file_signature(path)
+    if signature is None or (store is not None and store.has_pending(path)):
+        return load(path)
+    key = (str(path), expected_schema)
+    with _snapshots_lock:
+        cached = _snapshots.get(key)
+    if cached is not None and cached[0] == signature:
+        return _copy_json(cached[1])
+    value = load(path)
+    if file_signature(path) == signature:
+        with _snapshots_lock:
+            _snapshots[key] = (signature, _copy_json(value))
+    return value
 
 
 def write_record(path: Path, value: dict[str, Any], expected_schema: str) -> None:
     validate_record(value, expected_schema, record_path=path)
-    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
-    tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(json.dumps(value, indent=2) + "\n", encoding="utf-8")
-    tmp.chmod(0o600)
-    tmp.replace(path)
+    text = json.dumps(value, indent=2) + "\n"
+    store = store_for(path)
+    if store is not None:
+        store.write(path, expected_schema, value, text)
+    else:
+        write_text_atomic(path, text)
+    _remember_valid(_validation_key(text, expected_schema, path))
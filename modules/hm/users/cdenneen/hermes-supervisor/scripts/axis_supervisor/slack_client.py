@@ -0,0 +1,176 @@
+import http.client
+import json
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+from .fetch_pool import RequestBudget
+
+SLACK_API_URL = os.environ.get(
+    "AXIS_SUPERVISOR_SLACK_API_URL", "https://slack.com/api"
+)
+RATE_LIMIT_RETRIES = int(
+    os.environ.get("AXIS_SUPERVISOR_SLACK_RATE_LIMIT_RETRIES", "3")
+)
+
+# Slack Web API rate tiers in requests per minute.  chat.postMessage is
+# "special": roughly one message per second per channel.
+METHOD_TIERS = {
+    "auth.test": 100,
+    "chat.postMessage": 60,
+    "chat.update": 50,
+    "conversations.history": 50,
+    "conversations.open": 50,
+}
+DEFAULT_TIER = 20
+# Methods that are safe to send twice.  A keep-alive connection dropped
+# mid-call may already have delivered the request, so only these are retried
+# on a fresh connection; a dropped chat.postMessage is raised so the outbox
+# records it as a delivery failure instead of silently posting twice.
+IDEMPOTENT_METHODS = frozenset(
+    {"auth.test", "chat.update", "conversations.history", "conversations.open"}
+)
+
+
+class SlackClient:
+    """Keep-alive Slack Web API client shared by every reporter thread.
+
+    Each thread keeps one persistent HTTP connection.  Calls draw from a token
+    bucket per rate tier (per channel for ``chat.postMessage``); a 429 pauses
+    that bucket for ``Retry-After`` seconds before the call is retried.
+    """
+
+    def __init__(
+        self,
+        base_url: str = SLACK_API_URL,
+        timeout: float = 30,
+        tiers: dict[str, int] | None = None,
+    ):
+        parts = urlsplit(base_url)
+        self.scheme = parts.scheme
+        self.host = parts.netloc
+        self.path = parts.path.rstrip("/")
+        self.timeout = timeout
+        self.tiers = METHOD_TIERS if tiers is None else tiers
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._budgets: dict[tuple[str, str], RequestBudget] = {}
+        self._paused_until: dict[tuple[str, str], float] = {}
+        self.requests = 0
+        self.connections = 0
+        self.rate_limited = 0
+
+    def _connection(self) -> tuple[http.client.HTTPConnection, bool]:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            return connection, True
+        factory = (
+            http.client.HTTPSConnection
+            if self.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        connection = factory(self.host, timeout=self.timeout)
+        self._local.connection = connection
+        with self._lock:
+            self.connections += 1
+        return connection, False
+
+    def _discard_connection(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        self._local.connection = None
+        if connection is not None:
+            connection.close()
+
+    def _bucket(self, method: str, payload: dict) -> tuple[str, str]:
+        if method == "chat.postMessage":
+            return method, str(payload.get("channel") or "")
+        return str(self.tiers.get(method, DEFAULT_TIER)), ""
+
+    def _wait(self, bucket: tuple[str, str], method: str) -> None:
+        with self._lock:
+            budget = self._budgets.get(bucket)
+            if budget is None:
+                rate = self.tiers.get(method, DEFAULT_TIER)
+                budget = RequestBudget(rate, burst=max(1, rate // 10))
+                self._budgets[bucket] = budget
+            paused = self._paused_until.get(bucket, 0.0) - time.monotonic()
+        if paused > 0:
+            time.sleep(paused)
+        budget.acquire()
+
+    def _exchange(
+        self,
+        connection: http.client.HTTPConnection,
+        method: str,
+        body: bytes,
+        token: str,
+    ) -> tuple[int, bytes, str]:
+        try:
+            connection.request(
+                "POST",
+                f"{self.path}/{method}",
+                body,
+                {
+                    "Authorization": f"Bearer {token}",
+                    "Content-Type": "application/json; charset=utf-8",
+                },
+            )
+            response = connection.getresponse()
+            raw = response.read()
+        except Exception:
+            self._discard_connection()
+            raise
+        if response.getheader("Connection", "").lower() == "close":
+            self._discard_connection()
+        return response.status, raw, response.getheader("Retry-After") or ""
+
+    def _send(self, token: str, method: str, body: bytes) -> tuple[int, bytes, str]:
+        connection, reused = self._connection()
+        try:
+            return self._exchange(connection, method, body, token)
+        except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+            # Only a keep-alive connection the server closed while idle is
+            # retried; a fresh connection failing is a real error.
+            if not reused or method not in IDEMPOTENT_METHODS:
+                raise
+        connection, _ = self._connection()
+        return self._exchange(connection, method, body, token)
+
+    def call(self, token: str, method: str, payload: dict) -> dict:
+        body = json.dumps(payload).encode("utf-8")
+        bucket = self._bucket(method, payload)
+        attempt = 0
+        while True:
+            self._wait(bucket, method)
+            status, raw, retry_after = self._send(token, method, body)
+            with self._lock:
+                self.requests += 1
+            if status != 429 or attempt >= RATE_LIMIT_RETRIES:
+                break
+            attempt += 1
+            with self._lock:
+                self.rate_limited += 1
+                self._paused_until[bucket] = max(
+                    self._paused_until.get(bucket, 0.0),
+                    time.monotonic() + float(retry_after or 1),
+                )
+        if status >= 400:
+            raise RuntimeError(f"Slack {method} failed: HTTP {status}")
+        value = json.loads(raw)
+        if not isinstance(value, dict) or not value.get("ok"):
+            error = value.get("error") if isinstance(value, dict) else None
+            raise RuntimeError(f"Slack {method} failed: {error}")
+        return value
+
+
+_SHARED: SlackClient | None = None
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_client() -> SlackClient:
+    global _SHARED
+    with _SHARED_LOCK:
+        if _SHARED is None:
+            _SHARED = SlackClient()
+        return _SHARED
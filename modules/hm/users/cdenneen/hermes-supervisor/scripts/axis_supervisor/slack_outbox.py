@@ -0,0 +1,183 @@
+import fcntl
+import json
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator
+
+from .schema_registry import read_record, write_record
+
+OUTBOX_SCHEMA = "axis.external-development-supervisor.slack-outbox"
+DELIVERY_STAGES = frozenset(
+    {
+        "notification_created",
+        "notification_queued",
+        "notification_send_attempted",
+        "Slack_API_accepted",
+        "Slack_message_created",
+        "Slack_message_updated",
+        "Slack_message_verified",
+        "delivery_failed",
+        "delivery_unknown",
+    }
+)
+DELIVERED_RETENTION = 200
+STAGE_HISTORY_LIMIT = 100
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def apply_journal_entry(notifications: dict[str, dict], entry: dict) -> None:
+    """Fold one journal line into ``notifications`` (keyed by notification id).
+
+    A line either queues a whole notification or records one stage transition
+    with the fields it changed.  A transition is identified by its stage and
+    timestamp; one already anywhere in the stage history is skipped, so
+    replaying a journal over a snapshot that already absorbed it (a compaction
+    interrupted before truncation) is a no-op.
+    """
+    if "notification" in entry:
+        item = entry["notification"]
+        notifications[item["notification_id"]] = item
+        return
+    item = notifications.get(entry["notification_id"])
+    if item is None:
+        return
+    transition = {"stage": entry["stage"], "at": entry["at"]}
+    history = item.setdefault("stage_history", [])
+    if transition in history:
+        return
+    history.append(transition)
+    item["stage_history"] = history[-STAGE_HISTORY_LIMIT:]
+    item["current_stage"] = entry["stage"]
+    item.update(entry.get("fields") or {})
+
+
+class SlackOutbox:
+    """Slack notification outbox: a compacted snapshot plus a transition journal.
+
+    ``slack-outbox.json`` holds the state as of the last compaction.  Queued
+    notifications and every later stage transition are appended to
+    ``slack-outbox.journal.jsonl``; readers replay the journal over the snapshot.
+    ``compact`` folds the journal back into the snapshot, trims delivered
+    notifications to the newest ``DELIVERED_RETENTION`` and truncates it.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.path = root / "slack-outbox.json"
+        self.journal_path = root / "slack-outbox.journal.jsonl"
+        self.lock_path = root / "slack-outbox.lock"
+        self._pending: list[dict[str, Any]] = []
+        self._pending_lock = threading.Lock()
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        self.root.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with self.lock_path.open("a", encoding="utf-8") as lock:
+            os.chmod(self.lock_path, 0o600)
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _snapshot(self) -> dict[str, Any]:
+        if self.path.exists():
+            return read_record(self.path, OUTBOX_SCHEMA)
+        return {
+            "schema": OUTBOX_SCHEMA,
+            "schema_version": "1.0.0",
+            "notifications": [],
+            "updated_at": _utc_now(),
+        }
+
+    def _replay(self) -> dict[str, Any]:
+        outbox = self._snapshot()
+        notifications = {
+            item["notification_id"]: item for item in outbox["notifications"]
+        }
+        if self.journal_path.exists():
+            with self.journal_path.open(encoding="utf-8") as handle:
+                for number, line in enumerate(handle, start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError as exc:
+                        raise ValueError(
+                            f"corrupt Slack outbox journal line {number}"
+                        ) from exc
+                    apply_journal_entry(notifications, entry)
+        outbox["notifications"] = list(notifications.values())
+        return outbox
+
+    def load(self) -> dict[str, Any]:
+        with self._locked():
+            return self._replay()
+
+    def _append(self, entries: list[dict[str, Any]]) -> None:
+        with self._locked():
+            with self.journal_path.open("a", encoding="utf-8") as handle:
+                os.chmod(self.journal_path, 0o600)
+                handle.write(
+                    "".join(
+                        json.dumps(entry, sort_keys=True) + "\n" for entry in entries
+                    )
+                )
+                handle.flush()
+                os.fsync(handle.fileno())
+
+    def enqueue(self, notifications: list[dict[str, Any]]) -> None:
+        if notifications:
+            self._append([{"notification": item} for item in notifications])
+
+    def advance(self, item: dict[str, Any], stage: str, **fields: Any) -> None:
+        """Move ``item`` to ``stage`` in memory and stage the journal line.
+
+        Nothing is written until ``flush``, so a group of notifications
+        advancing together costs one append.
+        """
+        if stage not in DELIVERY_STAGES:
+            raise ValueError(f"unsupported Slack delivery stage: {stage}")
+        entry = {
+            "notification_id": item["notification_id"],
+            "stage": stage,
+            "at": _utc_now(),
+            "fields": fields,
+        }
+        apply_journal_entry({item["notification_id"]: item}, entry)
+        with self._pending_lock:
+            self._pending.append(entry)
+
+    def flush(self) -> None:
+        with self._pending_lock:
+            entries, self._pending = self._pending, []
+        if entries:
+            self._append(entries)
+
+    def compact(self) -> dict[str, Any]:
+        with self._locked():
+            outbox = self._replay()
+            pending = [
+                item
+                for item in outbox["notifications"]
+                if item["current_stage"] != "Slack_message_verified"
+            ]
+            delivered = [
+                item
+                for item in outbox["notifications"]
+                if item["current_stage"] == "Slack_message_verified"
+            ][-DELIVERED_RETENTION:]
+            outbox["notifications"] = delivered + pending
+            outbox["updated_at"] = _utc_now()
+            write_record(self.path, outbox, OUTBOX_SCHEMA)
+            if self.journal_path.exists():
+                with self.journal_path.open("r+", encoding="utf-8") as handle:
+                    handle.truncate(0)
+                    os.fsync(handle.fileno())
+            return outbox
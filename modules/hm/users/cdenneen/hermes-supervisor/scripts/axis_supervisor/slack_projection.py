@@ -1,12 +1,14 @@
 import hashlib
 import json
+import os
 import re
+import threading
 import time
-import urllib.request
 from datetime import datetime, timezone
 from pathlib import Path
 
-from .dashboard import render_executive_dashboard
+from .assignment_index import AssignmentIndex
+from .dashboard import RENDERER_DIGEST, render_executive_dashboard
 from .decisions import (
     DECISION_DIGEST,
     DECISION_ID,
@@ -14,19 +16,26 @@ from .decisions import (
     SlackDecisionController,
     decision_identity,
 )
+from .fetch_pool import FetchPool
 from .lifecycle import is_terminal
-from .models import validate_assignment
 from .mutation import MutationGate, OperationClass
 from .observability import (
-    DELIVERY_STAGES,
-    OUTBOX_SCHEMA,
     OperationalEventLog,
     is_routine_analysis_event,
     utc_now,
 )
 from .reporting import COMPOSITION, build_roadmap_semantics
 from .schema_registry import read_record, validate_record, write_record
+from .slack_client import shared_client
+from .slack_outbox import DELIVERY_STAGES, SlackOutbox
+from .state_store import write_cache_atomic
 
+SLACK_DELIVERY_WORKERS = int(
+    os.environ.get("AXIS_SUPERVISOR_SLACK_DELIVERY_WORKERS", "4")
+)
+DASHBOARD_REVERIFY_SECONDS = int(
+    os.environ.get("AXIS_SUPERVISOR_DASHBOARD_REVERIFY_SECONDS", "3600")
+)
 
 PROJECTION_BUCKETS = (
     "dashboard",
@@ -42,7 +51,10 @@ class SlackProjection:
         self.root = root
         self.state_path = root / "slack-overview-state.json"
         self.record_path = root / "slack-overview-record.json"
+        self.render_cache_path = root / "slack-dashboard-render-cache.json"
         self.gate = MutationGate(root, source="reporter")
+        self.outbox = SlackOutbox(root)
+        self._write_lock = threading.RLock()
 
     @staticmethod
     def env_file() -> dict[str, str]:
@@ -57,27 +69,7 @@ class SlackProjection:
 
     @staticmethod
     def api(token: str, method: str, payload: dict) -> dict:
-        request = urllib.request.Request(
-            f"https://slack.com/api/{method}",
-            data=json.dumps(payload).encode("utf-8"),
-            headers={
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json; charset=utf-8",
-            },
-        )
-        with urllib.request.urlopen(request, timeout=30) as response:
-            value = json.load(response)
-        if not value.get("ok"):
-            raise RuntimeError(f"Slack {method} failed: {value.get('error')}")
-        return value
-
-    @staticmethod
-    def advance(record: dict, stage: str) -> None:
-        if stage not in DELIVERY_STAGES:
-            raise ValueError(f"unsupported Slack delivery stage: {stage}")
-        record["current_stage"] = stage
-        record.setdefault("stage_history", []).append({"stage": stage, "at": utc_now()})
-        record["stage_history"] = record["stage_history"][-100:]
+        return shared_client().call(token, method, payload)
 
     def verify_message(
         self, token: str, channel: str, ts: str, expected_text: str
@@ -108,34 +100,27 @@ class SlackProjection:
         raise RuntimeError("Slack message readback did not match expected channel/ts/text")
 
     def load_outbox(self) -> dict:
-        path = self.root / "slack-outbox.json"
-        if path.exists():
-            return read_record(path, OUTBOX_SCHEMA)
-        return {
-            "schema": OUTBOX_SCHEMA,
-            "schema_version": "1.0.0",
-            "notifications": [],
-            "updated_at": utc_now(),
-        }
+        return self.outbox.load()
 
-    def write_outbox(self, outbox: dict) -> None:
-        outbox["updated_at"] = utc_now()
+    def write_outbox(self) -> None:
+        """Journal the stage transitions advanced since the last write."""
+        with self._write_lock:
+            decision = self.gate.decide(OperationClass.RECONCILIATION)
+            self.gate.require(decision, OperationClass.RECONCILIATION)
+            self.outbox.flush()
+
+    def compact_outbox(self) -> dict:
         decision = self.gate.decide(OperationClass.RECONCILIATION)
         self.gate.require(decision, OperationClass.RECONCILIATION)
-        write_record(self.root / "slack-outbox.json", outbox, OUTBOX_SCHEMA)
+        return self.outbox.compact()
 
-    def live_assignments(self) -> list[dict]:
-        values = []
-        for path in sorted((self.root / "assignments").glob("*.json")):
-            try:
-                values.append(
-                    validate_assignment(
-                        json.loads(path.read_text(encoding="utf-8")), self.root
-                    )
-                )
-            except Exception:  # noqa: BLE001, S112 - invalid live records are omitted
-                continue
-        return values
+    def live_assignments(self) -> list[dict] | None:
+        """Active assignment records, or ``None`` when none exist on disk."""
+        index = AssignmentIndex(self.root)
+        if not any(index.assignments.glob("*.json")):
+            return None
+        # Invalid live records are omitted from the projection.
+        return index.active(errors=[])
 
     def cron_jobs(self) -> list[dict]:
         path = Path.home() / ".hermes" / "cron" / "jobs.json"
@@ -323,6 +308,27 @@ class SlackProjection:
 
     def process_outbox(self, token: str, channel: str, state: dict | None = None) -> dict:
         outbox = self.load_outbox()
+        try:
+            self._deliver_outbox(outbox, token, channel, state)
+        except BaseException as error:
+            # Transitions journaled before the failure are still compacted, but
+            # a compaction failure must not replace the delivery error.
+            try:
+                self._compact_journal()
+            except Exception as compact_error:
+                error.add_note(f"outbox compaction failed: {compact_error!r}")
+            raise
+        self._compact_journal()
+        return outbox
+
+    def _compact_journal(self) -> None:
+        journal = self.outbox.journal_path
+        if journal.exists() and journal.stat().st_size:
+            self.compact_outbox()
+
+    def _deliver_outbox(
+        self, outbox: dict, token: str, channel: str, state: dict | None
+    ) -> None:
         state = state if state is not None else self.load_state()
         self.backfill_projection_buckets(state)
         now = int(time.time())
@@ -334,10 +340,13 @@ class SlackProjection:
         ]
         if suppressed:
             for item in suppressed:
-                self.advance(item, "Slack_message_verified")
-                item["last_error"] = None
-                item["next_attempt_epoch"] = 0
-            self.write_outbox(outbox)
+                self.outbox.advance(
+                    item,
+                    "Slack_message_verified",
+                    last_error=None,
+                    next_attempt_epoch=0,
+                )
+            self.write_outbox()
         pending = [
             item
             for item in outbox["notifications"]
@@ -345,91 +354,127 @@ class SlackProjection:
             and int(item.get("next_attempt_epoch") or 0) <= now
         ]
         if not pending:
-            return outbox
+            return
         recovery = any(item["current_stage"] == "delivery_failed" for item in pending)
         groups = (
             [pending[:20]]
             if recovery
             else self.aggregate_notifications(pending[:50])[:10]
         )
+        # Groups for different projection keys touch different Slack messages and
+        # are delivered concurrently; groups sharing a key stay in order.
+        lanes: dict[tuple[str, str] | None, list[list[dict]]] = {}
         for group in groups:
-            text = self.render_event_group(group, recovery)
-            projection = self.projection_key(group[-1]["event"])
-            text_fingerprint = hashlib.sha256(text.encode()).hexdigest()
-            for item in group:
-                item["attempts"] += 1
-                self.advance(item, "notification_send_attempted")
-            self.write_outbox(outbox)
-            try:
-                existing_ts = (
-                    (state.get("projection_timestamps") or {})
-                    .get(projection[0], {})
-                    .get(projection[1])
-                    if projection
-                    else None
-                )
-                existing_fingerprint = (
-                    (state.get("projection_fingerprints") or {})
-                    .get(projection[0], {})
-                    .get(projection[1])
-                    if projection
-                    else None
-                )
-                if existing_ts and existing_fingerprint == text_fingerprint:
-                    response = {"ok": True, "channel": channel, "ts": existing_ts}
+            lanes.setdefault(self.projection_key(group[-1]["event"]), []).append(group)
+
+        def deliver_lane(lane: list[list[dict]]) -> None:
+            for group in lane:
+                self._deliver_group(group, recovery, token, channel, state, now)
+
+        with FetchPool(SLACK_DELIVERY_WORKERS) as pool:
+            pool.map(deliver_lane, list(lanes.values()))
+
+    def _deliver_group(
+        self,
+        group: list[dict],
+        recovery: bool,
+        token: str,
+        channel: str,
+        state: dict,
+        now: int,
+    ) -> None:
+        text = self.render_event_group(group, recovery)
+        projection = self.projection_key(group[-1]["event"])
+        text_fingerprint = hashlib.sha256(text.encode()).hexdigest()
+        for item in group:
+            self.outbox.advance(
+                item, "notification_send_attempted", attempts=item["attempts"] + 1
+            )
+        self.write_outbox()
+        try:
+            existing_ts = (
+                (state.get("projection_timestamps") or {})
+                .get(projection[0], {})
+                .get(projection[1])
+                if projection
+                else None
+            )
+            existing_fingerprint = (
+                (state.get("projection_fingerprints") or {})
+                .get(projection[0], {})
+                .get(projection[1])
+                if projection
+                else None
+            )
+            if existing_ts and existing_fingerprint == text_fingerprint:
+                response = {"ok": True, "channel": channel, "ts": existing_ts}
+                operation_stage = "Slack_message_updated"
+            elif existing_ts:
+                try:
+                    response = self.api(
+                        token,
+                        "chat.update",
+                        {"channel": channel, "ts": existing_ts, "text": text},
+                    )
                     operation_stage = "Slack_message_updated"
-                elif existing_ts:
-                    try:
-                        response = self.api(
-                            token,
-                            "chat.update",
-                            {"channel": channel, "ts": existing_ts, "text": text},
-                        )
-                        operation_stage = "Slack_message_updated"
-                    except RuntimeError as exc:
-                        if "message_not_found" not in str(exc):
-                            raise
-                        response = self.api(
-                            token,
-                            "chat.postMessage",
-                            {"channel": channel, "text": text},
-                        )
-                        operation_stage = "Slack_message_created"
-                else:
+                except RuntimeError as exc:
+                    if "message_not_found" not in str(exc):
+                        raise
                     response = self.api(
-                        token, "chat.postMessage", {"channel": channel, "text": text}
+                        token,
+                        "chat.postMessage",
+                        {"channel": channel, "text": text},
                     )
                     operation_stage = "Slack_message_created"
-                response_channel = str(response.get("channel") or "")
-                response_ts = str(response.get("ts") or "")
-                if response_channel != channel or not response_ts:
-                    raise RuntimeError("Slack API response omitted expected channel or timestamp")
-                for item in group:
-                    self.advance(item, "Slack_API_accepted")
-                    self.advance(item, operation_stage)
-                    item["channel"] = response_channel
-                    item["ts"] = response_ts
-                    item["recovery_summary"] = recovery
-                if projection:
-                    state["projection_timestamps"][projection[0]][projection[1]] = response_ts
-                    state["projection_fingerprints"][projection[0]][projection[1]] = text_fingerprint
+            else:
+                response = self.api(
+                    token, "chat.postMessage", {"channel": channel, "text": text}
+                )
+                operation_stage = "Slack_message_created"
+            response_channel = str(response.get("channel") or "")
+            response_ts = str(response.get("ts") or "")
+            if response_channel != channel or not response_ts:
+                raise RuntimeError("Slack API response omitted expected channel or timestamp")
+            for item in group:
+                self.outbox.advance(item, "Slack_API_accepted")
+                self.outbox.advance(
+                    item,
+                    operation_stage,
+                    channel=response_channel,
+                    ts=response_ts,
+                    recovery_summary=recovery,
+                )
+            if projection:
+                with self._write_lock:
+                    state["projection_timestamps"][projection[0]][
+                        projection[1]
+                    ] = response_ts
+                    state["projection_fingerprints"][projection[0]][
+                        projection[1]
+                    ] = text_fingerprint
                     self.write_state(state)
-                self.write_outbox(outbox)
-                if existing_fingerprint != text_fingerprint:
-                    self.verify_message(token, channel, response_ts, text)
-                for item in group:
-                    self.advance(item, "Slack_message_verified")
-                    item["last_error"] = None
-                    item["next_attempt_epoch"] = 0
-                self.write_outbox(outbox)
-            except Exception as exc:
-                for item in group:
-                    self.advance(item, "delivery_failed")
-                    item["last_error"] = f"{type(exc).__name__}: {exc}"
-                    item["next_attempt_epoch"] = now + min(300, 10 * (2 ** min(item["attempts"], 5)))
-                self.write_outbox(outbox)
-                raise
-        return outbox
+            self.write_outbox()
+            if existing_fingerprint != text_fingerprint:
+                self.verify_message(token, channel, response_ts, text)
+            for item in group:
+                self.outbox.advance(
+                    item,
+                    "Slack_message_verified",
+                    last_error=None,
+                    next_attempt_epoch=0,
+                )
+            self.write_outbox()
+        except Exception as exc:
+            for item in group:
+                self.outbox.advance(
+                    item,
+                    "delivery_failed",
+                    last_error=f"{type(exc).__name__}: {exc}",
+                    next_attempt_epoch=now
+                    + min(300, 10 * (2 ** min(item["attempts"], 5))),
+                )
+            self.write_outbox()
+            raise
 
     @staticmethod
     def backfill_projection_buckets(state: dict) -> None:
@@ -590,9 +635,42 @@ class SlackProjection:
             inventory, graph, control, self.deployed_revision()
         )
         events = OperationalEventLog(self.root, "reporter").events(limit=50)
-        return render_executive_dashboard(
-            self.root, inventory, graph, semantics, events
+        cache = self._load_render_cache()
+        previous = {title: value.get("digest") for title, value in cache.items()}
+        rendered = render_executive_dashboard(
+            self.root, inventory, graph, semantics, events, cache
         )
+        if previous != {title: value["digest"] for title, value in cache.items()}:
+            self._write_render_cache(cache)
+        return rendered
+
+    def _load_render_cache(self) -> dict:
+        """Section texts from the last render, keyed by title with input digests.
+
+        Entries from a different dashboard renderer are discarded, so a deploy
+        never reuses text formatted by older code.
+        """
+        try:
+            value = json.loads(self.render_cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(value, dict) or value.get("renderer") != RENDERER_DIGEST:
+            return {}
+        return value.get("sections") or {}
+
+    def _write_render_cache(self, sections: dict) -> None:
+        value = {"renderer": RENDERER_DIGEST, "sections": sections}
+        write_cache_atomic(
+            self.render_cache_path, json.dumps(value, sort_keys=True) + "\n"
+        )
+
+    @staticmethod
+    def verified_recently(state: dict, now: float) -> bool:
+        last_verified = state.get("last_verified_at")
+        if not last_verified:
+            return False
+        verified_at = datetime.fromisoformat(str(last_verified)).timestamp()
+        return now - verified_at < DASHBOARD_REVERIFY_SECONDS
 
     def _render_internal_dashboard(
         self,
@@ -645,8 +723,13 @@ class SlackProjection:
             if capability_path.exists()
             else {}
         )
-        assignments = self.live_assignments() or inventory.get("supervisor_assignments") or []
-        active = [item for item in assignments if not is_terminal(item)]
+        active = self.live_assignments()
+        if active is None:
+            active = [
+                item
+                for item in inventory.get("supervisor_assignments") or []
+                if not is_terminal(item)
+            ]
         analysis_workers = [
             item
             for item in active
@@ -1248,16 +1331,22 @@ class SlackProjection:
             ts = state.get("ts")
             if state.get("fingerprint") == fingerprint and ts:
                 self.project_decisions(token, channel, graph, state)
-                self.verify_message(token, channel, ts, fallback)
+                # Every section matches the verified message; only read it back
+                # once the last verification is older than the re-verify window.
+                if not (
+                    state.get("delivery_stage") == "Slack_message_verified"
+                    and self.verified_recently(state, time.time())
+                ):
+                    self.verify_message(token, channel, ts, fallback)
+                    state["last_verified_at"] = utc_now()
                 state_stage("Slack_message_verified")
                 state["message_operation"] = "verified"
-                state["last_verified_at"] = utc_now()
                 state["last_delivery_error"] = None
                 state["semantic_revision"] = semantics["semantic_revision"]
                 state["source_revision"] = (semantics.get("source") or {}).get(
                     "deployed_revision"
                 ) or {}
-                state["last_successful_update_at"] = state["last_verified_at"]
+                state["last_successful_update_at"] = utc_now()
                 state["last_successful_update_epoch"] = int(time.time())
                 state["updated_at_epoch"] = int(time.time())
                 self.write_state(state)
@@ -1401,13 +1490,14 @@ class SlackProjection:
         )
 
     def write_state(self, value: dict) -> None:
-        decision = self.gate.decide(OperationClass.RECONCILIATION)
-        self.gate.require(decision, OperationClass.RECONCILIATION)
-        write_record(
-            self.state_path,
-            value,
-            "axis.external-development-supervisor.slack-state",
-        )
+        with self._write_lock:
+            decision = self.gate.decide(OperationClass.RECONCILIATION)
+            self.gate.require(decision, OperationClass.RECONCILIATION)
+            write_record(
+                self.state_path,
+                value,
+                "axis.external-development-supervisor.slack-state",
+            )
 
     def deployed_revision(self) -> dict:
         try:
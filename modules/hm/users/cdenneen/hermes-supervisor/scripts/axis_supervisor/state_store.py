@@ -0,0 +1,400 @@
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, ContextManager, Iterator
+
+if __package__ in {None, ""}:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+ROOT = Path(
+    os.environ.get(
+        "AXIS_SUPERVISOR_ROOT",
+        Path.home() / ".hermes" / "supervisor" / "axis-development-supervisor",
+    )
+)
+STATE_BACKEND = os.environ.get("AXIS_SUPERVISOR_STATE_BACKEND", "json")
+DATABASE_NAME = "state.sqlite3"
+STATE_FIELDS = ("lifecycle_state", "status", "state")
+# Checkouts and schema copies live under the root but hold no supervisor records.
+UNMANAGED_DIRECTORIES = frozenset({"deployment-source", "schemas", "worktrees"})
+
+_stores: dict[str, "SqliteStateStore"] = {}
+_stores_lock = threading.Lock()
+
+
+def write_text_atomic(path: Path, text: str) -> None:
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    tmp.chmod(0o600)
+    tmp.replace(path)
+
+
+def write_cache_atomic(path: Path, text: str) -> bool:
+    """Replace a derived cache file, returning False if it could not be written.
+
+    The temporary name is unique per process and thread so concurrent cycles
+    never share one, and a failure only costs the next reader a recomputation.
+    """
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_text(text, encoding="utf-8")
+        tmp.chmod(0o600)
+        tmp.replace(path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        return False
+    return True
+
+
+def file_signature(path: Path) -> str | None:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return f"{stat.st_mtime_ns}:{stat.st_size}:{stat.st_ino}"
+
+
+def _record_state(value: dict[str, Any]) -> str | None:
+    for field in STATE_FIELDS:
+        if isinstance(value.get(field), str):
+            return value[field]
+    return None
+
+
+def open_store(root: Path) -> "SqliteStateStore":
+    key = str(root)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = SqliteStateStore(root)
+        return store
+
+
+def store_for(path: Path) -> "SqliteStateStore | None":
+    """Return the SQLite store owning ``path`` when that backend is enabled."""
+    if STATE_BACKEND != "sqlite":
+        return None
+    root = str(ROOT)
+    if not str(path).startswith(root + os.sep):
+        return None
+    return open_store(ROOT)
+
+
+def record_transaction(root: Path = ROOT) -> ContextManager[None]:
+    """Group record writes under ``root`` into one transaction when supported."""
+    if STATE_BACKEND != "sqlite" or Path(root) != ROOT:
+        return nullcontext()
+    return open_store(ROOT).transaction()
+
+
+class SqliteStateStore:
+    """WAL-mode SQLite backend for schema-validated supervisor records.
+
+    Rows are keyed by the record path relative to the runtime root and carry
+    the schema, an indexed lifecycle state, the record text and the signature
+    of the JSON file last exported for it.  Writes commit to SQLite first and
+    then replace the JSON file, so tools and readers that still open the JSON
+    layout keep working; a row whose export was interrupted keeps a NULL
+    signature and is exported again when the store next opens.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.path = root / DATABASE_NAME
+        self._local = threading.local()
+        root.mkdir(mode=0o700, parents=True, exist_ok=True)
+        connection = self._connection()
+        connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS records (
+                path TEXT PRIMARY KEY,
+                schema TEXT NOT NULL,
+                lifecycle_state TEXT,
+                body TEXT NOT NULL,
+                signature TEXT,
+                updated_at_epoch INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS records_by_state
+                ON records (schema, lifecycle_state);
+            """
+        )
+        self.path.chmod(0o600)
+        self.export_pending()
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def _key(self, path: Path) -> str:
+        return str(Path(path).relative_to(self.root))
+
+    def _pending(self) -> dict[str, tuple[str, str | None, str]] | None:
+        return getattr(self._local, "pending", None)
+
+    def has_pending(self, path: Path) -> bool:
+        pending = self._pending()
+        return pending is not None and self._key(path) in pending
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Commit every record written inside the block together, or none."""
+        if self._pending() is not None:
+            yield
+            return
+        self._local.pending = {}
+        try:
+            yield
+            pending = self._local.pending
+        finally:
+            self._local.pending = None
+        self._commit(pending)
+
+    def _commit(self, pending: dict[str, tuple[str, str | None, str]]) -> None:
+        if not pending:
+            return
+        connection = self._connection()
+        now = int(time.time())
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.executemany(
+                """
+                INSERT INTO records
+                    (path, schema, lifecycle_state, body, signature, updated_at_epoch)
+                VALUES (?, ?, ?, ?, NULL, ?)
+                ON CONFLICT (path) DO UPDATE SET
+                    schema = excluded.schema,
+                    lifecycle_state = excluded.lifecycle_state,
+                    body = excluded.body,
+                    signature = NULL,
+                    updated_at_epoch = excluded.updated_at_epoch
+                """,
+                [
+                    (key, schema, state, text, now)
+                    for key, (schema, state, text) in pending.items()
+                ],
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        for key, (_schema, _state, text) in pending.items():
+            self._export(key, text)
+
+    def _export(self, key: str, text: str, directory: Path | None = None) -> None:
+        path = (directory or self.root) / key
+        write_text_atomic(path, text)
+        if directory is None:
+            # Only stamp the row if no later commit replaced its body meanwhile.
+            self._connection().execute(
+                "UPDATE records SET signature = ? WHERE path = ? AND body = ?",
+                (file_signature(path), key, text),
+            )
+
+    def export_pending(self) -> int:
+        rows = self._connection().execute(
+            "SELECT path, body FROM records WHERE signature IS NULL"
+        ).fetchall()
+        for key, text in rows:
+            self._export(key, text)
+        return len(rows)
+
+    def read(self, path: Path, schema: str) -> str | None:
+        """Return stored record text if it still matches the JSON file."""
+        key = self._key(path)
+        pending = self._pending()
+        if pending is not None and key in pending:
+            return pending[key][2] if pending[key][0] == schema else None
+        row = self._connection().execute(
+            "SELECT schema, body, signature FROM records WHERE path = ?", (key,)
+        ).fetchone()
+        if row is None or row[0] != schema:
+            return None
+        if row[2] is None:
+            # The committed row is newer than the interrupted file export.
+            self._export(key, row[1])
+            return row[1]
+        return row[1] if row[2] == file_signature(path) else None
+
+    def write(self, path: Path, schema: str, value: dict[str, Any], text: str) -> None:
+        entry = (schema, _record_state(value), text)
+        pending = self._pending()
+        if pending is not None:
+            pending[self._key(path)] = entry
+            return
+        self._commit({self._key(path): entry})
+
+    def remember(
+        self, path: Path, schema: str, value: dict[str, Any], text: str, signature: str
+    ) -> None:
+        """Adopt a validated JSON file read from disk, unless an export is pending."""
+        self._connection().execute(
+            """
+            INSERT INTO records
+                (path, schema, lifecycle_state, body, signature, updated_at_epoch)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (path) DO UPDATE SET
+                schema = excluded.schema,
+                lifecycle_state = excluded.lifecycle_state,
+                body = excluded.body,
+                signature = excluded.signature,
+                updated_at_epoch = excluded.updated_at_epoch
+            WHERE records.signature IS NOT NULL
+            """,
+            (
+                self._key(path),
+                schema,
+                _record_state(value),
+                text,
+                signature,
+                int(time.time()),
+            ),
+        )
+
+    def _resync(self, schema: str) -> None:
+        """Re-adopt every JSON file of ``schema`` changed outside the store."""
+        from axis_supervisor.schema_registry import CorruptRecordError, validate_record
+
+        rows = self._connection().execute(
+            "SELECT path, signature FROM records "
+            "WHERE schema = ? AND signature IS NOT NULL",
+            (schema,),
+        ).fetchall()
+        for key, signature in rows:
+            path = self.root / key
+            # Stat before reading: a concurrent replace only makes the adopted
+            # signature stale, never the adopted text.
+            current = file_signature(path)
+            if current is None or current == signature:
+                continue
+            try:
+                text = path.read_text(encoding="utf-8")
+                value = json.loads(text)
+            except (OSError, json.JSONDecodeError) as exc:
+                raise CorruptRecordError(f"cannot read record {path}: {exc}") from exc
+            validate_record(value, schema, record_path=path)
+            self.remember(path, schema, value, text, current)
+
+    def query(self, schema: str, lifecycle_state: str | None = None) -> list[dict]:
+        """Records of ``schema`` (optionally in one state) via the state index.
+
+        JSON files changed outside the store are validated and adopted before
+        the index is consulted, so their rows carry the edited state and the
+        result never trails the exported layout.  That costs one ``stat`` per
+        stored record of the schema; ``read_record`` itself never adopts.
+        """
+        from axis_supervisor.schema_registry import read_record
+
+        self._resync(schema)
+        if lifecycle_state is None:
+            rows = self._connection().execute(
+                "SELECT path FROM records WHERE schema = ? ORDER BY path", (schema,)
+            ).fetchall()
+        else:
+            rows = self._connection().execute(
+                "SELECT path FROM records WHERE schema = ? AND lifecycle_state = ? "
+                "ORDER BY path",
+                (schema, lifecycle_state),
+            ).fetchall()
+        values = []
+        for (key,) in rows:
+            path = self.root / key
+            if not path.exists():
+                continue
+            value = read_record(path, schema)
+            if lifecycle_state is None or _record_state(value) == lifecycle_state:
+                values.append(value)
+        return values
+
+    def export(self, directory: Path) -> int:
+        rows = self._connection().execute(
+            "SELECT path, body FROM records ORDER BY path"
+        ).fetchall()
+        for key, text in rows:
+            self._export(key, text, directory)
+        return len(rows)
+
+    def import_tree(self) -> dict[str, Any]:
+        """Load every registered JSON record under the root into the store."""
+        from axis_supervisor.schema_registry import (
+            SCHEMA_FILES,
+            RecordError,
+            validate_record,
+        )
+
+        imported = 0
+        skipped = []
+        for directory, names, files in os.walk(self.root):
+            names[:] = sorted(
+                name
+                for name in names
+                if not name.startswith(".") and name not in UNMANAGED_DIRECTORIES
+            )
+            for name in sorted(files):
+                if not name.endswith(".json"):
+                    continue
+                path = Path(directory) / name
+                signature = file_signature(path)
+                try:
+                    text = path.read_text(encoding="utf-8")
+                    value = json.loads(text)
+                    schema = value.get("schema")
+                except (OSError, json.JSONDecodeError, AttributeError):
+                    skipped.append(self._key(path))
+                    continue
+                if schema not in SCHEMA_FILES or signature is None:
+                    continue
+                try:
+                    validate_record(value, schema, record_path=path)
+                except RecordError:
+                    skipped.append(self._key(path))
+                    continue
+                self.remember(path, schema, value, text, signature)
+                imported += 1
+        return {"imported": imported, "skipped": skipped}
+
+
+def main() -> int:
+    from axis_supervisor.mutation import MutationGate, OperationClass
+
+    parser = argparse.ArgumentParser()
+    subcommands = parser.add_subparsers(dest="action", required=True)
+    export = subcommands.add_parser("export")
+    export.add_argument("--directory")
+    subcommands.add_parser("import")
+    query = subcommands.add_parser("query")
+    query.add_argument("--schema", required=True)
+    query.add_argument("--state")
+    args = parser.parse_args()
+    store = open_store(ROOT)
+    if args.action == "query":
+        result: Any = store.query(args.schema, args.state)
+    else:
+        directory = Path(getattr(args, "directory", None) or ROOT)
+        if directory == ROOT:
+            gate = MutationGate(ROOT, source="state-store")
+            gate.require(
+                gate.decide(OperationClass.RECONCILIATION),
+                OperationClass.RECONCILIATION,
+            )
+        if args.action == "export":
+            result = {"exported": store.export(directory)}
+        else:
+            result = store.import_tree()
+    print(json.dumps(result, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -14,6 +14,7 @@ from .accounting import AccountingLedger
 from .canonical_work_item import projection_for
 from .assignment_grants import load_grant as load_assignment_grant
 from .decomposition import SemanticDecompositionEngine
+from .leases import LeaseController
 from .models import (
     declared_test_commands,
     test_command_argv,
@@ -23,7 +24,7 @@ from .models import (
 from .mutation import GateDecision, MutationGate, OperationClass, load_canonical_lease
 from .observability import record_event
 from .prompt_factory import PromptFactory
-from .schema_registry import read_record
+from .schema_registry import read_snapshot
 
 
 def resolve_allowed_source(worktree: Path, relative: str) -> Path:
@@ -193,7 +194,7 @@ class HermesWorkerManager:
             assignment=assignment,
             repository=repository,
         )
-        control = read_record(
+        control = read_snapshot(
             self.root / "control.json",
             "axis.external-development-supervisor.control",
         )
@@ -239,20 +240,14 @@ class HermesWorkerManager:
         stop_heartbeat = threading.Event()
 
         def heartbeat() -> None:
+            leases = LeaseController(self.root)
             while not stop_heartbeat.wait(300):
-                subprocess.run(
-                    [
-                        sys.executable,
-                        self.supervisorctl,
-                        "heartbeat",
-                        assignment["assignment_id"],
-                        "--token",
-                        lease["fencing_token"],
-                    ],
-                    check=False,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                )
+                try:
+                    leases.heartbeat(
+                        assignment["assignment_id"], lease["fencing_token"]
+                    )
+                except Exception:  # noqa: BLE001 - an expired lease is recovered later
+                    pass
 
         heartbeat_thread = threading.Thread(target=heartbeat, daemon=True)
         process = None
@@ -6,6 +6,7 @@ from collections.abc import Callable
 from datetime import datetime, timezone
 from pathlib import Path, PurePosixPath
 
+from .assignment_index import AssignmentIndex
 from .lifecycle import is_integrable
 from .models import validate_allowed_path, validate_assignment
 from .mutation import MutationGate, OperationClass, load_canonical_lease
@@ -593,6 +594,10 @@ class WorkflowState:
                 proposed = self._adopted_assignment(facts)
                 assignment = proposed
                 stage = "validate-existing-assignment"
+                if (assignments / "archive" / path.name).exists():
+                    # Archived custody is restored, never re-created.
+                    self._authorize()
+                    AssignmentIndex(self.root).restore(assignment_id)
                 if path.exists():
                     assignment = validate_assignment(
                         json.loads(path.read_text(encoding="utf-8")), self.root
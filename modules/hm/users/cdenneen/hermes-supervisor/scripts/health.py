@@ -5,7 +5,7 @@ import time
 from datetime import datetime, timezone
 from pathlib import Path
 
-from axis_supervisor.models import validate_assignment
+from axis_supervisor.assignment_index import AssignmentIndex
 from axis_supervisor.observability import OperationalEventLog
 from axis_supervisor.schema_registry import read_record
 
@@ -98,14 +98,7 @@ def main() -> int:
         if capability_convergence_path.exists()
         else {}
     )
-    assignments = []
-    for path in (ROOT / "assignments").glob("*.json"):
-        try:
-            assignments.append(
-                validate_assignment(json.loads(path.read_text(encoding="utf-8")), ROOT)
-            )
-        except Exception as exc:  # noqa: BLE001 - health aggregates corrupt records
-            errors.append(f"invalid assignment record {path.name}: {exc}")
+    assignments = AssignmentIndex(ROOT).active(errors)
     active_assignments = [
         item
         for item in assignments
@@ -6,12 +6,15 @@ import socket
 import subprocess
 import sys
 import time
+import traceback
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 
 from axis_supervisor import progress_coherence
 from axis_supervisor.accounting import AccountingLedger
+from axis_supervisor.daemon import DaemonBusy, DaemonUnavailable, trigger
+from axis_supervisor.leases import LeaseController
 from axis_supervisor.lifecycle import is_terminal
 from axis_supervisor.mutation import MutationGate, OperationClass
 from axis_supervisor.missions import (
@@ -46,6 +49,10 @@ CYCLE = Path(
 )
 INVENTORY_LOCK = ROOT / "inventory.lock"
 INVENTORY_LOCK_OWNER = INVENTORY_LOCK / "owner.json"
+DAEMON_REBUILD_TIMEOUT = int(
+    os.environ.get("AXIS_SUPERVISOR_DAEMON_REBUILD_TIMEOUT", "240")
+)
+DAEMON_BUSY_POLL_SECONDS = 1.0
 
 
 def load_control() -> dict:
@@ -73,6 +80,33 @@ def process_alive(pid: int, expected_start_time: str | None = None) -> bool:
         return False
 
 
+def rebuild_through_daemon(staged_inventory: Path) -> bool:
+    """Rebuild from ``staged_inventory`` in the warm daemon.
+
+    Returns False only when no daemon accepted the connection, so the trigger
+    was never sent and a cold rebuild is safe.  A busy daemon did not start
+    the trigger and is polled until it accepts it; once sent, the trigger is
+    waited on, so the staged inventory outlives any rebuild reading it.  Past
+    ``DAEMON_REBUILD_TIMEOUT`` the last error is raised and preflight fails
+    closed instead of racing the daemon with a cold rebuild.
+    """
+    deadline = time.monotonic() + DAEMON_REBUILD_TIMEOUT
+    while True:
+        try:
+            trigger(
+                "rebuild",
+                inventory_path=str(staged_inventory),
+                timeout=max(1.0, deadline - time.monotonic()),
+            )
+            return True
+        except DaemonUnavailable:
+            return False
+        except DaemonBusy:
+            if time.monotonic() + DAEMON_BUSY_POLL_SECONDS >= deadline:
+                raise
+            time.sleep(DAEMON_BUSY_POLL_SECONDS)
+
+
 def child_diagnostic(exc: BaseException) -> str:
     output = []
     for name in ("stdout", "stderr", "output"):
@@ -137,7 +171,10 @@ def isolated_dependency_link_timeouts(
             )
 
     try:
-        dependency_queries = int(collection.get("dependency_queries", 0))
+        # Reused link facts come from successful queries of earlier runs.
+        dependency_queries = int(collection.get("dependency_queries", 0)) + int(
+            collection.get("dependency_queries_reused", 0)
+        )
         dependency_failures = int(collection.get("dependency_query_failures", 1))
         reported_errors = int(collection.get("retrieval_error_count", 1))
     except (TypeError, ValueError):
@@ -325,15 +362,9 @@ def main() -> int:
 
     reconcile_prior_runs(control, now, gate)
     try:
-        subprocess.run(
-            [sys.executable, str(SUPERVISORCTL), "recover"],
-            check=True,
-            text=True,
-            capture_output=True,
-            timeout=30,
-        )
+        LeaseController(ROOT).recover(now)
     except Exception as exc:
-        diagnostic = child_diagnostic(exc)
+        diagnostic = traceback.format_exc()[-1200:]
         return skip(
             run_id,
             control.get("mode"),
@@ -357,7 +388,6 @@ def main() -> int:
         INVENTORY_LOCK.rename(stale_lock)
     try:
         staged_inventory = ROOT / "inventory.pending.json"
-        staged_inventory.unlink(missing_ok=True)
         gate.require(
             gate.decide(OperationClass.RECONCILIATION),
             OperationClass.RECONCILIATION,
@@ -375,6 +405,9 @@ def main() -> int:
             encoding="utf-8",
         )
         INVENTORY_LOCK_OWNER.chmod(0o600)
+        # Only the lock holder touches the staged inventory, so a concurrent
+        # run never removes one that is still being rebuilt from.
+        staged_inventory.unlink(missing_ok=True)
     except FileExistsError:
         return skip(run_id, control.get("mode"), "inventory generation already in progress")
     try:
@@ -386,19 +419,20 @@ def main() -> int:
             timeout=240,
             env=os.environ | {"AXIS_SUPERVISOR_INVENTORY_PATH": str(staged_inventory)},
         )
-        subprocess.run(
-            [
-                sys.executable,
-                str(CYCLE),
-                "rebuild",
-                "--inventory-path",
-                str(staged_inventory),
-            ],
-            check=True,
-            text=True,
-            capture_output=True,
-            timeout=60,
-        )
+        if not rebuild_through_daemon(staged_inventory):
+            subprocess.run(
+                [
+                    sys.executable,
+                    str(CYCLE),
+                    "rebuild",
+                    "--inventory-path",
+                    str(staged_inventory),
+                ],
+                check=True,
+                text=True,
+                capture_output=True,
+                timeout=60,
+            )
         staged_inventory.unlink(missing_ok=True)
     except Exception as exc:
         diagnostic = child_diagnostic(exc)
@@ -475,6 +509,9 @@ def main() -> int:
                 "mode": mode,
                 "inventory_generation_id": inventory.get("generation_id"),
                 "dependency_queries": collection.get("dependency_queries"),
+                "dependency_queries_reused": collection.get(
+                    "dependency_queries_reused"
+                ),
                 "dependency_query_failures": collection.get(
                     "dependency_query_failures"
                 ),
@@ -550,6 +587,9 @@ def main() -> int:
         gate.decide(OperationClass.RECONCILIATION),
         OperationClass.RECONCILIATION,
     )
+    # Count the cycle before its record exists so a crash between the two
+    # writes can only over-count against the daily budget.
+    accounting.record_worker_cycle(run_id, now)
     write_record(run_path, run_record, "axis.external-development-supervisor.run")
 
     emit({
@@ -0,0 +1,208 @@
+"""Cycle ``rebuild`` latency as a cold process versus a warm supervisor daemon.
+
+Builds a throwaway runtime with a synthetic inventory, then times repeated
+``cycle.py rebuild`` processes against ``rebuild`` triggers sent to one
+``daemon.py serve`` process, both through the in-process client and through the
+``daemon.py trigger`` command a cron launcher would run.  Run with
+``python tests/bench_daemon_cycle.py [rebuilds] [work_items]``.
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS = ROOT / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+
+def work_item(number: int) -> dict:
+    ref = f"ghostspace/axis#{number}"
+    return {
+        "ref": ref,
+        "source_kind": "gitlab-issue",
+        "kind": "issue",
+        "project": "ghostspace/axis",
+        "iid": number,
+        "title": ref,
+        "source_state": "opened",
+        "labels": [],
+        "milestone": None,
+        "priority": None,
+        "authority_facts": {},
+        "blocking_dependency_refs": [],
+        "merge_request_facts": [],
+        "acceptance_criteria_present": False,
+        "acceptance_facts": {"ids": [], "open_ids": []},
+        "updated_at": "2026-08-04T00:00:00Z",
+        "web_url": f"https://example.test/{ref}",
+        "source_evidence": {
+            "description": "",
+            "notes": [],
+            "parent_refs": [],
+            "related_mr_urls": [],
+        },
+        "repository_head": "head",
+        "retrieval_errors": [],
+        "mutation_allowed": True,
+    }
+
+
+def prepare(runtime: Path, work_items: int) -> None:
+    runtime.mkdir()
+    (runtime / "assignments").mkdir()
+    control = json.loads((ROOT / "control.defaults.json").read_text(encoding="utf-8"))
+    control.update(
+        {
+            "mode": "enabled",
+            "allow_repository_mutation": True,
+            "semantic_priority_refs": [],
+        }
+    )
+    (runtime / "control.json").write_text(json.dumps(control), encoding="utf-8")
+    repository = runtime.parent / "repository"
+    repository.mkdir()
+    for command in (
+        ["init", "-q"],
+        ["-c", "user.email=bench@example.test", "-c", "user.name=bench"]
+        + ["commit", "-q", "--allow-empty", "-m", "bench"],
+        ["update-ref", "refs/remotes/origin/main", "HEAD"],
+    ):
+        subprocess.run(["git", "-C", str(repository), *command], check=True)
+    matrix = json.loads(
+        (ROOT / "capability-runtime-matrix.json").read_text(encoding="utf-8")
+    )
+    matrix["repository_path"] = str(repository)
+    matrix.pop("deployment_lock_path", None)
+    for runtime_definition in matrix["runtimes"].values():
+        # Keep runtime identity probes local; the benchmark must not reach hosts.
+        runtime_definition["host"] = "local"
+        runtime_definition.pop("required_command", None)
+        runtime_definition.pop("required_path", None)
+    (runtime / "capability-runtime-matrix.json").write_text(
+        json.dumps(matrix), encoding="utf-8"
+    )
+    items = [work_item(number) for number in range(1, work_items + 1)]
+    inventory = {
+        "schema": "axis.external-development-supervisor.inventory",
+        "schema_version": "1.0.0",
+        "generation_id": "inventory-bench",
+        "generated_at": "2026-08-04T00:00:00Z",
+        "duration_seconds": 1.0,
+        "mode": "enabled",
+        "allow_repository_mutation": True,
+        "repositories": {},
+        "repository_allowlist": ["ghostspace/axis"],
+        "repositories_inspected": 1,
+        "work_items_discovered": len(items),
+        "work_items": items,
+        "dependency_edges": [],
+        "milestones": [],
+        "open_merge_requests": [],
+        "supervisor_assignments": [],
+        "active_leases": [],
+        "collection_status": {
+            "configured_repository_count": 1,
+            "all_configured_repositories_inspected": True,
+            "dependency_queries": 0,
+            "dependency_query_failures": 0,
+            "retrieval_error_count": 0,
+            "stale_repository_count": 0,
+            "state_record_errors": [],
+            "active_assignment_count": 0,
+            "active_lease_count": 0,
+        },
+    }
+    (runtime / "inventory.json").write_text(json.dumps(inventory), encoding="utf-8")
+
+
+def timed(rebuilds: int, run) -> list[float]:
+    samples = []
+    for _ in range(rebuilds):
+        started = time.perf_counter()
+        run()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def summary(samples: list[float]) -> dict:
+    return {
+        "median_ms": round(statistics.median(samples) * 1000, 1),
+        "max_ms": round(max(samples) * 1000, 1),
+    }
+
+
+def main() -> None:
+    rebuilds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    work_items = int(sys.argv[2]) if len(sys.argv) > 2 else 60
+    with tempfile.TemporaryDirectory(prefix="axis-daemon-bench-") as directory:
+        runtime = Path(directory) / "runtime"
+        prepare(runtime, work_items)
+        socket_path = runtime / "supervisor.sock"
+        env = os.environ | {
+            "AXIS_SUPERVISOR_ROOT": str(runtime),
+            "AXIS_SUPERVISOR_DAEMON_SOCKET": str(socket_path),
+            "PYTHONPATH": str(SCRIPTS),
+        }
+        cycle = [sys.executable, str(SCRIPTS / "axis_supervisor" / "cycle.py")]
+        daemon_script = [sys.executable, str(SCRIPTS / "axis_supervisor" / "daemon.py")]
+
+        def cold() -> None:
+            subprocess.run(
+                [*cycle, "rebuild"], env=env, check=True, stdout=subprocess.DEVNULL
+            )
+
+        cold()
+        cold_samples = timed(rebuilds, cold)
+
+        started = time.perf_counter()
+        server = subprocess.Popen([*daemon_script, "serve"], env=env)
+        try:
+            while not socket_path.exists():
+                if server.poll() is not None:
+                    raise RuntimeError("supervisor daemon exited during startup")
+                time.sleep(0.01)
+            startup = time.perf_counter() - started
+            from axis_supervisor.daemon import trigger
+
+            trigger("rebuild", socket_path=socket_path)
+            warm_samples = timed(
+                rebuilds, lambda: trigger("rebuild", socket_path=socket_path)
+            )
+            cli_samples = timed(
+                rebuilds,
+                lambda: subprocess.run(
+                    [*daemon_script, "trigger", "rebuild"],
+                    env=env,
+                    check=True,
+                    stdout=subprocess.DEVNULL,
+                ),
+            )
+        finally:
+            server.terminate()
+            server.wait()
+    cold_median = statistics.median(cold_samples)
+    print(
+        json.dumps(
+            {
+                "rebuilds": rebuilds,
+                "work_items": work_items,
+                "cold_process": summary(cold_samples),
+                "daemon_startup_ms": round(startup * 1000, 1),
+                "warm_trigger": summary(warm_samples),
+                "warm_trigger_cli": summary(cli_samples),
+                "speedup": round(cold_median / statistics.median(warm_samples), 2),
+                "speedup_cli": round(cold_median / statistics.median(cli_samples), 2),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
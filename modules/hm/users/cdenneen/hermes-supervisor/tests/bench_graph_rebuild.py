@@ -0,0 +1,75 @@
+"""Execution graph build time with a cold versus a warm node cache.
+
+Builds the synthetic runtime from ``bench_daemon_cycle``, then times
+``ExecutionGraphBuilder.build`` with ``execution-graph-node-cache.json``
+removed before every build, with the cache warm, and with the cache warm but
+one item in a hundred changed.  Run with
+``python tests/bench_graph_rebuild.py [builds] [work_items]``.
+"""
+
+import json
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+sys.path.insert(0, str(ROOT / "tests"))
+
+from bench_daemon_cycle import prepare, summary, timed  # noqa: E402
+
+
+def main() -> None:
+    from axis_supervisor.graph import ExecutionGraphBuilder
+
+    builds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    work_items = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    with tempfile.TemporaryDirectory(prefix="axis-graph-bench-") as directory:
+        runtime = Path(directory) / "runtime"
+        prepare(runtime, work_items)
+        inventory = json.loads((runtime / "inventory.json").read_text(encoding="utf-8"))
+        builder = ExecutionGraphBuilder(runtime)
+
+        def build() -> dict:
+            # The cycle writes the node cache once the generation is published.
+            graph = builder.build(inventory, persist=False)
+            builder.write_node_cache()
+            return graph
+
+        def cold() -> dict:
+            builder.node_cache_path.unlink(missing_ok=True)
+            return build()
+
+        def dirty() -> None:
+            for item in inventory["work_items"][::100]:
+                item["updated_at"] = f"{item['updated_at']}."
+            build()
+
+        expected = cold()
+        cold_samples = timed(builds, cold)
+        warm_samples = timed(builds, build)
+        warm = build()
+        assert warm["nodes"] == expected["nodes"]
+        assert warm["executable_queue"] == expected["executable_queue"]
+        dirty_samples = timed(builds, dirty)
+    print(
+        json.dumps(
+            {
+                "builds": builds,
+                "work_items": work_items,
+                "cold_cache": summary(cold_samples),
+                "warm_cache": summary(warm_samples),
+                "warm_cache_one_percent_changed": summary(dirty_samples),
+                "speedup": round(
+                    statistics.median(cold_samples) / statistics.median(warm_samples),
+                    2,
+                ),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Projection time for the rebuilds of one trigger, with and without a cycle scope.
+
+Builds the synthetic runtime from ``bench_daemon_cycle``, then times the two
+``cycle.rebuild`` calls a ``run-next`` trigger makes around an assignment,
+as independent rebuilds and inside ``projection_pipeline.cycle_scope`` so
+stages whose inputs did not change are reused.  The two variants alternate
+because the event log each rebuild appends to slows later rebuilds.  Run with
+``python tests/bench_projection_pipeline.py [triggers] [work_items]``.
+"""
+
+import json
+import os
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+sys.path.insert(0, str(ROOT / "tests"))
+
+from bench_daemon_cycle import prepare, summary, timed  # noqa: E402
+
+
+def main() -> None:
+    triggers = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    work_items = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    with tempfile.TemporaryDirectory(prefix="axis-pipeline-bench-") as directory:
+        runtime = Path(directory) / "runtime"
+        prepare(runtime, work_items)
+        os.environ["AXIS_SUPERVISOR_ROOT"] = str(runtime)
+        from axis_supervisor import cycle, projection_pipeline
+
+        def unscoped() -> None:
+            cycle.rebuild()
+            cycle.rebuild()
+
+        stages = {}
+
+        def scoped() -> None:
+            with projection_pipeline.cycle_scope() as pipeline:
+                cycle.rebuild()
+                cycle.rebuild()
+            stages.update(pipeline.report())
+
+        cycle.rebuild()
+        unscoped_samples = []
+        scoped_samples = []
+        for _ in range(triggers):
+            unscoped_samples += timed(1, unscoped)
+            scoped_samples += timed(1, scoped)
+    print(
+        json.dumps(
+            {
+                "triggers": triggers,
+                "work_items": work_items,
+                "independent_rebuilds": summary(unscoped_samples),
+                "cycle_scoped_rebuilds": summary(scoped_samples),
+                "last_trigger_stages": stages,
+                "speedup": round(
+                    statistics.median(unscoped_samples)
+                    / statistics.median(scoped_samples),
+                    2,
+                ),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Records validated per second with a fresh validator versus the cached one.
+
+Run with ``python tests/bench_schema_validation.py [seconds]``.
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from jsonschema import Draft202012Validator, FormatChecker  # noqa: E402
+
+from axis_supervisor import schema_registry  # noqa: E402
+
+RECORDS = [
+    (
+        json.loads((ROOT / "control.defaults.json").read_text(encoding="utf-8")),
+        "axis.external-development-supervisor.control",
+    ),
+    (
+        {
+            "schema": "axis.external-development-supervisor.run",
+            "schema_version": "1.0.0",
+            "run_id": "run-1",
+            "status": "started",
+            "host": "bench",
+            "started_at_epoch": 1_780_000_000,
+            "mode": "enabled",
+            "allow_repository_mutation": False,
+            "inventory_generation_id": None,
+            "model_calls_remaining": 2,
+        },
+        "axis.external-development-supervisor.run",
+    ),
+]
+
+
+def uncached_validate(value: dict, schema_id: str, record_path: Path) -> None:
+    """The per-call work validate_record did before validators were cached."""
+    for parent in record_path.resolve().parents:
+        if (parent / "schemas").is_dir():
+            directory = str(parent / "schemas")
+            break
+    else:
+        directory = str(schema_registry.SOURCE_SCHEMAS)
+    errors = list(
+        Draft202012Validator(
+            schema_registry._load_schema(schema_id, directory),
+            registry=schema_registry._schema_registry(directory),
+            format_checker=FormatChecker(),
+        ).iter_errors(value)
+    )
+    assert not errors, errors
+
+
+def cached_validate(value: dict, schema_id: str, record_path: Path) -> None:
+    schema_registry.validate_record(value, schema_id, record_path=record_path)
+
+
+def rate(validate, records: list, seconds: float) -> float:
+    count = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        for value, schema_id, record_path in records:
+            validate(value, schema_id, record_path)
+        count += len(records)
+    return count / (time.perf_counter() - started)
+
+
+def main() -> None:
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 2.0
+    record_path = ROOT / "runs" / "bench.json"
+    records = [(value, schema_id, record_path) for value, schema_id in RECORDS]
+    before = rate(uncached_validate, records, seconds)
+    after = rate(cached_validate, records, seconds)
+    print(
+        json.dumps(
+            {
+                "records_per_second_before": round(before),
+                "records_per_second_after": round(after),
+                "speedup": round(after / before, 2),
+            }
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
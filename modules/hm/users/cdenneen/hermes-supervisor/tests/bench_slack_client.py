@@ -0,0 +1,101 @@
+"""Slack messages delivered per second against a local stub Web API.
+
+Compares one ``urlopen`` per call (the previous transport) with the pooled
+keep-alive client fanned out across independent projection keys.  Run with
+``python tests/bench_slack_client.py [messages] [workers] [latency_ms]``.
+"""
+
+import json
+import sys
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from axis_supervisor.fetch_pool import FetchPool  # noqa: E402
+from axis_supervisor.slack_client import SlackClient  # noqa: E402
+
+
+def stub_server(latency: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_POST(self):
+            payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            time.sleep(latency)
+            raw = json.dumps(
+                {"ok": True, "channel": payload.get("channel"), "ts": "1.0"}
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(raw)))
+            self.end_headers()
+            self.wfile.write(raw)
+
+        def log_message(self, *_args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def urlopen_call(url: str, method: str, payload: dict) -> dict:
+    request = urllib.request.Request(
+        f"{url}/{method}",
+        data=json.dumps(payload).encode("utf-8"),
+        headers={
+            "Authorization": "Bearer bench",
+            "Content-Type": "application/json; charset=utf-8",
+        },
+    )
+    with urllib.request.urlopen(request, timeout=30) as response:
+        return json.load(response)
+
+
+def rate(messages: int, send) -> float:
+    started = time.perf_counter()
+    send()
+    return messages / (time.perf_counter() - started)
+
+
+def main() -> None:
+    messages = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    latency = (float(sys.argv[3]) if len(sys.argv) > 3 else 5.0) / 1000
+    server = stub_server(latency)
+    url = f"http://127.0.0.1:{server.server_port}/api"
+    payloads = [
+        {"channel": "D1", "ts": f"{index}.0", "text": f"update {index}"}
+        for index in range(messages)
+    ]
+    try:
+        serial = rate(
+            messages,
+            lambda: [urlopen_call(url, "chat.update", value) for value in payloads],
+        )
+        # Stub deliveries are not throttled; production keeps Slack's tiers.
+        client = SlackClient(url, tiers={"chat.update": 10**9})
+        with FetchPool(workers) as pool:
+            pooled = rate(
+                messages,
+                lambda: pool.map(
+                    lambda value: client.call("bench", "chat.update", value), payloads
+                ),
+            )
+    finally:
+        server.shutdown()
+        server.server_close()
+    print(f"urlopen per call, serial: {serial:,.0f} messages/s")
+    print(
+        f"pooled client, {workers} lanes: {pooled:,.0f} messages/s "
+        f"({client.connections} connections, {pooled / serial:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
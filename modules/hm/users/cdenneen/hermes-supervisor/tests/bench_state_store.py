@@ -0,0 +1,157 @@
+"""Cycle ``rebuild`` time and run-state queries on the JSON and SQLite backends.
+
+Builds the synthetic runtime from ``bench_daemon_cycle`` plus a large history
+of completed assignments and settled runs, imports it into ``state.sqlite3``,
+then times cold ``cycle.py rebuild`` processes under each
+``AXIS_SUPERVISOR_STATE_BACKEND`` and a "started runs" lookup done as a
+directory scan versus an indexed store query.  Run with
+``python tests/bench_state_store.py [rebuilds] [history]``.
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS = ROOT / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+sys.path.insert(0, str(ROOT / "tests"))
+
+from bench_daemon_cycle import prepare, summary, timed  # noqa: E402
+
+RUN_SCHEMA = "axis.external-development-supervisor.run"
+
+
+def write_history(runtime: Path, history: int) -> None:
+    (runtime / "runs").mkdir()
+    for number in range(history):
+        assignment_id = f"assignment-history-{number}"
+        (runtime / "assignments" / f"{assignment_id}.json").write_text(
+            json.dumps(
+                {
+                    "schema": "axis.external-development-supervisor.assignment",
+                    "schema_version": "1.0.0",
+                    "assignment_id": assignment_id,
+                    "lifecycle_state": "completed",
+                    "assignment_type": "read-only-analysis",
+                    "project": "ghostspace/axis",
+                    "work_item": f"ghostspace/axis#{number % 60 + 1}",
+                    "planning_record": None,
+                    "allowed_paths": [],
+                    "required_tests": [],
+                    "created_by_run": f"run-{number}",
+                    "created_at_epoch": 1_780_000_000 + number,
+                }
+            ),
+            encoding="utf-8",
+        )
+        (runtime / "runs" / f"run-{number}.json").write_text(
+            json.dumps(
+                {
+                    "schema": RUN_SCHEMA,
+                    "schema_version": "1.0.0",
+                    "run_id": f"run-{number}",
+                    "status": "started" if number % 500 == 0 else "completed",
+                    "host": "bench",
+                    "started_at_epoch": 1_780_000_000 + number,
+                    "mode": "enabled",
+                    "allow_repository_mutation": True,
+                    "inventory_generation_id": None,
+                    "model_calls_remaining": 1,
+                }
+            ),
+            encoding="utf-8",
+        )
+
+
+def started_run_samples(
+    runtime: Path, rebuilds: int
+) -> tuple[list[float], list[float]]:
+    from axis_supervisor import state_store
+    from axis_supervisor.schema_registry import read_record
+
+    def scan() -> list[dict]:
+        return [
+            value
+            for path in sorted((runtime / "runs").glob("*.json"))
+            if (value := read_record(path, RUN_SCHEMA))["status"] == "started"
+        ]
+
+    store = state_store.SqliteStateStore(runtime)
+    expected = scan()
+    assert [value["run_id"] for value in store.query(RUN_SCHEMA, "started")] == [
+        value["run_id"] for value in expected
+    ]
+    return timed(rebuilds, scan), timed(
+        rebuilds, lambda: store.query(RUN_SCHEMA, "started")
+    )
+
+
+def main() -> None:
+    rebuilds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    history = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    with tempfile.TemporaryDirectory(prefix="axis-state-bench-") as directory:
+        runtime = Path(directory) / "runtime"
+        prepare(runtime, 60)
+        write_history(runtime, history)
+        env = os.environ | {
+            "AXIS_SUPERVISOR_ROOT": str(runtime),
+            "PYTHONPATH": str(SCRIPTS),
+        }
+        cycle = [sys.executable, str(SCRIPTS / "axis_supervisor" / "cycle.py")]
+        store = [sys.executable, str(SCRIPTS / "axis_supervisor" / "state_store.py")]
+        started = time.perf_counter()
+        subprocess.run(
+            [*store, "import"], env=env, check=True, stdout=subprocess.DEVNULL
+        )
+        import_seconds = time.perf_counter() - started
+        samples = {}
+        for backend in ("json", "sqlite"):
+            backend_env = env | {"AXIS_SUPERVISOR_STATE_BACKEND": backend}
+
+            def rebuild() -> None:
+                subprocess.run(
+                    [*cycle, "rebuild"],
+                    env=backend_env,
+                    check=True,
+                    stdout=subprocess.DEVNULL,
+                )
+
+            rebuild()
+            samples[backend] = timed(rebuilds, rebuild)
+        scan_samples, indexed_samples = started_run_samples(runtime, rebuilds)
+        archived = len(list((runtime / "assignments" / "archive").glob("*.json")))
+    print(
+        json.dumps(
+            {
+                "rebuilds": rebuilds,
+                "history": history,
+                "archived_assignments": archived,
+                "import_ms": round(import_seconds * 1000, 1),
+                "rebuild_json": summary(samples["json"]),
+                "rebuild_sqlite": summary(samples["sqlite"]),
+                "started_runs_scan": summary(scan_samples),
+                "started_runs_query": summary(indexed_samples),
+                "rebuild_speedup": round(
+                    statistics.median(samples["json"])
+                    / statistics.median(samples["sqlite"]),
+                    2,
+                ),
+                "query_speedup": round(
+                    statistics.median(scan_samples)
+                    / statistics.median(indexed_samples),
+                    2,
+                ),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
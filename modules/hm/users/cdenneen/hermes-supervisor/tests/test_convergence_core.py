@@ -399,6 +399,23 @@ def test_schema_registry_validates_fixtures_and_fails_closed(tmp_path: Path):
         validate_record(bad_version, "axis.external-development-supervisor.control")
 
 
+def test_schema_registry_reuses_compiled_validators(tmp_path: Path):
+    from axis_supervisor import schema_registry
+    from axis_supervisor.schema_registry import RecordError, validate_record
+
+    schema = "axis.external-development-supervisor.control"
+    record_path = tmp_path / "control.json"
+    validate_record(control(), schema, record_path=record_path)
+    compiled = schema_registry._compiled_validator.cache_info().hits
+    located = schema_registry._record_schema_directory.cache_info().hits
+    for _ in range(3):
+        validate_record(control(), schema, record_path=record_path)
+    assert schema_registry._compiled_validator.cache_info().hits == compiled + 3
+    assert schema_registry._record_schema_directory.cache_info().hits == located + 3
+    with pytest.raises(RecordError):
+        validate_record(control(mode="sideways"), schema, record_path=record_path)
+
+
 def test_accounting_ledger_is_the_canonical_counter(tmp_path: Path):
     from axis_supervisor.accounting import AccountingLedger
 
@@ -413,7 +430,10 @@ def test_accounting_ledger_is_the_canonical_counter(tmp_path: Path):
     )
     ledger.finish(attempt, "succeeded", usage={"input_tokens": 10})
     assert ledger.model_attempts_today() == 1
-    records = [json.loads(line) for line in ledger.path.read_text().splitlines()]
+    records = [
+        json.loads(line)
+        for line in ledger.segment_path(int(time.time())).read_text().splitlines()
+    ]
     assert [record["result"] for record in records] == ["started", "succeeded"]
     assert records[-1]["usage"] == {"input_tokens": 10}
     with pytest.raises(RuntimeError, match="daily model call limit"):
@@ -427,6 +447,109 @@ def test_accounting_ledger_is_the_canonical_counter(tmp_path: Path):
         )
 
 
+def test_accounting_index_is_rebuilt_from_segments_and_legacy_ledger(tmp_path: Path):
+    from axis_supervisor.accounting import AccountingLedger
+
+    ledger = AccountingLedger(tmp_path)
+    yesterday = int(time.time()) - 86400
+    legacy = {
+        "schema": "axis.external-development-supervisor.model-attempt",
+        "schema_version": "1.0.0",
+        "attempt_id": "legacy",
+        "role": "implementation",
+        "model": "gpt-5.3-codex",
+        "provider": "openai-api",
+        "run": "run-0",
+        "assignment": "assignment-1",
+        "attempt": 1,
+        "result": "started",
+        "recorded_at_epoch": yesterday,
+    }
+    ledger.path.parent.mkdir(parents=True)
+    ledger.path.write_text(json.dumps(legacy) + "\n", encoding="utf-8")
+
+    def start(role: str):
+        return ledger.start(
+            role=role,
+            model="gpt-5.3-codex",
+            provider="openai-api",
+            run="run-1",
+            assignment="assignment-1",
+            limit=3,
+        )
+
+    assert start("implementation").attempt == 2
+    assert start("review").attempt == 1
+    assert ledger.model_attempts_today() == 2
+    assert ledger.model_attempts_today(yesterday) == 1
+    assert ledger.model_attempts_for_assignment("assignment-1") == 3
+
+    ledger.index_path.write_text("{", encoding="utf-8")
+    assert ledger.model_attempts_for_assignment("assignment-1") == 3
+    for field in ("started_by_assignment", "tail"):
+        index = json.loads(ledger.index_path.read_text(encoding="utf-8"))
+        index[field] = "bogus" if field == "tail" else None
+        ledger.index_path.write_text(json.dumps(index), encoding="utf-8")
+        assert ledger.model_attempts_for_assignment("assignment-1") == 3
+    # An append the index never saw (a crash before the index write) is
+    # detected from the segment size and recounted.
+    segment = ledger.segment_path(int(time.time()))
+    line = segment.read_text(encoding="utf-8").splitlines()[0]
+    with segment.open("a", encoding="utf-8") as handle:
+        handle.write(line.replace('"run-1"', '"run-2"') + "\n")
+    assert ledger.model_attempts_today() == 3
+    with pytest.raises(RuntimeError, match="daily model call limit"):
+        start("implementation")
+
+    segment.write_text(segment.read_text(encoding="utf-8") + "{\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="corrupt accounting ledger"):
+        ledger.model_attempts_today()
+
+
+def test_worker_cycles_are_counted_from_a_daily_run_manifest(tmp_path: Path):
+    from axis_supervisor.accounting import AccountingLedger
+    from axis_supervisor.schema_registry import write_record
+
+    now = int(time.time())
+
+    def run(run_id: str, started_at: int) -> None:
+        write_record(
+            tmp_path / "runs" / f"{run_id}.json",
+            {
+                "schema": "axis.external-development-supervisor.run",
+                "schema_version": "1.0.0",
+                "run_id": run_id,
+                "status": "completed",
+                "host": "test",
+                "started_at_epoch": started_at,
+                "mode": "enabled",
+                "allow_repository_mutation": False,
+                "inventory_generation_id": None,
+                "model_calls_remaining": 2,
+            },
+            "axis.external-development-supervisor.run",
+        )
+
+    run("run-old", now - 86400)
+    run("run-today", now)
+    ledger = AccountingLedger(tmp_path)
+    assert ledger.worker_cycles_today(now) == 1
+    assert ledger.worker_cycles_today(now - 86400) == 1
+
+    # Once built, the manifest answers without reading run records.
+    run("run-unrecorded", now)
+    assert ledger.worker_cycles_today(now) == 1
+    ledger.record_worker_cycle("run-next", now)
+    ledger.record_worker_cycle("run-next", now)
+    assert ledger.worker_cycles_today(now) == 2
+
+    # A corrupt or malformed manifest is re-derived from the run records.
+    manifest = ledger.worker_cycles / f"{ledger._day(now).isoformat()}.json"
+    for text in ("{", '{"runs": [["run-today"]]}'):
+        manifest.write_text(text, encoding="utf-8")
+        assert ledger.worker_cycles_today(now) == 2
+
+
 def test_mutation_is_default_denied_and_lower_helper_cannot_bypass(tmp_path: Path):
     from axis_supervisor.accounting import AccountingLedger
     from axis_supervisor.mutation import MutationDenied, MutationGate, OperationClass
@@ -681,6 +804,268 @@ def test_large_implementation_context_requires_and_uses_source_ranges():
         )
 
 
+def test_operational_event_log_serves_tail_range_and_latest_reads(tmp_path: Path):
+    from axis_supervisor.observability import EVENT_SCHEMA, OperationalEventLog
+
+    now = int(time.time())
+    lines = [
+        {
+            "schema": EVENT_SCHEMA,
+            "schema_version": "1.0.0",
+            "event_id": f"{index:032x}",
+            "event_type": "product_heartbeat" if index % 7 == 0 else "cycle_tick",
+            "created_at": "2026-01-01T00:00:00+00:00",
+            "created_at_epoch": now - (300 - index) * 3_600,
+            "assignment_id": None,
+            "work_item": None,
+            "repository": None,
+            "lifecycle_state": None,
+            "details": {"padding": "x" * 400},
+        }
+        for index in range(300)
+    ]
+    log = OperationalEventLog(tmp_path, "cycle")
+    log.path.write_text(
+        "".join(json.dumps(value) + "\n" for value in lines), encoding="utf-8"
+    )
+    log.TAIL_CHUNK_BYTES = 1_000
+    assert log.events(limit=5) == lines[-5:]
+    assert log.events(limit=1_000) == lines
+    assert log.events_between(now - 48 * 3_600, now) == [
+        value for value in lines if value["created_at_epoch"] >= now - 48 * 3_600
+    ]
+    assert log.latest_event("product_heartbeat") == lines[294]
+    assert log.latest_event("missing") is None
+    # Readers share the log lock and never rewrite the index.
+    assert not log.index_path.exists()
+
+    # Appends extend the index; a rewritten log is re-indexed from scratch.
+    log._commit([(lines[0] | {"event_id": "f" * 32}, False)])
+    assert log.index_path.exists()
+    with log.path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(lines[0] | {"event_id": "e" * 32}) + "\n")
+    assert log.latest_event("product_heartbeat")["event_id"] == "e" * 32
+    log.path.write_text(json.dumps(lines[1]) + "\n", encoding="utf-8")
+    assert log.latest_event("product_heartbeat") is None
+    assert log.events_between(0, now) == [lines[1]]
+
+
+def test_throughput_buckets_match_the_full_scan(tmp_path: Path):
+    import random
+
+    from axis_supervisor.observability import EVENT_SCHEMA, OperationalEventLog
+
+    generator = random.Random(11)
+    now = 1_780_000_000
+    event_types = [
+        "assignment_selected",
+        "assignment_disposition",
+        "implementation_completed",
+        "post_main_verified",
+        "mr_merged",
+        "assignment_retry",
+        "grant_consumed",
+        "cycle_tick",
+    ]
+    events = []
+    for index in range(1_500):
+        # Mostly chronological with occasional late appends, like concurrent
+        # writers racing across midnight.
+        late = generator.choice([0, 0, 0, 90_000])
+        epoch = now - 40 * 86_400 + index * 2_500 - late
+        events.append(
+            {
+                "schema": EVENT_SCHEMA,
+                "schema_version": "1.0.0",
+                "event_id": f"{index:032x}",
+                "event_type": generator.choice(event_types),
+                "created_at": "2026-01-01T00:00:00+00:00",
+                "created_at_epoch": epoch,
+                "assignment_id": generator.choice(
+                    [None, f"a-{generator.randrange(60)}"]
+                ),
+                "work_item": f"ghostspace/axis#{generator.randrange(20)}",
+                "repository": None,
+                "lifecycle_state": None,
+                "details": {
+                    "assignment_type": generator.choice(
+                        [
+                            "read-only-analysis",
+                            "code-implementation",
+                            "ci-integration-repair",
+                        ]
+                    ),
+                    "disposition": generator.choice(
+                        ["analysis-completed", "blocked", "failed", None]
+                    ),
+                },
+            }
+        )
+    log = OperationalEventLog(tmp_path, "reporter")
+    log.path.write_text(
+        "".join(json.dumps(value) + "\n" for value in events), encoding="utf-8"
+    )
+    latest = now - 40 * 86_400 + 1_500 * 2_500
+    for start, end in (
+        (latest - 86_400, latest),
+        (latest - 7 * 86_400, latest),
+        (latest - 30 * 86_400, latest),
+        (latest - 30 * 86_400 + 12_345, latest - 3 * 86_400 - 777),
+        (latest - 400, latest - 100),
+        (latest, latest - 100),
+    ):
+        assert log.throughput_metrics(start, end) == log.throughput_metrics_full_scan(
+            start, end
+        )
+
+
+def test_event_batch_commits_events_and_notifications_once(
+    tmp_path: Path, monkeypatch
+):
+    from axis_supervisor import observability
+    from axis_supervisor.observability import event_batch, record_event
+    from axis_supervisor.schema_registry import write_record
+    from axis_supervisor.slack_outbox import SlackOutbox
+
+    write_record(
+        tmp_path / "control.json",
+        control(),
+        "axis.external-development-supervisor.control",
+    )
+    fsyncs = []
+    real_fsync = os.fsync
+    monkeypatch.setattr(
+        observability.os, "fsync", lambda fd: fsyncs.append(fd) or real_fsync(fd)
+    )
+    outbox_writes = []
+    real_append = SlackOutbox._append
+
+    def counted_append(self, entries):
+        outbox_writes.append(len(entries))
+        return real_append(self, entries)
+
+    monkeypatch.setattr(SlackOutbox, "_append", counted_append)
+    log = observability.OperationalEventLog(tmp_path, "cycle")
+    with event_batch(tmp_path, "cycle"):
+        with event_batch(tmp_path, "cycle"):
+            record_event(tmp_path, "cycle_tick", source="cycle", notify=False)
+        record_event(tmp_path, "assignment_retry", source="cycle")
+        record_event(tmp_path, "observability_recovered", source="cycle")
+        assert fsyncs == [] and not log.path.exists()
+        # Reads see everything emitted so far in the batch.
+        assert [event["event_type"] for event in log.events()] == [
+            "cycle_tick",
+            "assignment_retry",
+            "observability_recovered",
+        ]
+        # One log fsync plus one outbox journal append carrying both events.
+        assert len(fsyncs) == 2 and outbox_writes == [2]
+        record_event(tmp_path, "cycle_tick", source="cycle", notify=False)
+    assert len(fsyncs) == 3 and outbox_writes == [2]
+    assert len(log.events()) == 4
+    outbox = SlackOutbox(tmp_path).load()
+    assert [item["event"]["event_type"] for item in outbox["notifications"]] == [
+        "assignment_retry",
+        "observability_recovered",
+    ]
+
+    with pytest.raises(RuntimeError):
+        with event_batch(tmp_path, "cycle"):
+            record_event(tmp_path, "cycle_tick", source="cycle", notify=False)
+            raise RuntimeError("cycle failed")
+    assert len(log.events()) == 5
+
+    def failing_commit(self, entries):
+        raise OSError("disk full")
+
+    # A failed flush of the group never masks the error raised in the block.
+    monkeypatch.setattr(observability.OperationalEventLog, "_commit", failing_commit)
+    with pytest.raises(RuntimeError, match="cycle failed") as raised:
+        with event_batch(tmp_path, "cycle"):
+            record_event(tmp_path, "cycle_tick", source="cycle", notify=False)
+            raise RuntimeError("cycle failed")
+    assert "disk full" in raised.value.__notes__[0]
+    assert observability.OperationalEventLog(tmp_path, "cycle")._active_batch() is None
+
+
+def test_slack_outbox_journals_transitions_and_compacts(tmp_path: Path, monkeypatch):
+    from axis_supervisor import slack_outbox
+    from axis_supervisor.observability import record_event
+    from axis_supervisor.schema_registry import write_record
+    from axis_supervisor.slack_outbox import SlackOutbox
+
+    write_record(
+        tmp_path / "control.json",
+        control(),
+        "axis.external-development-supervisor.control",
+    )
+    for _ in range(3):
+        record_event(tmp_path, "assignment_retry", source="cycle")
+    outbox = SlackOutbox(tmp_path)
+    items = outbox.load()["notifications"]
+    ids = [item["notification_id"] for item in items]
+    for item in items[:2]:
+        outbox.advance(item, "notification_send_attempted", attempts=1)
+        outbox.advance(item, "Slack_message_verified", ts="1.0")
+    outbox.flush()
+    with pytest.raises(ValueError, match="unsupported Slack delivery stage"):
+        outbox.advance(items[2], "sent")
+    assert not outbox.path.exists()
+    assert len(outbox.journal_path.read_text().splitlines()) == 7
+
+    replayed = SlackOutbox(tmp_path).load()["notifications"]
+    assert replayed == items
+    assert [item["current_stage"] for item in replayed] == [
+        "Slack_message_verified",
+        "Slack_message_verified",
+        "notification_queued",
+    ]
+    assert replayed[0]["attempts"] == 1 and replayed[0]["ts"] == "1.0"
+
+    journal = outbox.journal_path.read_text()
+    monkeypatch.setattr(slack_outbox, "DELIVERED_RETENTION", 1)
+    compacted = outbox.compact()
+    assert outbox.journal_path.read_text() == ""
+    assert [item["notification_id"] for item in compacted["notifications"]] == ids[1:]
+    # A compaction interrupted before truncation replays to the same state.
+    outbox.journal_path.write_text(journal)
+    assert [
+        (item["notification_id"], item["current_stage"], len(item["stage_history"]))
+        for item in outbox.load()["notifications"]
+    ] == [
+        (ids[1], "Slack_message_verified", 4),
+        (ids[2], "notification_queued", 2),
+        (ids[0], "Slack_message_verified", 4),
+    ]
+
+    # A notification queued before the last compaction only has transitions in
+    # the journal, and replaying them must not duplicate its snapshot history.
+    outbox.compact()
+    pending = next(
+        item
+        for item in outbox.load()["notifications"]
+        if item["notification_id"] == ids[2]
+    )
+    outbox.advance(pending, "notification_send_attempted", attempts=1)
+    outbox.advance(pending, "delivery_failed", last_error="timeout")
+    outbox.flush()
+    journal = outbox.journal_path.read_text()
+    compacted = outbox.compact()
+    outbox.journal_path.write_text(journal)
+    replayed = {
+        item["notification_id"]: item for item in outbox.load()["notifications"]
+    }
+    assert replayed == {
+        item["notification_id"]: item for item in compacted["notifications"]
+    }
+    assert [entry["stage"] for entry in replayed[ids[2]]["stage_history"]] == [
+        "notification_created",
+        "notification_queued",
+        "notification_send_attempted",
+        "delivery_failed",
+    ]
+
+
 def test_operational_metrics_measure_verified_throughput(tmp_path: Path):
     from axis_supervisor.observability import (
         OperationalEventLog,
@@ -1077,6 +1462,117 @@ def test_capability_convergence_deploys_only_affected_runtime(tmp_path: Path):
     assert converged["runtimes"][0]["status"] == "converged"
 
 
+def test_capability_convergence_batches_revisions_and_host_probes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    from axis_supervisor import capability_convergence
+    from axis_supervisor.capability_convergence import CapabilityConvergenceProjector
+
+    repository = tmp_path / "axis"
+    repository.mkdir()
+
+    def git(*args: str) -> str:
+        return subprocess.check_output(
+            ["git", "-c", "user.email=t@example.test", "-c", "user.name=T", *args],
+            cwd=repository,
+            text=True,
+        ).strip()
+
+    git("init", "-q", "-b", "main")
+    for path, message in (
+        ("src/service.py", "service"),
+        ("src/old.py", "old"),
+        ("docs/readme.md", "docs"),
+        ("src/service.py", "service again"),
+    ):
+        (repository / path).parent.mkdir(parents=True, exist_ok=True)
+        (repository / path).write_text(message, encoding="utf-8")
+        git("add", ".")
+        git("commit", "-q", "-m", message)
+    git("mv", "src/old.py", "src/new.py")
+    git("commit", "-q", "-m", "rename")
+    capabilities = {
+        "Service": {"paths": ["src/service.py"]},
+        "Renamed": {"paths": ["src/old.py"]},
+        "Documentation": {"paths": ["docs/"]},
+        "Source": {"paths": ["src"]},
+        "Untouched": {"paths": ["missing/path"]},
+        "Globbed": {"paths": ["docs/*.md"]},
+        "Everything": {"paths": []},
+    }
+    projector = CapabilityConvergenceProjector(tmp_path)
+
+    def expected() -> dict:
+        return {
+            name: git("log", "-1", "--format=%H", "--", *definition["paths"])
+            if definition["paths"]
+            else "head"
+            for name, definition in capabilities.items()
+        }
+
+    revisions = projector._capability_revisions(repository, capabilities, "head")
+    assert revisions == expected()
+    assert revisions["Untouched"] == ""
+
+    # The merge is TREESAME to both parents for p, so `git log -1 -- p` follows
+    # the first parent to M1 while a walk limited to p and q follows the side.
+    git("checkout", "-q", "-b", "side")
+    for path, message in (("p", "same"), ("q", "side")):
+        (repository / path).write_text(message, encoding="utf-8")
+        git("add", ".")
+        git("commit", "-q", "-m", f"S {path}")
+    git("checkout", "-q", "main")
+    (repository / "p").write_text("same", encoding="utf-8")
+    git("add", ".")
+    git("commit", "-q", "--date=2000-01-01T00:00:00", "-m", "M1 p")
+    git("merge", "-q", "--no-ff", "side", "-m", "merge side")
+    capabilities.update({"P": {"paths": ["p"]}, "Q": {"paths": ["q"]}})
+    revisions = projector._capability_revisions(repository, capabilities, "head")
+    assert revisions == expected()
+    assert git("log", "-1", "--format=%s", revisions["P"]) == "M1 p"
+
+    identity = tmp_path / "identity.json"
+    identity.write_text(json.dumps({"runtime_revision": "abc"}), encoding="utf-8")
+    sessions = []
+    check_output = subprocess.check_output
+
+    def remote(command, **kwargs):
+        if command[0] != "ssh":
+            return check_output(command, **kwargs)
+        sessions.append(command)
+        # Run the batched remote script locally in place of the host.
+        return check_output(["sh", "-c", command[-1]], **kwargs)
+
+    monkeypatch.setattr(capability_convergence.subprocess, "check_output", remote)
+    monkeypatch.setattr(
+        capability_convergence, "SSH_CONTROL_PATH", str(tmp_path / "ssh" / "%C")
+    )
+    probes = projector._probe(
+        {
+            "nyx": {
+                "host": "nyx",
+                "identity_path": str(identity),
+                "required_command": "sh",
+            },
+            "nyx-desktop": {
+                "host": "nyx",
+                "identity_path": str(tmp_path / "missing identity.json"),
+                "required_path": str(tmp_path / "missing app"),
+            },
+            "ghost": {"host": "local", "identity_path": str(identity)},
+        }
+    )
+    assert probes == {
+        "nyx": ({"runtime_revision": "abc"}, None, True),
+        "nyx-desktop": (None, "identity-missing", False),
+        "ghost": ({"runtime_revision": "abc"}, None, True),
+    }
+    assert len(sessions) == 1 and sessions[0][-2] == "nyx"
+    assert "ControlMaster=auto" in sessions[0]
+    assert f"ControlPath={tmp_path / 'ssh' / '%C'}" in sessions[0]
+    assert (tmp_path / "ssh").is_dir()
+
+
 def _deployment_source_remote(tmp_path: Path) -> tuple[Path, Path]:
     source = tmp_path / "home-source"
     remote = tmp_path / "home-remote.git"
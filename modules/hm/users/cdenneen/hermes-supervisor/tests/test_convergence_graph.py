@@ -264,6 +264,7 @@ def test_collector_emits_actionable_root_convergence_for_behind_main(
         },
     )
     monkeypatch.setattr(collector, "active_mission_issue_refs", lambda: set())
+    monkeypatch.setattr(collector, "COLLECTION_STATE", tmp_path / "collection-state.json")
     monkeypatch.setattr(collector, "glab", fake_glab)
     monkeypatch.setattr(collector, "local_repository_state", lambda *_args: local_facts)
     monkeypatch.setattr(
@@ -327,6 +328,7 @@ def test_collector_bounds_and_reports_dependency_link_timeouts(
         },
     )
     monkeypatch.setattr(collector, "active_mission_issue_refs", lambda: set())
+    monkeypatch.setattr(collector, "COLLECTION_STATE", tmp_path / "collection-state.json")
     monkeypatch.setattr(collector, "glab", fake_glab)
     monkeypatch.setattr(
         collector,
@@ -356,6 +358,284 @@ def test_collector_bounds_and_reports_dependency_link_timeouts(
     assert link_call["timeout"] == collector.DEPENDENCY_LINK_TIMEOUT_SECONDS
 
 
+def fake_gitlab(*, delay: bool = False):
+    import random
+    import time
+    from urllib.parse import parse_qs, urlparse
+
+    projects = [
+        {
+            "id": index,
+            "path": name.rsplit("/", 1)[1],
+            "path_with_namespace": name,
+            "default_branch": "main",
+            "web_url": f"https://example.test/{name}",
+        }
+        for index, name in enumerate(
+            ["ghostspace/axis", "ghostspace/axis-governance", "ghostspace/axis-lab"], 1
+        )
+    ]
+    issues = {
+        project["id"]: [
+            {
+                "iid": iid,
+                "title": f"Issue {iid}",
+                "state": "opened" if iid % 3 else "closed",
+                "labels": ["planning"] if iid % 2 else [],
+                "description": f"acceptance_id: AC-{iid}\nstate: open",
+                "web_url": f"https://example.test/{project['path_with_namespace']}/-/issues/{iid}",
+                "updated_at": f"2026-08-0{1 + iid % 5}T00:00:00Z",
+            }
+            for iid in range(1, 8)
+        ]
+        for project in projects
+    }
+    mrs = {
+        project["id"]: [
+            {
+                "iid": iid,
+                "title": f"Resolve #{iid}",
+                "description": f"closes #{iid + 1}",
+                "state": "opened" if iid % 2 else "merged",
+                "source_branch": f"hermes/axis{iid}-work",
+                "sha": f"{iid:040d}",
+                "web_url": f"https://example.test/mr/{iid}",
+                "updated_at": "2026-08-01T00:00:00Z",
+            }
+            for iid in range(1, 5)
+        ]
+        for project in projects
+    }
+
+    def updated(values: list[dict], path: str) -> list[dict]:
+        watermark = parse_qs(urlparse(path).query).get("updated_after")
+        return [
+            dict(value)
+            for value in values
+            if not watermark or value["updated_at"] >= watermark[0]
+        ]
+
+    def request(path: str, **_kwargs):
+        request.calls.append(path)
+        if delay:
+            time.sleep(random.uniform(0, 0.01))
+        if path.startswith("groups/"):
+            return [dict(project) for project in projects]
+        project_id = int(path.split("/")[1])
+        if "/issues?" in path:
+            return updated(issues[project_id], path)
+        if "/merge_requests?" in path:
+            return updated(mrs[project_id], path)
+        if "/milestones?" in path:
+            return [{"iid": 1, "title": f"M{project_id}", "state": "active"}]
+        if path.endswith("/approvals"):
+            return {"approved": True, "approved_by": []}
+        if "/merge_requests/" in path:
+            iid = int(path.rsplit("/", 1)[1])
+            return {"sha": f"{iid:040d}", "head_pipeline": {"status": "success"}}
+        if path.endswith("/links"):
+            iid = int(path.split("/")[3])
+            return [
+                {
+                    "references": {"full": f"ghostspace/axis#{iid % 7 + 1}"},
+                    "link_type": "is_blocked_by",
+                    "state": "opened",
+                }
+            ]
+        if "/notes?" in path:
+            iid = int(path.split("/")[3])
+            if "page=1&" not in path:
+                return []
+            return [
+                {
+                    "id": project_id * 1000 + iid * 10 + offset,
+                    "body": f"note {offset} for {iid}",
+                    "author": {"id": 7, "username": "owner"},
+                    "created_at": f"2026-08-01T00:0{offset}:00Z",
+                    "updated_at": f"2026-08-01T00:0{offset}:00Z",
+                    "system": False,
+                }
+                for offset in range(3)
+            ]
+        raise AssertionError(path)
+
+    request.calls = []
+    request.issues = issues
+    request.mrs = mrs
+    return request
+
+
+def collect_with(
+    monkeypatch, tmp_path: Path, request, workers: int, mode: str = "full"
+) -> dict:
+    from datetime import datetime, timezone
+
+    from axis_supervisor import collector
+    from axis_supervisor.schema_registry import write_record
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime(2026, 8, 4, tzinfo=tz or timezone.utc)
+
+    captured = {}
+    monkeypatch.setattr(collector, "ROOT", tmp_path)
+    monkeypatch.setattr(collector, "COLLECTOR_WORKERS", workers)
+    monkeypatch.setattr(collector, "COLLECTOR_MODE", mode)
+    monkeypatch.setattr(collector, "GITLAB_REQUESTS_PER_MINUTE", 0)
+    monkeypatch.setattr(collector, "INVENTORY", tmp_path / "inventory.json")
+    monkeypatch.setattr(
+        collector, "COLLECTION_STATE", tmp_path / "collector" / "collection-state.json"
+    )
+    monkeypatch.setattr(collector, "datetime", FrozenDatetime)
+    monkeypatch.setattr(
+        collector,
+        "load_control",
+        lambda: {
+            "mode": "enabled",
+            "allow_repository_mutation": True,
+            "repository_allowlist": ["ghostspace/axis"],
+            "owned_branch_prefixes": ["hermes/"],
+            "owned_worktree_root": str(tmp_path / "worktrees"),
+            "trusted_gitlab_user_ids": [7],
+        },
+    )
+    monkeypatch.setattr(collector, "active_mission_issue_refs", lambda: set())
+    monkeypatch.setattr(collector, "glab", request)
+    monkeypatch.setattr(
+        collector,
+        "local_repository_state",
+        lambda project, _mrs: {"present": False, "path": project["path"]},
+    )
+
+    def write_inventory(path: Path, value: dict) -> None:
+        write_record(path, value, "axis.external-development-supervisor.inventory")
+        captured["value"] = json.loads(json.dumps(value))
+
+    monkeypatch.setattr(collector, "write_inventory", write_inventory)
+    assert collector.main() == 0
+    value = captured["value"]
+    for volatile in ("generation_id", "duration_seconds"):
+        value.pop(volatile)
+    return value
+
+
+def test_concurrent_collection_matches_serial_inventory(tmp_path: Path, monkeypatch):
+    serial = collect_with(monkeypatch, tmp_path, fake_gitlab(), workers=1)
+    concurrent = collect_with(
+        monkeypatch, tmp_path, fake_gitlab(delay=True), workers=8
+    )
+
+    assert serial["work_items_discovered"] == 21
+    assert any(item["source_evidence"]["notes"] for item in serial["work_items"])
+    assert json.dumps(concurrent, sort_keys=True) == json.dumps(serial, sort_keys=True)
+
+
+def test_incremental_collection_refreshes_only_updated_issues(
+    tmp_path: Path, monkeypatch
+):
+    def query_counts(inventory: dict) -> tuple[int, int]:
+        status = inventory["collection_status"]
+        return (
+            status.pop("dependency_queries"),
+            status.pop("dependency_queries_reused"),
+        )
+
+    request = fake_gitlab()
+    full = collect_with(monkeypatch, tmp_path, request, workers=4, mode="incremental")
+    assert query_counts(full) == (15, 0)
+
+    request.calls.clear()
+    unchanged = collect_with(
+        monkeypatch, tmp_path, request, workers=4, mode="incremental"
+    )
+    assert not [path for path in request.calls if path.endswith("/links")]
+    assert query_counts(unchanged) == (0, 15)
+    assert unchanged == full
+    assert not [path for path in request.calls if "/notes?" in path]
+    assert all("updated_after=" in path for path in request.calls if "/issues?" in path)
+
+    changed = request.issues[1][1]
+    changed.update(
+        {"title": "Retitled", "updated_at": "2026-08-09T00:00:00Z"}
+    )
+    request.calls.clear()
+    incremental = collect_with(
+        monkeypatch, tmp_path, request, workers=4, mode="incremental"
+    )
+    refreshed = {
+        path.split("/")[3] for path in request.calls if "/notes?" in path
+    }
+    # Issue 1 is blocked by the changed issue, so its blocking state is re-read.
+    assert refreshed == {"1", "2"}
+    # Only the links actually requested this run count as queries.
+    queried = [path for path in request.calls if path.endswith("/links")]
+    assert query_counts(incremental) == (len(queried), 15 - len(queried)) == (4, 11)
+    rebuilt = collect_with(
+        monkeypatch, tmp_path / "full", request, workers=4, mode="full"
+    )
+    assert query_counts(rebuilt) == (15, 0)
+    assert incremental == rebuilt
+    item = next(
+        item
+        for item in incremental["work_items"]
+        if item["ref"] == "ghostspace/axis#2"
+    )
+    assert item["title"] == "Retitled"
+
+
+def test_incremental_collection_resyncs_when_context_changes(
+    tmp_path: Path, monkeypatch
+):
+    from axis_supervisor import collector
+
+    request = fake_gitlab()
+    collect_with(monkeypatch, tmp_path, request, workers=1, mode="incremental")
+    state_path = tmp_path / "collector" / "collection-state.json"
+    state = json.loads(state_path.read_text(encoding="utf-8"))
+    state["context"] = "sha256:stale"
+    state_path.write_text(json.dumps(state), encoding="utf-8")
+    monkeypatch.setattr(collector, "COLLECTION_STATE", state_path)
+
+    assert collector.load_collection_state("sha256:current", 0) == (
+        None,
+        "collection context changed",
+    )
+    request.calls.clear()
+    collect_with(monkeypatch, tmp_path, request, workers=1, mode="incremental")
+    assert not any("updated_after=" in path for path in request.calls)
+
+
+def test_fetch_pool_orders_results_and_bounds_host_concurrency():
+    import threading
+    import time
+
+    from axis_supervisor.fetch_pool import FetchPool
+
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def request(value: int) -> int:
+        with lock:
+            active.append(value)
+            peak.append(len(active))
+        time.sleep(0.005)
+        with lock:
+            active.remove(value)
+        return value * 2
+
+    with FetchPool(8, host_limits={"gitlab.com": 3}) as pool:
+        limited = pool.limited("gitlab.com", request)
+        with pool.phase("fan-out"):
+            results = pool.map(limited, list(range(20)))
+
+    assert results == [value * 2 for value in range(20)]
+    assert max(peak) <= 3
+    assert pool.report()["requests"] == {"gitlab.com": 20}
+    assert "fan-out" in pool.report()["phase_seconds"]
+
+
 def test_global_queue_zero_proof_is_graph_owned(tmp_path: Path):
     configure(tmp_path)
     blocked = source_item("ghostspace/axis#1", labels=["blocked"])
@@ -385,6 +665,56 @@ def test_queue_zero_is_not_proven_when_policy_hides_executable_work(
     assert graph["governed_queue_zero_proven"] is False
 
 
+def test_graph_rebuild_reuses_nodes_whose_inputs_are_unchanged(
+    tmp_path: Path, monkeypatch
+):
+    from axis_supervisor import graph as graph_module
+
+    configure(tmp_path)
+    items = [source_item(f"ghostspace/axis#{number}") for number in (1, 2, 3)]
+    builder = ExecutionGraphBuilder(tmp_path)
+    cold = builder.build(inventory(items), persist=False)
+    # An unpersisted build leaves its node cache pending until it is published.
+    assert not builder.node_cache_path.exists()
+    builder.write_node_cache()
+    evaluated = []
+    verification_for = graph_module.verification_for
+    monkeypatch.setattr(
+        graph_module,
+        "verification_for",
+        lambda item, *args, **kwargs: evaluated.append(item["ref"])
+        or verification_for(item, *args, **kwargs),
+    )
+
+    warm = builder.build(inventory(items), persist=False)
+    assert evaluated == []
+    assert warm["nodes"] == cold["nodes"]
+    assert warm["executable_queue"] == cold["executable_queue"]
+
+    items[1] = items[1] | {"title": "renamed"}
+    changed = builder.build(inventory(items))
+    assert evaluated == ["ghostspace/axis#2"]
+    assert changed["nodes"][1]["title"] == "renamed"
+
+    cache = json.loads(
+        (tmp_path / "execution-graph-node-cache.json").read_text(encoding="utf-8")
+    )
+    cache["code"] = "older-rules"
+    (tmp_path / "execution-graph-node-cache.json").write_text(
+        json.dumps(cache), encoding="utf-8"
+    )
+    builder.build(inventory(items), persist=False)
+    assert evaluated[1:] == [item["ref"] for item in items]
+    builder.write_node_cache()
+
+    # The cache is derived: an unwritable cache file never aborts a rebuild.
+    cache_path = tmp_path / "execution-graph-node-cache.json"
+    cache_path.unlink()
+    cache_path.mkdir()
+    assert builder.build(inventory(items))["nodes"] == changed["nodes"]
+    assert list(tmp_path.glob("execution-graph-node-cache.json.*.tmp")) == []
+
+
 def test_source_fingerprint_covers_canonical_authority_and_dependency_facts():
     from axis_supervisor.decomposition import SemanticDecompositionEngine
 
@@ -550,3 +880,88 @@ def test_root_convergence_fast_forwards_and_prunes_stale_worktree_metadata(
         }
     )
     assert projection["status"] == "green"
+
+
+def test_local_repository_state_batches_ancestry_across_worktrees_and_branches(
+    tmp_path: Path, monkeypatch
+):
+    from axis_supervisor import collector
+
+    def git(*args: str, cwd: Path = tmp_path) -> str:
+        return subprocess.check_output(["git", *args], cwd=cwd, text=True).strip()
+
+    remote = tmp_path / "remote.git"
+    repo = tmp_path / "axis"
+    git("init", "--bare", str(remote))
+    git("init", "-b", "main", str(repo))
+    git("config", "user.name", "Test", cwd=repo)
+    git("config", "user.email", "test@example.invalid", cwd=repo)
+    (repo / "README").write_text("initial\n", encoding="utf-8")
+    git("add", "README", cwd=repo)
+    git("commit", "-m", "initial", cwd=repo)
+    git("remote", "add", "origin", str(remote), cwd=repo)
+    git("push", "-u", "origin", "main", cwd=repo)
+    git("branch", "hermes/merged", cwd=repo)
+    git("push", "origin", "hermes/merged", cwd=repo)
+    for index in range(3):
+        worktree = tmp_path / f"wt-{index}"
+        git("worktree", "add", "-b", f"hermes/work-{index}", str(worktree), cwd=repo)
+        (worktree / f"file-{index}").write_text("change\n", encoding="utf-8")
+        git("add", ".", cwd=worktree)
+        git("commit", "-m", f"work {index}", cwd=worktree)
+        git("push", "origin", f"hermes/work-{index}", cwd=worktree)
+    (tmp_path / "wt-1" / "scratch").write_text("dirty\n", encoding="utf-8")
+    git("worktree", "add", "--detach", str(tmp_path / "detached"), "main", cwd=repo)
+    (repo / "README").write_text("advanced\n", encoding="utf-8")
+    git("commit", "-am", "advance main", cwd=repo)
+    git("push", "origin", "main", cwd=repo)
+
+    monkeypatch.setattr(collector, "WORKSPACE", tmp_path)
+    monkeypatch.setattr(collector, "REPOSITORY_PROBE_WORKERS", 4)
+    state = collector.local_repository_state(
+        {"path": "axis", "default_branch": "main"},
+        [{"iid": 7, "source_branch": "hermes/work-2", "state": "opened"}],
+    )
+
+    assert "error" not in state
+    head = git("rev-parse", "HEAD", cwd=repo)
+    assert state["head"] == state["default_remote_head"] == head
+    assert state["remote_fresh"] is True
+    assert state["branch"] == "main" and state["dirty"] is False
+    assert state["root_fast_forward_safe"] is True
+    worktrees = {Path(value["path"]).name: value for value in state["worktrees"]}
+    assert worktrees["axis"]["is_root"] is True
+    assert worktrees["detached"]["branch"] == ""
+    assert worktrees["detached"]["integrated_into_default"] is True
+    assert worktrees["wt-0"]["integrated_into_default"] is False
+    assert [worktrees[f"wt-{index}"]["dirty"] for index in range(3)] == [
+        False,
+        True,
+        False,
+    ]
+    local = {
+        value["name"]: value["integrated_into_default"]
+        for value in state["local_branches"]
+    }
+    assert local == {
+        "hermes/merged": True,
+        "hermes/work-0": False,
+        "hermes/work-1": False,
+        "hermes/work-2": False,
+        "main": True,
+    }
+    remote_branches = {value["name"]: value for value in state["remote_branches"]}
+    assert sorted(remote_branches) == [
+        "hermes/merged",
+        "hermes/work-0",
+        "hermes/work-1",
+        "hermes/work-2",
+    ]
+    assert remote_branches["hermes/merged"]["integrated_into_default"] is True
+    assert remote_branches["hermes/merged"]["ahead"] == 0
+    work = remote_branches["hermes/work-2"]
+    assert (work["ahead"], work["behind"]) == (1, 1)
+    assert work["changed_paths"] == ["file-2"]
+    assert work["merge_base"] == git("merge-base", "main", "hermes/work-2", cwd=repo)
+    assert work["active_worktree"] == str(tmp_path / "wt-2")
+    assert work["merge_request"]["iid"] == 7
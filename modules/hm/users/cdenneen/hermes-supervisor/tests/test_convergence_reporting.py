@@ -609,6 +609,26 @@ def test_executive_dashboard_has_mission_v2_proof_sections_and_no_internal_text(
     assert fallback.startswith("AXIS | Progress reconciling | Capabilities")
     assert len(fingerprint) == 64
 
+    cache = {}
+    assert render_executive_dashboard(
+        tmp_path, inventory, graph, semantics, events, cache
+    ) == (fallback, blocks, fingerprint)
+    assert tuple(cache) == DASHBOARD_PROOF_SECTIONS
+    # Unchanged input slices reuse cached text; a changed slice re-renders.
+    cache["DEPLOYMENT RING"]["text"] = "cached deployment ring"
+    cache["RECENT PRODUCT PROGRESS"]["text"] = "cached recent progress"
+    events.append(
+        {"event_type": "mr_merged", "work_item": "ghostspace/axis#30", "details": {}}
+    )
+    _, cached_blocks, _ = render_executive_dashboard(
+        tmp_path, inventory, graph, semantics, events, cache
+    )
+    texts = [
+        block["text"]["text"] for block in cached_blocks if block["type"] == "section"
+    ]
+    assert texts[4] == "cached deployment ring"
+    assert "ghostspace/axis#30" in texts[7]
+
 
 def test_progress_bar_is_deterministic_and_bounded():
     from axis_supervisor.dashboard import progress_bar
@@ -0,0 +1,161 @@
+import json
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from axis_supervisor.gitlab_client import GitLabAPIError, GitLabClient  # noqa: E402
+
+
+class StubGitLab(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    pages: dict[str, list] = {}
+    failures: dict[str, int] = {}
+    requests: list[dict] = []
+    link_on_not_modified = True
+
+    def log_message(self, *_args) -> None:
+        return None
+
+    def do_GET(self) -> None:
+        path, _, query = self.path.partition("?")
+        self.requests.append(
+            {
+                "path": self.path,
+                "authorization": self.headers.get("Authorization"),
+                "if_none_match": self.headers.get("If-None-Match"),
+                "port": self.client_address[1],
+            }
+        )
+        if path.endswith("/slow"):
+            time.sleep(0.5)
+        if self.failures.get(path):
+            self.failures[path] -= 1
+            self._send(503, b"{}", {"Retry-After": "0"})
+            return
+        page = int(dict(
+            value.split("=", 1) for value in query.split("&") if "=" in value
+        ).get("page", "1"))
+        pages = self.pages.get(path)
+        if pages is None:
+            self._send(404, b'{"message":"404 Not Found"}')
+            return
+        body = json.dumps(pages[page - 1]).encode("utf-8")
+        etag = f'W/"{path}-{page}"'
+        headers = {"ETag": etag}
+        if page < len(pages):
+            host = self.headers["Host"]
+            headers["Link"] = (
+                f'<http://{host}{path}?per_page=2&page={page + 1}>; rel="next", '
+                f'<http://{host}{path}?per_page=2&page=1>; rel="first"'
+            )
+        if self.headers.get("If-None-Match") == etag:
+            if not self.link_on_not_modified:
+                headers.pop("Link", None)
+            self._send(304, b"", headers)
+            return
+        self._send(200, body, headers)
+
+    def _send(self, status: int, body: bytes, headers: dict | None = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def stub():
+    StubGitLab.pages = {}
+    StubGitLab.failures = {}
+    StubGitLab.requests = []
+    StubGitLab.link_on_not_modified = True
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubGitLab)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/api/v4/"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_client_paginates_over_one_keep_alive_connection(stub: str):
+    StubGitLab.pages["/api/v4/projects/1/issues"] = [[{"iid": 3}, {"iid": 2}], [{"iid": 1}]]
+    client = GitLabClient("gitlab.com", "secret", base_url=stub)
+
+    values = client("projects/1/issues?per_page=2", paginate=True)
+
+    assert values == [{"iid": 3}, {"iid": 2}, {"iid": 1}]
+    assert client.stats["connections"] == 1
+    assert len({request["port"] for request in StubGitLab.requests}) == 1
+    assert {request["authorization"] for request in StubGitLab.requests} == {
+        "Bearer secret"
+    }
+
+
+def test_client_reuses_cached_body_on_not_modified(stub: str):
+    StubGitLab.pages["/api/v4/projects/1"] = [{"id": 1, "name": "axis"}]
+    client = GitLabClient("gitlab.com", "secret", base_url=stub)
+
+    assert client("projects/1") == {"id": 1, "name": "axis"}
+    assert client("projects/1") == {"id": 1, "name": "axis"}
+
+    assert StubGitLab.requests[1]["if_none_match"] == 'W/"/api/v4/projects/1-1"'
+    assert client.stats["not_modified"] == 1
+
+
+def test_not_modified_pages_keep_the_cached_next_link(stub: str):
+    StubGitLab.pages["/api/v4/projects/1/issues"] = [[{"iid": 3}, {"iid": 2}], [{"iid": 1}]]
+    StubGitLab.link_on_not_modified = False
+    client = GitLabClient("gitlab.com", "secret", base_url=stub)
+
+    first = client("projects/1/issues?per_page=2", paginate=True)
+    assert client("projects/1/issues?per_page=2", paginate=True) == first
+    assert first == [{"iid": 3}, {"iid": 2}, {"iid": 1}]
+    assert client.stats["not_modified"] == 2
+
+
+def test_client_retries_transient_failures_and_reports_api_errors(stub: str):
+    StubGitLab.pages["/api/v4/projects/1"] = [{"id": 1}]
+    StubGitLab.failures["/api/v4/projects/1"] = 2
+    client = GitLabClient("gitlab.com", "secret", base_url=stub, backoff_seconds=0)
+
+    assert client("projects/1") == {"id": 1}
+    assert client.stats["retries"] == 2
+    with pytest.raises(GitLabAPIError) as error:
+        client("projects/404")
+    assert error.value.status == 404
+
+
+def test_client_timeout_matches_glab_timeout_accounting(stub: str):
+    StubGitLab.pages["/api/v4/projects/1/slow"] = [{"id": 1}]
+    client = GitLabClient("gitlab.com", "secret", base_url=stub)
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        client("projects/1/slow", timeout=0.1)
+
+
+def test_collector_glab_is_a_drop_in_for_the_http_client(stub: str, monkeypatch):
+    from axis_supervisor import collector
+
+    StubGitLab.pages["/api/v4/groups/ghostspace/projects"] = [
+        [{"id": 1, "path": "axis"}],
+        [{"id": 2, "path": "axis-lab"}],
+    ]
+    client = GitLabClient("gitlab.com", "secret", base_url=stub)
+    monkeypatch.setattr(collector, "shared_client", lambda *_args: client)
+
+    assert collector.glab("groups/ghostspace/projects", paginate=True) == [
+        {"id": 1, "path": "axis"},
+        {"id": 2, "path": "axis-lab"},
+    ]
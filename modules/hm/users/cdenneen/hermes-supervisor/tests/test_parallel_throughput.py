@@ -113,6 +113,115 @@ def test_frontier_allows_compatible_same_repository_paths_and_stage_capacity(
     ]
 
 
+def test_frontier_path_index_selects_exactly_what_pairwise_checks_select(
+    tmp_path: Path,
+):
+    import random
+
+    from axis_supervisor.frontier import (
+        STAGE_CAPACITIES,
+        TERMINAL_STATES,
+        build_executable_frontier,
+        compatible,
+        stage_for,
+    )
+
+    def pairwise(queue: list[dict], active_assignments: list[dict]) -> tuple:
+        active = [
+            value
+            for value in active_assignments
+            if value.get("lifecycle_state") not in TERMINAL_STATES
+        ]
+        selected_values: list[dict] = []
+        selected, deferred, seen = [], [], set()
+        for value in queue:
+            entry_id = str(value.get("ref") or "")
+            stage = stage_for(value)
+            if entry_id in seen:
+                deferred.append((entry_id, "duplicate", entry_id))
+                continue
+            seen.add(entry_id)
+            claimed = [*active, *selected_values]
+            if sum(stage_for(item) == stage for item in claimed) >= STAGE_CAPACITIES[
+                stage
+            ]:
+                deferred.append((entry_id, "stage-capacity", None))
+                continue
+            conflict = next(
+                (item for item in claimed if not compatible(value, item)), None
+            )
+            if conflict is not None:
+                deferred.append(
+                    (
+                        entry_id,
+                        "conflict-domain",
+                        str(
+                            conflict.get("assignment_id")
+                            or conflict.get("ref")
+                            or "active"
+                        ),
+                    )
+                )
+                continue
+            selected.append(entry_id)
+            selected_values.append(value)
+        return selected, deferred
+
+    generator = random.Random(22)
+    segments = ["src", "docs", "src/api", "src/api/v1", "tests", "a", "a.b", "*"]
+    types = [
+        "code-implementation",
+        "read-only-analysis",
+        "no-op-verification",
+        "ci-integration-repair",
+        "capability-deployment",
+    ]
+
+    def paths() -> list[str]:
+        chosen = []
+        for _ in range(generator.randrange(4)):
+            path = generator.choice(segments)
+            if path != "*" and generator.random() < 0.3:
+                path += f"/{generator.choice(['x.py', 'y', 'y/z.py'])}"
+            chosen.append(
+                generator.choice(["", "./", "/"]) + path + generator.choice(["", "/"])
+            )
+        return chosen
+
+    def value(index: int, **fields) -> dict:
+        value = {
+            "ref": f"axis#{generator.randrange(index + 1)}",
+            "assignment_type": generator.choice(types),
+            "project": generator.choice(["ghostspace/axis", "ghostspace/lab", None]),
+        }
+        if generator.random() < 0.5:
+            value["allowed_paths"] = paths()
+        else:
+            value["candidate"] = {"allowed_paths": paths()}
+        return value | fields
+
+    for _ in range(300):
+        active = [
+            value(
+                index,
+                assignment_id=f"assignment-{index}",
+                lifecycle_state=generator.choice(
+                    ["running-implementation", "awaiting-integration", "completed"]
+                ),
+            )
+            for index in range(generator.randrange(5))
+        ]
+        queue = [value(index) for index in range(generator.randrange(25))]
+        frontier = build_executable_frontier(tmp_path, queue, active, now=100)
+        assert (
+            frontier["selected"],
+            [
+                (item["entry_id"], item["reason"], item["conflicts_with"])
+                for item in frontier["deferred"]
+            ],
+        ) == pairwise(queue, active)
+
+
 def test_frontier_skips_quarantine_and_ci_waiting_does_not_consume_implementation(
     tmp_path: Path,
 ):
@@ -150,6 +259,116 @@ def test_frontier_skips_quarantine_and_ci_waiting_does_not_consume_implementatio
     assert frontier["deferred"][0]["reason"] == "quarantined"
 
 
+def test_worker_pool_runs_dispatched_assignments_concurrently_and_rebuilds_once(
+    monkeypatch,
+):
+    import threading
+    import time
+
+    from axis_supervisor import cycle
+
+    running = []
+    peak = []
+    rebuilds = []
+    lock = threading.Lock()
+
+    def execute(assignment, _manager, _supervisorctl, _gate, *, refresh=True):
+        assert refresh is False
+        with lock:
+            running.append(assignment["assignment_id"])
+            peak.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.remove(assignment["assignment_id"])
+        if assignment["assignment_id"] == "assignment-3":
+            raise RuntimeError("worker failed")
+        if assignment["assignment_id"] == "assignment-4":
+            return {
+                "result": "semantic-escalation-quarantined",
+                "assignment": assignment["assignment_id"],
+            }
+        return {"result": "completed", "assignment": assignment["assignment_id"]}
+
+    monkeypatch.setattr(cycle, "execute_new_assignment", execute)
+    monkeypatch.setattr(cycle, "rebuild", lambda: rebuilds.append(True) or {})
+
+    result = cycle.execute_assignments_concurrently(
+        [{"assignment_id": f"assignment-{index}"} for index in range(1, 5)],
+        object(),
+        "supervisorctl",
+        object(),
+        workers=4,
+    )
+
+    assert max(peak) == 4
+    assert rebuilds == [True]
+    assert result["result"] == "worker-pool-partial"
+    assert [value["assignment"] for value in result["assignments"]] == [
+        "assignment-1",
+        "assignment-2",
+        "assignment-4",
+    ]
+    assert result["failures"] == [
+        {"assignment": "assignment-3", "error": "RuntimeError: worker failed"}
+    ]
+    assert result["throughput"]["workers"] == 4
+    assert result["throughput"]["completed"] == 2
+    assert result["throughput"]["completed_per_hour"] > 0
+
+    # One worker runs the batch inline, one assignment at a time.
+    peak.clear()
+    serial = cycle.execute_assignments_concurrently(
+        [{"assignment_id": "assignment-1"}, {"assignment_id": "assignment-2"}],
+        object(),
+        "supervisorctl",
+        object(),
+        workers=1,
+    )
+    assert peak == [1, 1] and rebuilds == [True, True]
+    assert serial["result"] == "worker-pool-complete"
+
+
+def test_worker_pool_dispatch_stops_at_the_model_call_budget(tmp_path: Path):
+    from axis_supervisor import cycle
+    from axis_supervisor.dispatcher import Dispatcher
+
+    write_control(tmp_path)
+    control = json.loads((tmp_path / "control.json").read_text(encoding="utf-8"))
+    control.update(mode="enabled", max_active_assignments=3)
+    (tmp_path / "control.json").write_text(json.dumps(control), encoding="utf-8")
+    items = [
+        {
+            "ref": f"semantic-decomposition:ghostspace/{project}#2",
+            "target_ref": f"ghostspace/{project}#2",
+            "kind": "capability-evidence-analysis",
+            "assignment_type": "read-only-analysis",
+            "project": f"ghostspace/{project}",
+            "title": project,
+            "classification": "Executable",
+            "authority": {"state": "preparation-only"},
+            "source_item": {},
+            "source_fingerprint": project,
+            "ranking_score": 10,
+        }
+        for project in ("axis", "axis-governance", "axis-lab")
+    ]
+    graph = {
+        "inventory_generation_id": "g1",
+        "executable_queue": items,
+        "scheduler_state": {"available_model_call_budget": 2},
+    }
+
+    dispatched = cycle.dispatch_worker_batch(
+        Dispatcher(tmp_path), graph, "run-next", items
+    )
+
+    assert [value["project"] for value in dispatched] == [
+        "ghostspace/axis",
+        "ghostspace/axis-governance",
+    ]
+    assert len(list((tmp_path / "assignments").glob("*.json"))) == 2
+
+
 def test_handoff_and_integration_queue_persist_reviewer(tmp_path: Path):
     from axis_supervisor.schema_registry import read_record
     from axis_supervisor.workflow_state import WorkflowState
@@ -482,6 +701,125 @@ def test_incident_card_posts_once_then_updates(tmp_path: Path):
     assert state["projection_timestamps"]["incident"]["incident-9"] == "2.1"
 
 
+def test_outbox_lanes_deliver_in_order_and_fail_independently(
+    tmp_path: Path, monkeypatch
+):
+    import threading
+    import types
+
+    from axis_supervisor import observability, slack_projection
+    from axis_supervisor.observability import record_event
+    from axis_supervisor.slack_projection import SlackProjection
+
+    write_control(tmp_path)
+    monkeypatch.setattr(slack_projection, "SLACK_DELIVERY_WORKERS", 4)
+    projection = SlackProjection(tmp_path)
+    _legacy_slack_state(projection.state_path)
+    state = projection.load_state()
+    clock = [1_700_000_000]
+    monkeypatch.setattr(
+        observability, "time", types.SimpleNamespace(time=lambda: clock[0])
+    )
+    # Two retries of incident-a more than the 60s aggregation window apart are
+    # two groups in one lane; incident-b is its own lane between them.
+    for incident, offset in (
+        ("incident-a", 0),
+        ("incident-b", 60),
+        ("incident-a", 120),
+    ):
+        clock[0] = 1_700_000_000 + offset
+        record_event(
+            tmp_path,
+            "assignment_retry",
+            assignment={
+                "assignment_id": f"assignment-{incident}",
+                "work_item": "ghostspace/axis#1",
+                "project": "ghostspace/axis",
+                "lifecycle_state": "running-implementation",
+            },
+            details={"retry": offset, "incident_id": incident},
+            source="worker",
+        )
+    first_posted = threading.Event()
+    lane_b_failed = threading.Event()
+    messages: dict[str, str] = {}
+    lane_a: list[tuple[str, str]] = []
+
+    def api(_token: str, method: str, payload: dict) -> dict:
+        if method == "conversations.history":
+            ts = payload["oldest"]
+            return {"ok": True, "messages": [{"ts": ts, "text": messages[ts]}]}
+        if "assignment-incident-b" in payload["text"]:
+            # Fail only once lane a has committed its first message.
+            assert first_posted.wait(5)
+            lane_b_failed.set()
+            raise RuntimeError("ratelimited")
+        if method == "chat.update":
+            # Lane a keeps going after lane b's failure.
+            assert lane_b_failed.wait(5)
+        ts = payload.get("ts") or "3.1"
+        messages[ts] = payload["text"]
+        lane_a.append((method, ts))
+        first_posted.set()
+        return {"ok": True, "channel": "D1", "ts": ts}
+
+    projection.api = api
+    with pytest.raises(RuntimeError, match="ratelimited"):
+        projection.process_outbox("token", "D1", state)
+
+    assert lane_a == [("chat.postMessage", "3.1"), ("chat.update", "3.1")]
+    assert "*Retry:* `120`" in messages["3.1"]
+    persisted = projection.load_state()
+    assert persisted["projection_timestamps"]["incident"] == {"incident-a": "3.1"}
+    stages = {
+        item["event"]["details"]["retry"]: item["current_stage"]
+        for item in projection.load_outbox()["notifications"]
+    }
+    assert stages == {
+        0: "Slack_message_verified",
+        60: "delivery_failed",
+        120: "Slack_message_verified",
+    }
+
+
+def test_outbox_compaction_failure_keeps_the_delivery_error(tmp_path: Path):
+    from axis_supervisor.observability import record_event
+    from axis_supervisor.slack_projection import SlackProjection
+
+    write_control(tmp_path)
+    projection = SlackProjection(tmp_path)
+    _legacy_slack_state(projection.state_path)
+    state = projection.load_state()
+    record_event(
+        tmp_path,
+        "assignment_retry",
+        assignment={
+            "assignment_id": "assignment-1",
+            "work_item": "ghostspace/axis#1",
+            "project": "ghostspace/axis",
+            "lifecycle_state": "running-implementation",
+        },
+        details={"retry": 1, "incident_id": "incident-1"},
+        source="worker",
+    )
+    compactions: list[str] = []
+
+    def api(_token: str, method: str, payload: dict) -> dict:
+        raise RuntimeError("ratelimited")
+
+    def refuse_compaction() -> dict:
+        compactions.append("refused")
+        raise PermissionError("reconciliation paused")
+
+    projection.api = api
+    projection.compact_outbox = refuse_compaction
+    with pytest.raises(RuntimeError, match="ratelimited") as raised:
+        projection.process_outbox("token", "D1", state)
+
+    assert compactions == ["refused"]
+    assert "reconciliation paused" in raised.value.__notes__[0]
+
+
 def decision_packet() -> dict:
     from axis_supervisor.decisions import DECISION_DIGEST, DECISION_ID
 
@@ -1080,3 +1418,273 @@ def test_no_op_activity_is_dashboard_only():
             "details": {"assignment_type": "no-op-verification"},
         }
     )
+
+
+def test_slack_client_keeps_connections_alive_and_honors_retry_after():
+    import threading
+    import time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    from axis_supervisor.slack_client import SlackClient
+
+    calls = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_POST(self):
+            payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            calls.append((self.path, payload, self.headers["Authorization"]))
+            status, body, headers = 200, {"ok": True, "ts": str(len(calls))}, {}
+            if self.path.endswith("chat.update") and len(calls) == 2:
+                status, body, headers = 429, {"ok": False}, {"Retry-After": "0.2"}
+            elif self.path.endswith("conversations.history"):
+                body = {"ok": False, "error": "channel_not_found"}
+            raw = json.dumps(body).encode()
+            self.send_response(status)
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.send_header("Content-Length", str(len(raw)))
+            self.end_headers()
+            self.wfile.write(raw)
+
+        def log_message(self, *_args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        client = SlackClient(f"http://127.0.0.1:{server.server_port}/api")
+        posted = client.call("xoxb", "chat.postMessage", {"channel": "D1", "text": "a"})
+        started = time.monotonic()
+        updated = client.call("xoxb", "chat.update", {"channel": "D1", "ts": "1"})
+        assert time.monotonic() - started >= 0.2
+        with pytest.raises(RuntimeError, match="channel_not_found"):
+            client.call("xoxb", "conversations.history", {"channel": "D1"})
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert posted["ts"] == "1" and updated["ts"] == "3"
+    assert [path for path, _, _ in calls] == [
+        "/api/chat.postMessage",
+        "/api/chat.update",
+        "/api/chat.update",
+        "/api/conversations.history",
+    ]
+    assert {auth for _, _, auth in calls} == {"Bearer xoxb"}
+    assert client.connections == 1
+    assert client.requests == 4 and client.rate_limited == 1
+
+
+def test_slack_client_retries_only_idempotent_calls_on_stale_connections():
+    import http.client
+
+    from axis_supervisor.slack_client import SlackClient
+
+    client = SlackClient("http://127.0.0.1:1/api")
+    sent: list[str] = []
+
+    def exchange(_connection, method: str, _body: bytes, _token: str):
+        sent.append(method)
+        if len(sent) % 2:
+            raise http.client.RemoteDisconnected("idle keep-alive closed")
+        return 200, b'{"ok": true, "ts": "1"}', ""
+
+    client._connection = lambda: (object(), True)
+    client._exchange = exchange
+    assert client.call("xoxb", "chat.update", {"channel": "D1", "ts": "1"})["ok"]
+    assert sent == ["chat.update", "chat.update"]
+
+    # The dropped post may already have been delivered; it is not resent.
+    sent.clear()
+    with pytest.raises(http.client.RemoteDisconnected):
+        client.call("xoxb", "chat.postMessage", {"channel": "D1", "text": "a"})
+    assert sent == ["chat.postMessage"]
+
+
+def test_preflight_falls_back_cold_only_when_the_rebuild_was_never_sent(
+    tmp_path: Path, monkeypatch
+):
+    import preflight
+    from axis_supervisor.daemon import DaemonBusy, DaemonUnavailable
+
+    staged = tmp_path / "inventory.pending.json"
+    outcomes: list[BaseException | None] = []
+    sent: list[dict] = []
+    sleeps: list[float] = []
+
+    def trigger(command: str, **arguments):
+        sent.append({"command": command, **arguments})
+        outcome = outcomes.pop(0)
+        if outcome is not None:
+            raise outcome
+        return {}
+
+    monkeypatch.setattr(preflight, "trigger", trigger)
+    monkeypatch.setattr(preflight.time, "sleep", sleeps.append)
+
+    outcomes[:] = [DaemonUnavailable("not listening")]
+    assert not preflight.rebuild_through_daemon(staged)
+
+    # A busy daemon never started the rebuild; it is retried, not run cold.
+    outcomes[:] = [DaemonBusy("busy"), DaemonBusy("busy"), None]
+    sent.clear()
+    assert preflight.rebuild_through_daemon(staged)
+    assert len(sent) == 3 and len(sleeps) == 2
+    assert {call["inventory_path"] for call in sent} == {str(staged)}
+
+    # A sent rebuild that outlives the deadline fails closed.
+    outcomes[:] = [TimeoutError("timed out")]
+    with pytest.raises(TimeoutError):
+        preflight.rebuild_through_daemon(staged)
+    monkeypatch.setattr(preflight, "DAEMON_REBUILD_TIMEOUT", 0)
+    outcomes[:] = [DaemonBusy("busy")]
+    with pytest.raises(DaemonBusy):
+        preflight.rebuild_through_daemon(staged)
+
+
+def test_supervisor_daemon_serves_gated_triggers_and_stays_single(
+    tmp_path: Path, monkeypatch
+):
+    import threading
+
+    from axis_supervisor import cycle, daemon
+    from axis_supervisor import schema_registry
+
+    write_control(tmp_path)
+    socket_path = tmp_path / "supervisor.sock"
+    rebuilt = []
+    monkeypatch.setattr(
+        cycle,
+        "rebuild",
+        lambda *, inventory_path=None: rebuilt.append(inventory_path)
+        or {"queue_depth": len(rebuilt)},
+    )
+    monkeypatch.setattr(
+        cycle,
+        "run_cycle",
+        lambda command, run_id, hermes, supervisorctl, assignment_id=None: {
+            "result": "no-assignment",
+            "run_id": run_id,
+            "hermes": hermes,
+        },
+    )
+    validated = []
+    original_validate = schema_registry.validate_record
+    monkeypatch.setattr(
+        schema_registry,
+        "validate_record",
+        lambda value, schema, **kwargs: validated.append(schema)
+        or original_validate(value, schema, **kwargs),
+    )
+    servers = []
+    serve_forever = daemon.SupervisorDaemon.serve_forever
+    monkeypatch.setattr(
+        daemon.SupervisorDaemon,
+        "serve_forever",
+        lambda server: servers.append(server) or serve_forever(server),
+    )
+    thread = threading.Thread(target=daemon.serve, args=(socket_path, tmp_path))
+    thread.start()
+    for _ in range(500):
+        if servers:
+            break
+        threading.Event().wait(0.01)
+
+    try:
+        with pytest.raises(RuntimeError, match="another supervisor daemon"):
+            daemon.serve(tmp_path / "second.sock", tmp_path)
+        assert socket_path.stat().st_mode & 0o777 == 0o600
+        assert daemon.trigger("ping", socket_path=socket_path)["triggers"] == 0
+        warmed = len(validated)
+        assert daemon.trigger(
+            "rebuild", socket_path=socket_path, inventory_path="/tmp/staged.json"
+        ) == {"queue_depth": 1}
+        assert daemon.trigger(
+            "run-next", socket_path=socket_path, run_id="run-1"
+        ) == {"result": "no-assignment", "run_id": "run-1", "hermes": "hermes"}
+        # The warm control record is parsed again but not re-validated.
+        assert len(validated) == warmed
+        with pytest.raises(RuntimeError, match="run-next requires run_id"):
+            daemon.trigger("run-next", socket_path=socket_path)
+
+        (tmp_path / "control.json").write_text("{", encoding="utf-8")
+        with pytest.raises(RuntimeError, match="CorruptRecordError"):
+            daemon.trigger("rebuild", socket_path=socket_path)
+        assert rebuilt == [Path("/tmp/staged.json")]
+        assert daemon.trigger("ping", socket_path=socket_path)["triggers"] == 2
+    finally:
+        servers[0].shutdown()
+        thread.join()
+    assert not socket_path.exists()
+    with pytest.raises(daemon.DaemonUnavailable):
+        daemon.trigger("ping", socket_path=tmp_path / "missing.sock")
+
+
+def test_busy_supervisor_daemon_rejects_triggers_instead_of_queueing(
+    tmp_path: Path, monkeypatch
+):
+    import threading
+
+    from axis_supervisor import cycle, daemon
+
+    write_control(tmp_path)
+    socket_path = tmp_path / "supervisor.sock"
+    started = threading.Event()
+    release = threading.Event()
+    rebuilt = []
+
+    def run_cycle(command, run_id, hermes, supervisorctl, assignment_id=None):
+        started.set()
+        assert release.wait(10)
+        return {"result": "no-assignment", "run_id": run_id}
+
+    monkeypatch.setattr(cycle, "run_cycle", run_cycle)
+    monkeypatch.setattr(
+        cycle,
+        "rebuild",
+        lambda *, inventory_path=None: rebuilt.append(inventory_path) or {},
+    )
+    servers = []
+    serve_forever = daemon.SupervisorDaemon.serve_forever
+    monkeypatch.setattr(
+        daemon.SupervisorDaemon,
+        "serve_forever",
+        lambda server: servers.append(server) or serve_forever(server),
+    )
+    thread = threading.Thread(target=daemon.serve, args=(socket_path, tmp_path))
+    thread.start()
+    for _ in range(500):
+        if servers:
+            break
+        threading.Event().wait(0.01)
+    results = []
+    running = threading.Thread(
+        target=lambda: results.append(
+            daemon.trigger("run-next", socket_path=socket_path, run_id="run-1")
+        )
+    )
+    try:
+        running.start()
+        assert started.wait(10)
+        with pytest.raises(daemon.DaemonBusy, match="busy"):
+            daemon.trigger(
+                "rebuild",
+                socket_path=socket_path,
+                inventory_path="/tmp/staged.json",
+                timeout=5,
+            )
+        assert daemon.trigger("ping", socket_path=socket_path)["triggers"] == 1
+        release.set()
+        running.join(10)
+        assert results == [{"result": "no-assignment", "run_id": "run-1"}]
+        # The rejected rebuild was never queued behind the running trigger.
+        assert rebuilt == []
+        assert daemon.trigger("rebuild", socket_path=socket_path) == {}
+        assert rebuilt == [None]
+    finally:
+        release.set()
+        servers[0].shutdown()
+        thread.join()
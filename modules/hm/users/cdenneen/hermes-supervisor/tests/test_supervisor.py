@@ -4,6 +4,7 @@ import json
 import os
 import subprocess
 import sys
+import time
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -681,6 +682,92 @@ def test_issue_note_collection_rejects_provenance_edits_with_same_body():
     assert collect_issue_notes(response, "123", 29, retries=0)["state"] == NOTES_ERROR
 
 
+def test_issue_note_cache_reads_only_notes_after_the_high_water_mark(tmp_path):
+    from axis_supervisor.collector import IssueNoteCache, collect_issue_notes
+
+    notes = {
+        note_id: {
+            "id": note_id,
+            "author": {"id": 117046, "username": "cdenneen"},
+            "created_at": f"2026-08-08T10:{note_id:02d}:00.000Z",
+            "updated_at": f"2026-08-08T10:{note_id:02d}:00.000Z",
+            "body": f"PlanningRecord note {note_id}",
+            "system": False,
+        }
+        for note_id in range(1, 6)
+    }
+    calls = []
+
+    def request(path: str):
+        calls.append(path)
+        values = sorted(
+            notes.values(),
+            key=lambda note: note["updated_at"] if "updated_at&sort=desc" in path
+            else note["created_at"],
+            reverse="sort=desc" in path,
+        )
+        return values if "&page=1&" in path else []
+
+    cache = IssueNoteCache(tmp_path, 3600)
+    fetched_at = "2026-08-08T12:00:00+00:00"
+    first = collect_issue_notes(request, "123", 29, fetched_at=fetched_at, cache=cache)
+    assert all("order_by=created_at&sort=asc" in path for path in calls)
+
+    notes[2] = notes[2] | {
+        "body": "PlanningRecord note 2 (amended)",
+        "updated_at": "2026-08-08T11:00:00.000Z",
+    }
+    calls.clear()
+    refreshed = collect_issue_notes(
+        request, "123", 29, fetched_at=fetched_at, cache=cache
+    )
+    uncached = collect_issue_notes(request, "123", 29, fetched_at=fetched_at)
+
+    assert calls[:2] == [
+        "projects/123/issues/29/notes?per_page=100&page=1&order_by=updated_at&sort=desc"
+    ] * 2
+    assert refreshed == uncached
+    assert refreshed != first
+    assert next(note for note in refreshed["notes"] if note["id"] == 2)["body"] == (
+        "PlanningRecord note 2 (amended)"
+    )
+    assert IssueNoteCache(tmp_path, 0).load("123", 29, time.time()) is None
+
+
+def test_mr_issue_index_matches_per_issue_reference_scan():
+    import re
+
+    from axis_supervisor.collector import index_mrs_by_issue, mr_mentions_issue
+
+    def mentions(mr: dict, iid: str) -> bool:
+        text = f"{mr.get('title', '')}\n{mr.get('description', '')}"
+        branch = str(mr.get("source_branch") or "")
+        return bool(
+            re.search(
+                rf"\b(?:close[sd]?|fix(?:e[sd])?|resolve[sd]?)\s+#(?:{iid})(?!\d)",
+                text,
+                re.I,
+            )
+        ) or bool(re.search(rf"(?:^|[-_/])(?:axis)?{iid}(?:[-_/]|$)", branch, re.I))
+
+    mrs = [
+        {"iid": 1, "title": "Fixes #12", "description": "also closes #3\nrefs #4"},
+        {"iid": 2, "title": "Resolved #120", "source_branch": "hermes/axis-7"},
+        {"iid": 3, "title": "prefix#12", "source_branch": "AXIS12-fix"},
+        {"iid": 4, "description": None, "source_branch": "feature/3_4-5"},
+        {"iid": 5, "title": "fixe #7 fixed  #07", "source_branch": "x112y/axis"},
+        {"iid": 6, "title": "unclosed #3", "source_branch": "3"},
+        {"iid": 7, "title": "CLOSE #5\nfix\t#6", "source_branch": "axis/axis9/"},
+    ]
+    index = index_mrs_by_issue(mrs)
+    for iid in range(0, 130):
+        expected = [mr["iid"] for mr in mrs if mentions(mr, str(iid))]
+        assert [mr["iid"] for mr in index.get(str(iid), [])] == expected, iid
+        assert [
+            mr["iid"] for mr in mrs if mr_mentions_issue(mr, {"iid": iid})
+        ] == expected
+
+
 def test_closed_issue_note_collection_is_limited_to_structured_or_active_findings():
     from axis_supervisor.collector import (
         NOTES_EMPTY,
@@ -3419,21 +3506,33 @@ def test_isolated_dependency_link_timeout_gate_requires_complete_noncanonical_ac
     )
 
 
-def test_recovery_failure_preserves_durable_child_diagnostic(tmp_path: Path):
+def test_recovery_failure_preserves_durable_diagnostic(tmp_path: Path):
     root = tmp_path / "runtime"
-    root.mkdir()
+    (root / "leases" / "a1").mkdir(parents=True)
+    (root / "assignments").mkdir()
     (root / "control.json").write_text(
         json.dumps(control(minimum_free_disk_gib=0)), encoding="utf-8"
     )
-    failing = tmp_path / "recover.py"
-    failing.write_text(
-        "import sys\nsys.stderr.write('lease schema mismatch\\n')\nraise SystemExit(2)\n",
+    (root / "leases" / "a1" / "lease.json").write_text(
+        json.dumps(
+            {
+                "schema": "axis.external-development-supervisor.lease",
+                "schema_version": "1.0.0",
+                "lease_id": "a1",
+                "assignment_id": "a1",
+                "owner_run_id": "run-1",
+                "fencing_token": "a" * 32,
+                "resources": ["repo:ghostspace/axis"],
+                "read_only": False,
+                "acquired_at_epoch": 1,
+                "heartbeat_at_epoch": 1,
+                "expires_at_epoch": 2,
+            }
+        ),
         encoding="utf-8",
     )
-    env = os.environ | {
-        "AXIS_SUPERVISOR_ROOT": str(root),
-        "AXIS_SUPERVISOR_CTL": str(failing),
-    }
+    (root / "assignments" / "a1.json").write_text("{", encoding="utf-8")
+    env = os.environ | {"AXIS_SUPERVISOR_ROOT": str(root)}
     result = subprocess.run(
         [sys.executable, str(ROOT / "scripts" / "preflight.py")],
         env=env,
@@ -3443,7 +3542,7 @@ def test_recovery_failure_preserves_durable_child_diagnostic(tmp_path: Path):
     )
     payload = json.loads(result.stdout)
     assert "supervisor recovery failed closed" in payload["reason"]
-    assert "lease schema mismatch" in payload["diagnostic"]
+    assert "JSONDecodeError" in payload["diagnostic"]
     event = json.loads((root / "operational-events.jsonl").read_text().splitlines()[-1])
     assert event["event_type"] == "preflight_skip"
     assert event["details"]["diagnostic_id"] == payload["diagnostic_id"]
@@ -3508,6 +3607,219 @@ def test_fenced_lease_conflict_and_release(tmp_path: Path):
     assert not (root / "leases" / "a1").exists()
 
 
+def test_lease_controller_serializes_in_process_callers(tmp_path: Path):
+    import threading
+
+    import pytest
+
+    from axis_supervisor.leases import LeaseController
+
+    root = tmp_path / "runtime"
+    root.mkdir()
+    (root / "control.json").write_text(
+        json.dumps(control(allow_repository_mutation=True, lease_seconds=120)),
+        encoding="utf-8",
+    )
+    write_claim_assignment(root, "a1", "r1")
+    leases = LeaseController(root)
+    lease = leases.claim("a1", "r1", ["path:ghostspace/axis:src"])
+    assert lease["expires_at_epoch"] - lease["acquired_at_epoch"] == 120
+
+    errors = []
+
+    def renew() -> None:
+        try:
+            leases.heartbeat("a1", lease["fencing_token"], 600)
+        except Exception as exc:  # noqa: BLE001 - collected for the assertion
+            errors.append(exc)
+
+    threads = [threading.Thread(target=renew) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert not leases.lock_path.exists()
+    renewed = leases.all()[0]
+    assert renewed["expires_at_epoch"] - renewed["heartbeat_at_epoch"] == 600
+    with pytest.raises(RuntimeError, match="fencing token mismatch"):
+        leases.release("a1", "b" * 32)
+    leases.release("a1", lease["fencing_token"])
+    assert leases.all() == []
+    assert leases.recover() == []
+
+
+def test_assignment_index_skips_terminal_records_and_archives_settled_ones(
+    tmp_path: Path, monkeypatch
+):
+    import os
+
+    import pytest
+
+    from axis_supervisor import assignment_index
+    from axis_supervisor.assignment_index import AssignmentIndex, assignment_paths
+    from axis_supervisor.leases import LeaseController
+
+    root = tmp_path / "runtime"
+    assignments = root / "assignments"
+    for assignment_id in ("a1", "c1", "c2", "w1"):
+        write_claim_assignment(root, assignment_id, "r1")
+    for assignment_id, state in (
+        ("c1", "completed"),
+        ("c2", "failed"),
+        ("w1", "waiting"),
+    ):
+        path = assignments / f"{assignment_id}.json"
+        value = json.loads(path.read_text(encoding="utf-8"))
+        value["lifecycle_state"] = state
+        path.write_text(json.dumps(value), encoding="utf-8")
+        os.utime(path, (1, 1))
+    (root / "leases" / "c2").mkdir(parents=True)
+    (root / "leases" / "c2" / "lease.json").write_text(
+        json.dumps(
+            {
+                "schema": "axis.external-development-supervisor.lease",
+                "schema_version": "1.0.0",
+                "lease_id": "c2",
+                "assignment_id": "c2",
+                "owner_run_id": "r1",
+                "fencing_token": "a" * 32,
+                "resources": ["repo:ghostspace/axis"],
+                "read_only": False,
+                "acquired_at_epoch": 1,
+                "heartbeat_at_epoch": 1,
+                "expires_at_epoch": 2**40,
+            }
+        ),
+        encoding="utf-8",
+    )
+    (root / "leases" / "stale-1-gone").mkdir()
+    (root / "leases" / "stale-1-gone" / "lease.json").write_text("{", encoding="utf-8")
+
+    index = AssignmentIndex(root)
+    assert [value["assignment_id"] for value in index.active()] == ["a1"]
+    assert index.refresh()["leases"]["c2"]["expires_at_epoch"] == 2**40
+    reads = []
+    validate = assignment_index.validate_assignment
+    monkeypatch.setattr(
+        assignment_index,
+        "validate_assignment",
+        lambda value, root: reads.append(value["assignment_id"])
+        or validate(value, root),
+    )
+    assert [value["assignment_id"] for value in index.active()] == ["a1"]
+    assert reads == ["a1"]
+    assert [lease["lease_id"] for lease in LeaseController(root).all()] == ["c2"]
+
+    (assignments / "bad.json").write_text("{", encoding="utf-8")
+    with pytest.raises(json.JSONDecodeError):
+        index.active()
+    errors = []
+    assert len(index.active(errors)) == 1
+    assert errors[0].startswith("invalid assignment record bad.json")
+    (assignments / "bad.json").unlink()
+
+    assert index.archive_terminal() == ["c1"]
+    assert (assignments / "archive" / "c1.json").exists()
+    assert assignments / "archive" / "c1.json" in assignment_paths(root)
+    assert "c1.json" not in index.refresh()["assignments"]
+    assert index.restore("c1")
+    assert (assignments / "c1.json").exists()
+
+
+def test_sqlite_state_store_backs_records_transactionally(
+    tmp_path: Path, monkeypatch
+):
+    import pytest
+
+    from axis_supervisor import state_store
+    from axis_supervisor.schema_registry import read_record, write_record
+
+    root = tmp_path / "runtime"
+    monkeypatch.setattr(state_store, "ROOT", root)
+    monkeypatch.setattr(state_store, "STATE_BACKEND", "sqlite")
+    monkeypatch.setattr(state_store, "_stores", {})
+    schema = "axis.external-development-supervisor.run"
+
+    def run(run_id: str, status: str) -> dict:
+        return {
+            "schema": schema,
+            "schema_version": "1.0.0",
+            "run_id": run_id,
+            "status": status,
+            "host": "test",
+            "started_at_epoch": 1_780_000_000,
+            "mode": "enabled",
+            "allow_repository_mutation": False,
+            "inventory_generation_id": None,
+            "model_calls_remaining": 2,
+        }
+
+    first = root / "runs" / "run-1.json"
+    second = root / "runs" / "run-2.json"
+    write_record(first, run("run-1", "started"), schema)
+    assert json.loads(first.read_text(encoding="utf-8"))["status"] == "started"
+
+    with pytest.raises(RuntimeError):
+        with state_store.record_transaction(root):
+            write_record(first, run("run-1", "completed"), schema)
+            write_record(second, run("run-2", "started"), schema)
+            assert read_record(first, schema)["status"] == "completed"
+            raise RuntimeError("abort generation")
+    assert read_record(first, schema)["status"] == "started"
+    assert not second.exists()
+
+    with state_store.record_transaction(root):
+        write_record(first, run("run-1", "completed"), schema)
+        write_record(second, run("run-2", "started"), schema)
+    store = state_store.open_store(root)
+    assert [value["run_id"] for value in store.query(schema, "started")] == ["run-2"]
+
+    def stored_body(path: Path) -> dict | None:
+        row = store._connection().execute(
+            "SELECT body FROM records WHERE path = ?",
+            (str(path.relative_to(root)),),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    # A JSON file edited outside the store wins over the stored row, but
+    # reading it never writes to the database.
+    first.write_text(json.dumps(run("run-1", "abandoned")), encoding="utf-8")
+    assert read_record(first, schema)["status"] == "abandoned"
+    assert stored_body(first)["status"] == "completed"
+    unstored = root / "runs" / "run-3.json"
+    unstored.write_text(json.dumps(run("run-3", "started")), encoding="utf-8")
+    assert read_record(unstored, schema)["run_id"] == "run-3"
+    assert stored_body(unstored) is None
+    unstored.unlink()
+    assert [value["run_id"] for value in store.query(schema, "started")] == ["run-2"]
+    # Even when it was edited into the queried state and never read since.
+    first.write_text(json.dumps(run("run-1", "started")), encoding="utf-8")
+    assert [value["run_id"] for value in store.query(schema, "started")] == [
+        "run-1",
+        "run-2",
+    ]
+    first.write_text(json.dumps(run("run-1", "abandoned")), encoding="utf-8")
+    assert [value["run_id"] for value in store.query(schema, "started")] == ["run-2"]
+
+    exported = tmp_path / "export"
+    assert store.export(exported) == 2
+    assert json.loads((exported / "runs" / "run-2.json").read_text()) == run(
+        "run-2", "started"
+    )
+    store.path.unlink()
+    for suffix in ("-wal", "-shm"):
+        store.path.with_name(store.path.name + suffix).unlink(missing_ok=True)
+    monkeypatch.setattr(state_store, "_stores", {})
+    rebuilt = state_store.open_store(root)
+    assert rebuilt.import_tree() == {"imported": 2, "skipped": []}
+    assert [value["status"] for value in rebuilt.query(schema)] == [
+        "abandoned",
+        "started",
+    ]
+
+
 def test_expired_lease_recovery(tmp_path: Path):
     root = tmp_path / "runtime"
     lease_dir = root / "leases" / "expired"
@@ -3612,9 +3924,10 @@ def test_concurrent_claims_are_serialized(tmp_path: Path):
     assert sorted(returncodes) == [0, 1]
 
 
-def test_slack_projection_updates_persistent_overview(tmp_path: Path):
+def test_slack_projection_updates_persistent_overview(tmp_path: Path, monkeypatch):
     import pytest
 
+    from axis_supervisor import slack_projection
     from axis_supervisor.observability import record_event
     from axis_supervisor.slack_projection import SlackProjection
     from axis_supervisor.verification import verification_for
@@ -3789,6 +4102,15 @@ def test_slack_projection_updates_persistent_overview(tmp_path: Path):
     second = projection.update(inventory, graph, control_value)
     assert second["updated"] is False
     assert second["ts"] == first["ts"]
+    # Every section matches the just-verified message: no dashboard API call.
+    assert [method for method, _ in calls] == ["auth.test", "conversations.open"]
+    cache = json.loads((tmp_path / "slack-dashboard-render-cache.json").read_text())
+    assert set(cache["sections"]) == {
+        block["text"]["text"] for block in blocks if block["type"] == "header"
+    }
+    calls.clear()
+    monkeypatch.setattr(slack_projection, "DASHBOARD_REVERIFY_SECONDS", 0)
+    projection.update(inventory, graph, control_value)
     assert [method for method, _ in calls] == [
         "auth.test",
         "conversations.open",
@@ -4100,3 +4422,166 @@ def test_supervisor_slack_plugin_registers_stable_decision_actions():
         REJECT_ACTION_ID,
         CONDITIONS_SUBMIT_ACTION_ID,
     ]
+
+
+def test_record_snapshots_are_shared_until_the_file_changes(
+    tmp_path: Path, monkeypatch
+):
+    import os
+
+    import pytest
+
+    from axis_supervisor import schema_registry
+    from axis_supervisor.mutation import MutationDenied, MutationGate, OperationClass
+    from axis_supervisor.schema_registry import read_snapshot
+
+    schema = "axis.external-development-supervisor.control"
+    path = tmp_path / "control.json"
+    path.write_text(json.dumps(control()), encoding="utf-8")
+    reads = []
+    read_record = schema_registry.read_record
+    monkeypatch.setattr(
+        schema_registry,
+        "read_record",
+        lambda record_path, expected: reads.append(record_path)
+        or read_record(record_path, expected),
+    )
+
+    first = read_snapshot(path, schema)
+    assert read_snapshot(path, schema) == first
+    gate = MutationGate(tmp_path, source="cycle")
+    gate.decide(OperationClass.RECONCILIATION)
+    assert reads == [path]
+
+    # An in-place edit keeps the inode but moves mtime and size.
+    stat = path.stat()
+    path.write_text(json.dumps(control(kill_switch=True)), encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert read_snapshot(path, schema)["kill_switch"] is True
+    with pytest.raises(MutationDenied):
+        gate.decide(OperationClass.MODEL_CALL, assignment={"assignment_id": "a"})
+
+    # An atomic replace of identical size and mtime still changes the inode.
+    stat = path.stat()
+    replacement = tmp_path / "control.json.tmp"
+    replacement.write_text(
+        json.dumps(control(kill_switch=False)).replace(
+            '"kill_switch": false', '"kill_switch":false'
+        ),
+        encoding="utf-8",
+    )
+    os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert replacement.stat().st_size == stat.st_size
+    replacement.replace(path)
+    assert read_snapshot(path, schema)["kill_switch"] is False
+    assert len(reads) == 3
+
+
+def test_record_snapshot_mutations_do_not_leak_into_later_reads(tmp_path: Path):
+    from axis_supervisor.schema_registry import read_snapshot
+
+    schema = "axis.external-development-supervisor.control"
+    path = tmp_path / "control.json"
+    path.write_text(json.dumps(control()), encoding="utf-8")
+    expected = control()
+    for _ in range(2):
+        value = read_snapshot(path, schema)
+        assert value == expected
+        value["kill_switch"] = True
+        value["repository_allowlist"].append("cdenneen/leaked")
+        value["owned_branch_prefixes"].clear()
+    assert read_snapshot(path, schema) == expected
+
+
+def test_projection_stages_rerun_only_when_declared_inputs_change(
+    tmp_path: Path, monkeypatch
+):
+    import axis_supervisor.cycle as cycle
+    from axis_supervisor import projection_pipeline
+    from axis_supervisor.schema_registry import read_record, write_record
+
+    matrix = tmp_path / "matrix.json"
+    matrix.write_text("{}", encoding="utf-8")
+    inventory = {"work_items": [{"ref": "ghostspace/axis#1"}]}
+    calls = []
+
+    def stages(pipeline):
+        convergence = pipeline.stage(
+            "convergence",
+            lambda: calls.append("convergence") or {"runtimes": []},
+            inputs=(inventory,),
+            files=(matrix,),
+        )
+        graph = pipeline.stage(
+            "graph", lambda: calls.append("graph") or {"nodes": []}, memoize=False
+        )
+        pipeline.stage(
+            "graduation",
+            lambda: calls.append("graduation") or {"capabilities": []},
+            inputs=(inventory, graph, convergence),
+        )
+
+    with projection_pipeline.cycle_scope() as pipeline:
+        assert projection_pipeline.current() is pipeline
+        stages(projection_pipeline.current())
+        stages(projection_pipeline.current())
+        assert calls == ["convergence", "graph", "graduation", "graph", "graduation"]
+        inventory["work_items"].append({"ref": "ghostspace/axis#2"})
+        matrix.write_text('{"capabilities": {}}', encoding="utf-8")
+        calls.clear()
+        stages(projection_pipeline.current())
+        assert calls == ["convergence", "graph", "graduation"]
+    assert projection_pipeline.current() is not pipeline
+    report = pipeline.report()
+    assert report["convergence"]["runs"] == 2 and report["convergence"]["reused"] == 1
+    assert report["graph"]["runs"] == 3 and report["graph"]["reused"] == 0
+
+    class Gate:
+        def __init__(self, *_args, **_kwargs):
+            pass
+
+        def decide(self, *_args, **_kwargs):
+            return None
+
+        def require(self, *_args, **_kwargs):
+            pass
+
+    run_path = tmp_path / "runs" / "run-1.json"
+    write_record(
+        run_path,
+        {
+            "schema": "axis.external-development-supervisor.run",
+            "schema_version": "1.0.0",
+            "run_id": "run-1",
+            "status": "started",
+            "host": "test-host",
+            "started_at_epoch": 1,
+            "mode": "enabled",
+            "allow_repository_mutation": False,
+            "inventory_generation_id": None,
+            "model_calls_remaining": 1,
+        },
+        "axis.external-development-supervisor.run",
+    )
+    monkeypatch.setattr(cycle, "ROOT", tmp_path)
+    monkeypatch.setattr(cycle, "MutationGate", Gate)
+    monkeypatch.setattr(
+        cycle.AccountingLedger, "record_worker_cycle", lambda *_args: None
+    )
+    monkeypatch.setattr(
+        cycle,
+        "run_next",
+        lambda *_args: stages(projection_pipeline.current())
+        or {"result": "no-assignment"},
+    )
+    monkeypatch.setattr(
+        cycle.ActiveMissionState, "observe", lambda *_args, **_kwargs: {}
+    )
+    monkeypatch.setattr(cycle, "mission_summary", lambda _mission: {})
+    monkeypatch.setattr(cycle, "record_event", lambda *_args, **_kwargs: None)
+
+    cycle.run_cycle("run-next", "run-1", "hermes", "supervisorctl")
+
+    settled = read_record(run_path, "axis.external-development-supervisor.run")
+    assert settled["projection_stages"]["graph"]["runs"] == 1
+    assert set(settled["projection_stages"]) == {"convergence", "graph", "graduation"}
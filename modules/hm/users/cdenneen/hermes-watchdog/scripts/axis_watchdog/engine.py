@@ -15,6 +15,7 @@ from .records import (
     atomic_write,
     load_object,
     load_optional,
+    load_outbox,
     parse_timestamp,
     timestamp,
 )
@@ -218,7 +219,6 @@ class Watchdog:
     def _outbox_health(
         self, control: dict[str, Any], now: int
     ) -> tuple[dict[str, Any], list[dict[str, Any]]]:
-        path = self.supervisor_root / "slack-outbox.json"
         metrics: dict[str, Any] = {
             "status": "healthy",
             "queued": 0,
@@ -228,7 +228,9 @@ class Watchdog:
             "permanent": 0,
             "oldest_pending_age_seconds": 0,
         }
-        if not path.exists():
+        try:
+            outbox = load_outbox(self.supervisor_root)
+        except FileNotFoundError:
             metrics["status"] = "missing"
             return metrics, [
                 self._anomaly(
@@ -238,8 +240,6 @@ class Watchdog:
                     1,
                 )
             ]
-        try:
-            outbox = load_object(path)
         except (OSError, json.JSONDecodeError, TypeError, ValueError) as exc:
             metrics["status"] = "corrupt"
             return metrics, [
@@ -1,12 +1,12 @@
 import hashlib
 import html
+import http.client
 import json
 import os
 import re
 import shlex
 import subprocess
 import time
-import urllib.request
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any
@@ -15,6 +15,8 @@ from .cutover import CutoverCoordinator
 from .records import atomic_write, load_optional, timestamp
 
 Api = Callable[[str, str, dict[str, Any]], dict[str, Any]]
+SLACK_RATE_LIMIT_RETRIES = 3
+_SLACK_CONNECTION: list[http.client.HTTPSConnection] = []
 
 
 def _fingerprint(text: str, blocks: list[dict[str, Any]]) -> str:
@@ -49,17 +51,52 @@ class SlackProjector:
         return values
 
     @staticmethod
-    def api(token: str, method: str, payload: dict[str, Any]) -> dict[str, Any]:
-        request = urllib.request.Request(
-            f"https://slack.com/api/{method}",
-            data=json.dumps(payload).encode("utf-8"),
-            headers={
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json; charset=utf-8",
-            },
-        )
-        with urllib.request.urlopen(request, timeout=30) as response:
-            value = json.load(response)
+    def _post(token: str, method: str, body: bytes) -> tuple[int, bytes, str]:
+        """POST over the process-wide keep-alive connection to slack.com."""
+        for attempt in range(2):
+            reused = bool(_SLACK_CONNECTION)
+            if not reused:
+                _SLACK_CONNECTION.append(
+                    http.client.HTTPSConnection("slack.com", timeout=30)
+                )
+            connection = _SLACK_CONNECTION[0]
+            try:
+                connection.request(
+                    "POST",
+                    f"/api/{method}",
+                    body,
+                    {
+                        "Authorization": f"Bearer {token}",
+                        "Content-Type": "application/json; charset=utf-8",
+                    },
+                )
+                response = connection.getresponse()
+                raw = response.read()
+            except Exception as exc:
+                _SLACK_CONNECTION.clear()
+                connection.close()
+                # Only a keep-alive connection Slack closed while idle is retried.
+                stale = isinstance(
+                    exc, (http.client.RemoteDisconnected, ConnectionResetError)
+                )
+                if stale and reused and not attempt:
+                    continue
+                raise
+            return response.status, raw, response.getheader("Retry-After") or ""
+        raise RuntimeError(f"Slack {method} failed: connection closed")
+
+    @classmethod
+    def api(cls, token: str, method: str, payload: dict[str, Any]) -> dict[str, Any]:
+        body = json.dumps(payload).encode("utf-8")
+        status, raw, retry_after = cls._post(token, method, body)
+        for _ in range(SLACK_RATE_LIMIT_RETRIES):
+            if status != 429:
+                break
+            time.sleep(float(retry_after or 1))
+            status, raw, retry_after = cls._post(token, method, body)
+        if status >= 400:
+            raise RuntimeError(f"Slack {method} failed: HTTP {status}")
+        value = json.loads(raw)
         if not isinstance(value, dict) or not value.get("ok"):
             raise RuntimeError(f"Slack {method} failed: {(value or {}).get('error')}")
         return value
@@ -6,6 +6,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+OUTBOX_STAGE_HISTORY_LIMIT = 100
+
 
 def timestamp(epoch: int) -> str:
     return datetime.fromtimestamp(epoch, timezone.utc).isoformat()
@@ -90,3 +92,58 @@ class Ledger:
                 raise ValueError(f"unsupported {self.path.name} line {number} schema")
             values.append(value)
         return values
+
+
+def apply_outbox_journal_entry(
+    notifications: dict[str, dict[str, Any]], entry: dict[str, Any]
+) -> None:
+    """Fold one supervisor outbox journal line into ``notifications``.
+
+    Mirrors the supervisor's replay: a transition already anywhere in the stage
+    history (same stage and timestamp) is skipped, and the history keeps only
+    the newest ``OUTBOX_STAGE_HISTORY_LIMIT`` transitions.
+    """
+    if "notification" in entry:
+        item = entry["notification"]
+        notifications[str(item.get("notification_id"))] = item
+        return
+    item = notifications.get(str(entry.get("notification_id")))
+    if item is None:
+        return
+    transition = {"stage": entry.get("stage"), "at": entry.get("at")}
+    history = item.setdefault("stage_history", [])
+    if transition in history:
+        return
+    history.append(transition)
+    item["stage_history"] = history[-OUTBOX_STAGE_HISTORY_LIMIT:]
+    item["current_stage"] = transition["stage"]
+    item.update(entry.get("fields") or {})
+
+
+def load_outbox(supervisor_root: Path) -> dict[str, Any]:
+    """Rebuild the supervisor Slack outbox from its snapshot and journal.
+
+    The supervisor appends queued notifications and stage transitions to
+    ``slack-outbox.journal.jsonl`` and only periodically compacts them into
+    ``slack-outbox.json``; both are read here so pending work is never stale.
+    """
+    snapshot_path = supervisor_root / "slack-outbox.json"
+    journal_path = supervisor_root / "slack-outbox.journal.jsonl"
+    if not snapshot_path.exists() and not journal_path.exists():
+        raise FileNotFoundError(snapshot_path)
+    outbox = load_object(snapshot_path) if snapshot_path.exists() else {}
+    notifications = {
+        str(item.get("notification_id") or index): item
+        for index, item in enumerate(outbox.get("notifications") or [])
+    }
+    if journal_path.exists():
+        lines = journal_path.read_text(encoding="utf-8").splitlines()
+        for number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if not isinstance(entry, dict):
+                raise TypeError(f"invalid {journal_path.name} line {number}")
+            apply_outbox_journal_entry(notifications, entry)
+    outbox["notifications"] = list(notifications.values())
+    return outbox
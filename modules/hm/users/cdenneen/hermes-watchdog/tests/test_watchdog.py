@@ -829,6 +829,114 @@ def test_outbox_health_covers_missing_corrupt_pending_failed_and_permanent(
         "slack-outbox-permanent-failure",
     }
 
+    journal = supervisor / "slack-outbox.journal.jsonl"
+    journal.write_text(
+        "".join(
+            json.dumps(entry) + "\n"
+            for entry in (
+                {
+                    "notification_id": f"n-{index}",
+                    "stage": "Slack_message_verified",
+                    "at": iso(now),
+                    "fields": {"last_error": None},
+                }
+                for index in range(len(stages))
+            )
+        )
+        + json.dumps(
+            {
+                "notification": {
+                    "notification_id": "n-new",
+                    "current_stage": "notification_queued",
+                    "attempts": 0,
+                    "stage_history": [
+                        {"stage": "notification_queued", "at": iso(now - 5)}
+                    ],
+                    "event": {"created_at_epoch": now - 5},
+                }
+            }
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    metrics, anomalies = watchdog._outbox_health(control, now)
+    assert metrics["queued"] == 1 and metrics["failed"] == metrics["permanent"] == 0
+    assert metrics["oldest_pending_age_seconds"] == 5
+    assert anomalies == []
+
+    journal.write_text("not-json\n", encoding="utf-8")
+    metrics, anomalies = watchdog._outbox_health(control, now)
+    assert metrics["status"] == "corrupt"
+
+
+def test_outbox_replay_matches_supervisor_after_interrupted_compaction(
+    tmp_path: Path,
+):
+    from axis_watchdog.records import apply_outbox_journal_entry, load_outbox
+
+    history = [
+        {"stage": "notification_queued", "at": iso(1_800_000_000 + index)}
+        for index in range(100)
+    ]
+    snapshot = {
+        "notifications": [
+            {
+                "notification_id": "n-1",
+                "current_stage": "delivery_failed",
+                "stage_history": history[:98]
+                + [
+                    {"stage": "notification_send_attempted", "at": history[98]["at"]},
+                    {"stage": "delivery_failed", "at": history[99]["at"]},
+                ],
+            }
+        ]
+    }
+    # The compaction that wrote the snapshot was interrupted before the journal
+    # holding its last two transitions was truncated.
+    entries = [
+        {
+            "notification_id": "n-1",
+            "stage": stage,
+            "at": history[index]["at"],
+            "fields": {},
+        }
+        for index, stage in (
+            (98, "notification_send_attempted"),
+            (99, "delivery_failed"),
+        )
+    ] + [
+        {
+            "notification_id": "n-1",
+            "stage": "Slack_message_verified",
+            "at": iso(1_800_000_200),
+            "fields": {"ts": "1.0"},
+        }
+    ]
+    (tmp_path / "slack-outbox.json").write_text(json.dumps(snapshot), encoding="utf-8")
+    (tmp_path / "slack-outbox.journal.jsonl").write_text(
+        "".join(json.dumps(entry) + "\n" for entry in entries), encoding="utf-8"
+    )
+    (item,) = load_outbox(tmp_path)["notifications"]
+    assert item["current_stage"] == "Slack_message_verified" and item["ts"] == "1.0"
+    assert len(item["stage_history"]) == 100
+    assert item["stage_history"][-3:] == [
+        {"stage": "notification_send_attempted", "at": history[98]["at"]},
+        {"stage": "delivery_failed", "at": history[99]["at"]},
+        {"stage": "Slack_message_verified", "at": iso(1_800_000_200)},
+    ]
+
+    sys.path.insert(0, str(SUPERVISOR_ROOT / "scripts"))
+    try:
+        from axis_supervisor.slack_outbox import apply_journal_entry
+    finally:
+        sys.path.remove(str(SUPERVISOR_ROOT / "scripts"))
+    watchdog_view = json.loads(json.dumps({"n-1": snapshot["notifications"][0]}))
+    supervisor_view = json.loads(json.dumps(watchdog_view))
+    for entry in entries:
+        apply_outbox_journal_entry(watchdog_view, json.loads(json.dumps(entry)))
+        apply_journal_entry(supervisor_view, json.loads(json.dumps(entry)))
+    assert watchdog_view == supervisor_view
+
 
 def test_historical_stuck_anomaly_recovery_and_expected_wait(tmp_path: Path):
     now = 1_800_000_000